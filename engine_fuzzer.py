@@ -0,0 +1,382 @@
+"""Differential fuzzer for the scheduling engines.
+
+The reference oracles are fcfs_scheduling and round_robin_scheduling from
+pg.py plus frozen copies of the original tick-based SJF, SRTF and Priority
+engines kept below, which pg.py has since replaced with event-driven ones.
+Every faster engine that claims to produce the same schedule is run on the
+same randomised and adversarial workloads (ties, zero arrival gaps, long
+idle gaps, bursts on quantum boundaries) and its Gantt chart and
+per-process metrics are compared with the reference.  The first mismatch is shrunk to
+a minimal workload and printed; the exit status is 1.
+
+    python engine_fuzzer.py [--iterations N] [--seed S] [--pair NAME] [--max-processes N]
+
+Workloads usually start after time 0, so the idle time before the first
+arrival is checked too.  Keep workloads small: the tick-based references
+step through every time unit and rescan all processes at each one.
+"""
+import argparse
+import math
+import random
+import sys
+
+import pg
+
+FCFS = "First Come First Serve, FCFS"
+SJF = "Shortest Job First, SJF (non-preemptive)"
+SRTF = "Shortest Remaining Time First, SRTF"
+RR = "Round-Robin, RR"
+PRIORITY = "Priority (non-preemptive)"
+PREEMPTIVE_PRIORITY = "Priority (preemptive)"
+
+
+def burst_key(proc):
+    return proc.burst_time
+
+
+def remaining_key(proc):
+    return proc.remaining_time
+
+
+def priority_key(proc):
+    return proc.priority
+
+
+# Frozen copy of the original non-preemptive SJF/Priority engine, which idles one time unit at a time
+def tick_nonpreemptive_scheduling(proc_list, key, context_switch=0):
+    proc_list.sort(key=lambda p: (p.arrival_time, key(p)))
+    time = 0
+    gantt_chart = []
+    completed = []
+    last_proc = None
+    while len(completed) < len(proc_list):
+        available_procs = [p for p in proc_list if p.arrival_time <= time and p not in completed]
+        if available_procs:
+            proc = min(available_procs, key=key)
+            if context_switch and last_proc is not None:
+                gantt_chart.append(("Switch", context_switch))
+                time += context_switch
+            last_proc = proc
+            proc.completion_time = time + proc.burst_time
+            proc.turnaround_time = proc.completion_time - proc.arrival_time
+            proc.waiting_time = proc.turnaround_time - proc.burst_time
+            if proc.response_time == -1:
+                proc.response_time = time - proc.arrival_time
+            gantt_chart.append((proc.name, proc.burst_time))
+            time = proc.completion_time
+            completed.append(proc)
+        else:
+            time += 1
+            gantt_chart.append(("Idle", 1))
+    return gantt_chart
+
+
+# Frozen copy of the original SRTF/preemptive Priority engine, which re-sorts the ready queue every time unit
+def tick_preemptive_scheduling(proc_list, key, context_switch=0):
+    time = 0
+    completed = 0
+    n = len(proc_list)
+    gantt_chart = []
+    proc_list.sort(key=lambda x: x.arrival_time)
+    ready_queue = []
+    prev_proc = None
+    last_proc = None
+    start_time = 0
+    while completed != n:
+        for proc in proc_list:
+            if proc.arrival_time <= time and proc not in ready_queue and proc.remaining_time > 0:
+                ready_queue.append(proc)
+        if ready_queue:
+            ready_queue.sort(key=key)
+            current_proc = ready_queue[0]
+            if current_proc != prev_proc:
+                if prev_proc is not None and time > 0:
+                    gantt_chart.append((prev_proc.name, time - start_time))
+                if context_switch and last_proc is not None and last_proc != current_proc:
+                    gantt_chart.append(("Switch", context_switch))
+                    time += context_switch
+                start_time = time
+                prev_proc = current_proc
+                last_proc = current_proc
+            if current_proc.response_time == -1:
+                current_proc.response_time = time - current_proc.arrival_time
+            current_proc.remaining_time -= 1
+            time += 1
+            if current_proc.remaining_time == 0:
+                current_proc.completion_time = time
+                current_proc.turnaround_time = current_proc.completion_time - current_proc.arrival_time
+                current_proc.waiting_time = current_proc.turnaround_time - current_proc.burst_time
+                ready_queue.remove(current_proc)
+                completed += 1
+        else:
+            if prev_proc is not None and time > 0:
+                gantt_chart.append((prev_proc.name, time - start_time))
+                prev_proc = None
+            gantt_chart.append(("Idle", 1))
+            time += 1
+    if prev_proc is not None:
+        gantt_chart.append((prev_proc.name, time - start_time))
+    return gantt_chart
+
+
+REFERENCE_ENGINES = {
+    FCFS: lambda procs, quantum, cs: pg.fcfs_scheduling(procs, cs),
+    SJF: lambda procs, quantum, cs: tick_nonpreemptive_scheduling(procs, burst_key, cs),
+    SRTF: lambda procs, quantum, cs: tick_preemptive_scheduling(procs, remaining_key, cs),
+    RR: lambda procs, quantum, cs: pg.round_robin_scheduling(procs, quantum, cs),
+    PRIORITY: lambda procs, quantum, cs: tick_nonpreemptive_scheduling(procs, priority_key, cs),
+    PREEMPTIVE_PRIORITY: lambda procs, quantum, cs: tick_preemptive_scheduling(procs, priority_key, cs),
+}
+
+# Aggregates RunSummary.metrics() shares with compute_run_metrics()
+SUMMARY_METRICS = ("avg_turnaround", "avg_waiting", "avg_response", "cpu_utilization",
+                   "throughput", "makespan", "context_switches")
+
+
+class RecordingSummary(pg.RunSummary):
+    """RunSummary that also keeps the segments, to compare them as a Gantt chart."""
+    def __init__(self):
+        super().__init__()
+        self.gantt_chart = []
+
+    def add_segment(self, start, proc_name, duration):
+        super().add_segment(start, proc_name, duration)
+        self.gantt_chart.append((proc_name, duration))
+
+
+def run_summary(algorithm):
+    def run(procs, quantum, cs):
+        summary = RecordingSummary()
+        pg.summary_scheduling(sorted(procs, key=lambda p: p.arrival_time), algorithm, quantum, cs, summary)
+        return summary.gantt_chart, summary.metrics()
+    return run
+
+
+def run_sharded(algorithm):
+    # batch=1 splits even these small workloads at every idle gap
+    def run(procs, quantum, cs):
+        return pg.sharded_scheduling(procs, algorithm, quantum, workers=1, batch=1), None
+    return run
+
+
+def run_event(engine, key):
+    def run(procs, quantum, cs):
+        return engine(procs, key, cs), None
+    return run
+
+
+def run_aging(preemptive):
+    def run(procs, quantum, cs):
+        return pg.aging_priority_scheduling(procs, None, preemptive, cs), None
+    return run
+
+
+# name: (reference algorithm, candidate engine, supports context switches)
+# A candidate returns its Gantt chart and, if it has them, RunSummary-style metrics
+ENGINE_PAIRS = {
+    "event-sjf": (SJF, run_event(pg.nonpreemptive_scheduling, burst_key), True),
+    "event-priority": (PRIORITY, run_event(pg.nonpreemptive_scheduling, priority_key), True),
+    "event-srtf": (SRTF, run_event(pg.preemptive_scheduling, remaining_key), True),
+    "event-preemptive-priority": (PREEMPTIVE_PRIORITY, run_event(pg.preemptive_scheduling, priority_key), True),
+    "aging-priority": (PRIORITY, run_aging(False), True),
+    "aging-preemptive-priority": (PREEMPTIVE_PRIORITY, run_aging(True), True),
+}
+for short, algorithm in (("fcfs", FCFS), ("sjf", SJF), ("srtf", SRTF), ("rr", RR),
+                         ("priority", PRIORITY), ("preemptive-priority", PREEMPTIVE_PRIORITY)):
+    ENGINE_PAIRS[f"summary-{short}"] = (algorithm, run_summary(algorithm), True)
+    ENGINE_PAIRS[f"sharded-{short}"] = (algorithm, run_sharded(algorithm), False)
+
+
+# A case is (rows, quantum, context_switch) with rows of (arrival, burst, priority)
+def random_case(rng, n):
+    return [(rng.randint(0, 3 * n), rng.randint(1, 10), rng.randint(1, 5)) for _ in range(n)]
+
+
+def tie_case(rng, n):
+    arrivals = [rng.randint(0, 6) for _ in range(2)]
+    return [(rng.choice(arrivals), rng.choice((2, 3)), rng.choice((1, 2))) for _ in range(n)]
+
+
+def zero_gap_case(rng, n):
+    rows = []
+    arrival = 0
+    for _ in range(n):
+        if rng.random() < 0.3:
+            arrival += rng.randint(1, 4)
+        rows.append((arrival, rng.randint(1, 6), rng.randint(1, 4)))
+    return rows
+
+
+def long_idle_case(rng, n):
+    rows = []
+    arrival = 0
+    for _ in range(n):
+        arrival += rng.choice((0, 1, 2, rng.randint(20, 200)))
+        rows.append((arrival, rng.randint(1, 8), rng.randint(1, 4)))
+    rng.shuffle(rows)
+    return rows
+
+
+def quantum_edge_case(rng, n, quantum):
+    return [(quantum * rng.randint(0, n), max(1, quantum * rng.randint(1, 3) + rng.choice((-1, 0, 1))),
+             rng.randint(1, 3)) for _ in range(n)]
+
+
+WORKLOAD_KINDS = ("random", "ties", "zero-gaps", "long-idles", "quantum-edges")
+
+
+def generate_case(rng, kind, max_processes, context_switch):
+    n = rng.randint(1, max_processes)
+    quantum = rng.randint(1, 5)
+    if kind == "random":
+        rows = random_case(rng, n)
+    elif kind == "ties":
+        rows = tie_case(rng, n)
+    elif kind == "zero-gaps":
+        rows = zero_gap_case(rng, n)
+    elif kind == "long-idles":
+        rows = long_idle_case(rng, n)
+    else:
+        rows = quantum_edge_case(rng, n, quantum)
+    # Most workloads start late, so the CPU idles before the first arrival
+    start = rng.choice((0, 1, quantum, rng.randint(2, 50)))
+    rows = [(arrival + start, burst, priority) for arrival, burst, priority in rows]
+    return rows, quantum, rng.choice((0, 1, 2)) if context_switch else 0
+
+
+def build_processes(rows):
+    return [pg.Process(pg.process_name(i), arrival, burst, priority, pid=i)
+            for i, (arrival, burst, priority) in enumerate(rows)]
+
+
+# Merges adjacent segments of the same name, which engines may split differently
+def normalise_gantt(gantt_chart):
+    merged = []
+    for name, duration in gantt_chart:
+        if duration == 0:
+            continue
+        if merged and merged[-1][0] == name:
+            merged[-1] = (name, merged[-1][1] + duration)
+        else:
+            merged.append((name, duration))
+    return merged
+
+
+def process_results(procs):
+    return {p.name: (p.completion_time, p.turnaround_time, p.waiting_time, p.response_time) for p in procs}
+
+
+# Function to compare one engine pair on one case; returns a description of the mismatch or None
+def check_case(pair, case):
+    algorithm, candidate, _ = ENGINE_PAIRS[pair]
+    rows, quantum, context_switch = case
+    reference_procs = build_processes(rows)
+    reference_gantt = REFERENCE_ENGINES[algorithm](reference_procs, quantum, context_switch)
+    candidate_procs = build_processes(rows)
+    try:
+        candidate_gantt, metrics = candidate(candidate_procs, quantum, context_switch)
+    except Exception as error:
+        return f"candidate raised {type(error).__name__}: {error}"
+
+    expected, actual = normalise_gantt(reference_gantt), normalise_gantt(candidate_gantt)
+    if expected != actual:
+        at = next((i for i, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+        return (f"Gantt charts differ at segment {at}:\n"
+                f"  reference {expected[max(0, at - 2):at + 3]}\n  candidate {actual[max(0, at - 2):at + 3]}")
+    wanted = process_results(reference_procs)
+    got = process_results(candidate_procs)
+    for name in wanted:
+        if wanted[name] != got.get(name):
+            return (f"{name} differs (completion, turnaround, waiting, response):\n"
+                    f"  reference {wanted[name]}\n  candidate {got.get(name)}")
+    if metrics is not None:
+        wanted = pg.compute_run_metrics(reference_procs, reference_gantt)
+        if metrics["completed"] != len(rows):
+            return f"candidate completed {metrics['completed']} of {len(rows)} processes"
+        pairs = [(key, wanted[key], metrics[key]) for key in SUMMARY_METRICS]
+        pairs += [(f"{metric} {label}", value, metrics["percentiles"][metric][label])
+                  for metric, values in wanted["percentiles"].items() for label, value in values.items()]
+        for key, expected_value, value in pairs:
+            if not math.isclose(expected_value, value, rel_tol=1e-9, abs_tol=1e-9):
+                return f"{key} differs: reference {expected_value}, candidate {value}"
+    return None
+
+
+# Helper function to list smaller variants of a case, most aggressive first
+def shrink_candidates(case):
+    rows, quantum, context_switch = case
+    # Drop chunks of processes, halving the chunk size (ddmin-style)
+    chunk = len(rows) // 2
+    while chunk >= 1:
+        for start in range(0, len(rows), chunk):
+            smaller = rows[:start] + rows[start + chunk:]
+            if smaller:
+                yield smaller, quantum, context_switch
+        chunk //= 2
+    if context_switch:
+        yield rows, quantum, 0
+    if quantum > 1:
+        yield rows, 1, context_switch
+        yield rows, quantum - 1, context_switch
+    # Then make single values smaller
+    floors = (0, 1, 1)
+    for i, row in enumerate(rows):
+        for field, floor in enumerate(floors):
+            value = row[field]
+            for smaller in sorted({floor, value // 2, value - 1}):
+                if floor <= smaller < value:
+                    changed = list(row)
+                    changed[field] = smaller
+                    yield rows[:i] + [tuple(changed)] + rows[i + 1:], quantum, context_switch
+
+
+# Function to shrink a failing case until no smaller variant still fails
+def minimise_case(pair, case):
+    failure = check_case(pair, case)
+    progress = True
+    while progress:
+        progress = False
+        for smaller in shrink_candidates(case):
+            result = check_case(pair, smaller)
+            if result is not None:
+                case, failure = smaller, result
+                progress = True
+                break
+    return case, failure
+
+
+def report(pair, kind, seed, iteration, case, failure):
+    rows, quantum, context_switch = case
+    algorithm = ENGINE_PAIRS[pair][0]
+    print(f"Mismatch in {pair} (reference: {algorithm}), {kind} workload, seed {seed}, iteration {iteration}")
+    print(f"Minimal workload: quantum {quantum}, context switch {context_switch}")
+    print("  name  arrival  burst  priority")
+    for i, (arrival, burst, priority) in enumerate(rows):
+        print(f"  {pg.process_name(i):<5} {arrival:>7} {burst:>6} {priority:>9}")
+    print(failure)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the optimised scheduling engines with the reference ones.")
+    parser.add_argument("--iterations", type=int, default=200, help="cases per engine pair")
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--pair", action="append", choices=sorted(ENGINE_PAIRS),
+                        help="engine pair to fuzz (repeatable; all by default)")
+    parser.add_argument("--max-processes", type=int, default=12)
+    args = parser.parse_args(argv)
+
+    for pair in args.pair or ENGINE_PAIRS:
+        context_switch = ENGINE_PAIRS[pair][2]
+        for iteration in range(args.iterations):
+            rng = random.Random(f"{args.seed}:{pair}:{iteration}")
+            kind = WORKLOAD_KINDS[iteration % len(WORKLOAD_KINDS)]
+            case = generate_case(rng, kind, args.max_processes, context_switch)
+            if check_case(pair, case) is not None:
+                report(pair, kind, args.seed, iteration, *minimise_case(pair, case))
+                return 1
+        print(f"{pair}: {args.iterations} cases agree")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,33 @@
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from copy import deepcopy
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from array import array
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from http import HTTPStatus
+from itertools import accumulate, groupby, islice, repeat
+import asyncio
+import base64
+import bisect
+import colorsys
+import hashlib
+import html
+import heapq
+import io
+import json
 import random
 import math
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+import zlib
+from time import monotonic
 
 # Set appearance mode and default color theme
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
@@ -15,9 +39,29 @@ priority_label = None
 priority_entry = None
 time_quantum_label = None
 time_quantum_entry = None
+deadline_label = None
+deadline_entry = None
+period_label = None
+period_entry = None
+tickets_label = None
+tickets_entry = None
+seed_label = None
+seed_entry = None
+aging_label = None
+aging_entry = None
+history_checkbox = None
+optional_section = None  # Parent of the optional fields, which are built on first use
+help_window = None  # Built on first use, then hidden and reused
+replay_window = None  # Timeline replay of the run on the results screen
+table_style_mode = None  # Appearance mode the Treeview style was configured for
 processes = []  # Define processes globally
+time_scale = 1  # Engine time units per unit the times were typed in (10 ** time_decimals)
+time_decimals = 0
 results_frame = None  # For managing results display
 
+# Times may be typed with up to this many decimal places (microseconds)
+TIME_MAX_DECIMALS = 6
+
 # Modern color palette
 COLORS = {
     'primary': '#2563EB',
@@ -29,34 +73,195 @@ COLORS = {
     'warning': '#D97706',
     'light': '#F3F4F6',
     'dark': '#1F2937',
-    'process_colors': ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD', '#98D8C8', '#F7DC6F']
+    'switch': '#8E44AD'
 }
 
 # Process class to store process data
 class Process:
-    def __init__(self, name, arrival_time, burst_time, priority=None):
+    def __init__(self, name, arrival_time, burst_time, priority=None, deadline=None, period=None, tickets=None, bursts=None, pid=None):
+        self.pid = pid  # Integer id; name is the (interned) display name the engines work with
         self.name = name
         self.arrival_time = arrival_time
         self.burst_time = burst_time
+        # Alternating CPU and I/O bursts (CPU, I/O, CPU, ...); a plain job is a single CPU burst
+        self.bursts = bursts if bursts is not None else [burst_time]
+        self.io_time = sum(self.bursts[1::2])
+        self.io_wait_time = 0  # Time spent blocked waiting for the I/O device
         self.remaining_time = burst_time  # For preemptive algorithms
         self.priority = priority
+        self.deadline = deadline  # Relative to each job's release time
+        self.period = period  # None for a one-shot (aperiodic) process
+        self.tickets = tickets  # CPU share for lottery/stride scheduling
         self.completion_time = 0
         self.turnaround_time = 0
         self.waiting_time = 0
         self.response_time = -1  # -1 indicates not yet responded
+        # Real-time bookkeeping, filled in by the EDF/RMS engines
+        self.jobs_completed = 0
+        self.deadline_misses = 0
+        self.lateness_counts = None  # Counter of job lateness values
+
+# Helper function to turn a process id into its display name
+def process_name(pid):
+    """Return the interned name of process id pid: A-Z, then AA, AB, ... like spreadsheet columns."""
+    letters = []
+    pid += 1
+    while pid:
+        pid, letter = divmod(pid - 1, 26)
+        letters.append(chr(65 + letter))
+    return sys.intern("".join(reversed(letters)))
+
+# Helper function to give a process a color that depends only on its name
+@lru_cache(maxsize=1 << 16)
+def process_color(name):
+    """Return a "#rrggbb" color hashed from name, dark enough for white labels."""
+    digest = zlib.crc32(str(name).encode())
+    hue = (digest & 0xFFFF) / 0x10000
+    saturation = 0.55 + ((digest >> 16) & 0xFF) / 255 * 0.3
+    lightness = 0.4 + ((digest >> 24) & 0xFF) / 255 * 0.15
+    return '#%02x%02x%02x' % tuple(round(c * 255) for c in colorsys.hls_to_rgb(hue, lightness, saturation))
+
+# Helper function to parse an optional integer input field
+def parse_optional_int(data, label, default=None, minimum=None):
+    if not data:
+        return default
+    try:
+        value = int(data)
+    except ValueError:
+        raise ValueError(f"{label} must be a valid integer.")
+    if minimum is not None and value < minimum:
+        raise ValueError(f"{label} must be a {'positive' if minimum > 0 else 'non-negative'} integer.")
+    return value
+
+# Helper function to find how many decimal places a set of typed times needs
+def time_resolution(tokens):
+    """Return the decimal places needed to hold every token exactly as an integer.
+
+    The engines only see integers: a workload whose times have d decimal
+    places is scaled by 10 ** d, and times are converted back for display.
+    """
+    decimals = 0
+    for token in tokens:
+        try:
+            value = Decimal(token.strip())
+        except InvalidOperation:
+            raise ValueError(f"'{token.strip()}' is not a valid number.")
+        if not value.is_finite():
+            raise ValueError(f"'{token.strip()}' is not a valid number.")
+        decimals = max(decimals, -value.normalize().as_tuple().exponent)
+    if decimals > TIME_MAX_DECIMALS:
+        raise ValueError(f"Times can have at most {TIME_MAX_DECIMALS} decimal places.")
+    return decimals
+
+# Helper function to convert a typed time into integer engine units
+def parse_time(token, scale):
+    value = Decimal(token.strip()) * scale
+    if value != value.to_integral_value():
+        raise ValueError(f"'{token.strip()}' has more decimal places than the workload's resolution.")
+    return int(value)
+
+# Helper function to parse an optional time input field into engine units
+def parse_optional_time(data, label, scale, default=None, minimum=None):
+    if not data:
+        return default
+    try:
+        value = parse_time(data, scale)
+    except (InvalidOperation, ValueError):
+        raise ValueError(f"{label} must be a valid number.")
+    if minimum is not None and value < minimum:
+        raise ValueError(f"{label} must be a {'positive' if minimum > 0 else 'non-negative'} number.")
+    return value
+
+# Function to set the resolution results are displayed in
+def set_time_resolution(decimals):
+    global time_scale, time_decimals
+    time_decimals = decimals
+    time_scale = 10 ** decimals
+
+# Helper function to show a time given in engine units in the units it was typed in
+def format_time(value, extra_digits=0):
+    """Return value (engine units) as plain decimal text; extra_digits adds decimals for averages."""
+    if extra_digits:
+        return f"{value / time_scale:.{time_decimals + extra_digits}f}"
+    if isinstance(value, int) or value.is_integer():
+        # Exact at any magnitude: 1000000 never becomes 1e+06
+        text = format(Decimal(int(value)).scaleb(-time_decimals), "f")
+    else:
+        # Positions between engine units, such as zoomed-in axis ticks
+        text = f"{value / time_scale:.{time_decimals + TIME_MAX_DECIMALS}f}"
+    return text.rstrip("0").rstrip(".") if "." in text else text
 
 # Function to process the input
-def process_input(arrival_times_data, burst_times_data, priority_data, time_quantum_data, algorithm):
+def process_input(arrival_times_data, burst_times_data, priority_data, time_quantum_data, algorithm, context_switch_data="", deadline_data="", period_data="", tickets_data="", seed_data="", aging_data="", trace_path=None, record_history=False):
     global processes
 
     # Validate the input fields
-    if not arrival_times_data or not burst_times_data:
+    if trace_path is None and (not arrival_times_data or not burst_times_data):
         show_error_dialog("Input Error", "Please fill in all required fields (Arrival and Burst Times).")
         return
 
+    # Times may have decimals: the whole workload gets one fixed-point resolution, so the engines
+    # still run on integers (a burst of 2.5 with one decimal place is 25 engine units)
+    settings = [data for data in (time_quantum_data, context_switch_data, aging_data) if data]
+    tokens = list(settings)
+    if trace_path is None:
+        tokens += arrival_times_data.split(',')
+        tokens += [token for entry in burst_times_data.split(',') for token in entry.split('/')]
+        tokens += [token for data in (deadline_data, period_data) if data for token in data.split(',')]
+
+    # Process Time Quantum, Context Switch Overhead, Aging Interval and Random Seed if applicable
+    try:
+        decimals = time_resolution(tokens)
+        if trace_path is not None and decimals:
+            raise ValueError("Trace files hold integer times, so the time settings must be integers too.")
+        scale = 10 ** decimals
+        time_quantum = parse_optional_time(time_quantum_data, "Time quantum", scale, None, 1)
+        context_switch = parse_optional_time(context_switch_data, "Context switch time", scale, 0, 0)
+        aging_interval = parse_optional_time(aging_data, "Aging interval", scale, None, 1)
+        seed = parse_optional_int(seed_data, "Random seed", 0)
+    except ValueError as e:
+        show_error_dialog("Input Error", str(e))
+        return
+
+    # A binary trace file provides the process data directly
+    if trace_path is not None:
+        set_time_resolution(0)
+        try:
+            with TraceFile(trace_path) as trace:
+                trace.validate()
+                if "priority" in get_scheduler(algorithm).required and trace.priorities is None:
+                    show_error_dialog("Input Error", f"Please provide Priorities for {algorithm}: this trace has none.")
+                    return
+                # Long traces stream through summary-only mode instead of becoming a list of processes
+                if trace.count > TRACE_SUMMARY_PROCESSES and summary_trace_supported(trace, algorithm, aging_interval):
+                    try:
+                        summary = summary_scheduling(trace.iter_processes(), algorithm, time_quantum, context_switch,
+                                                     RunSummary(Telemetry()))
+                    except ValueError as e:
+                        show_error_dialog("Input Error", str(e))
+                        return
+                    except Exception as e:
+                        show_error_dialog("Simulation Error", f"An error occurred during simulation: {str(e)}")
+                        return
+                    if record_history:
+                        options = dict(time_quantum=time_quantum, context_switch=context_switch, seed=seed,
+                                       aging_interval=aging_interval)
+                        record_run(metrics_history_row(summary.metrics(), summary.completed, algorithm, options,
+                                                       trace_workload_hash(trace)))
+                    show_summary_results(summary, algorithm)
+                    return
+                processes = trace.to_processes()
+        except (OSError, ValueError) as e:
+            show_error_dialog("Trace Error", f"Could not read trace file: {str(e)}")
+            return
+        run_and_show(processes, algorithm, time_quantum, context_switch, seed, aging_interval, record_history)
+        return
+
     try:
-        arrival_times = list(map(int, arrival_times_data.split(',')))
-        burst_times = list(map(int, burst_times_data.split(',')))
+        arrival_times = [parse_time(token, scale) for token in arrival_times_data.split(',')]
+        # Each burst entry is either a CPU time or CPU/I-O/CPU/... alternating bursts
+        burst_sequences = [[parse_time(token, scale) for token in entry.split('/')] for entry in burst_times_data.split(',')]
+        burst_times = [sum(sequence[0::2]) for sequence in burst_sequences]
         
         # Validate that lists have the same length
         if len(arrival_times) != len(burst_times):
@@ -64,9 +269,18 @@ def process_input(arrival_times_data, burst_times_data, priority_data, time_quan
             return
         
         # Validate positive values
-        if any(x < 0 for x in arrival_times) or any(x <= 0 for x in burst_times):
+        if any(x < 0 for x in arrival_times) or any(x <= 0 for sequence in burst_sequences for x in sequence):
             show_error_dialog("Input Error", "Arrival times must be non-negative and burst times must be positive.")
             return
+
+        # Validate CPU/I-O burst sequences
+        has_io = any(len(sequence) > 1 for sequence in burst_sequences)
+        if any(len(sequence) % 2 == 0 for sequence in burst_sequences):
+            show_error_dialog("Input Error", "Burst sequences must start and end with a CPU burst (e.g., 5/3/2).")
+            return
+        if has_io and "io_bursts" not in get_scheduler(algorithm).capabilities:
+            show_error_dialog("Input Error", "CPU/I-O burst sequences (e.g., 5/3/2) need the CPU/I-O Bursts algorithm.")
+            return
             
         priorities = []
 
@@ -84,55 +298,106 @@ def process_input(arrival_times_data, burst_times_data, priority_data, time_quan
                 show_error_dialog("Input Error", "Priorities must be valid integers.")
                 return
 
-        # Process Time Quantum if applicable
-        time_quantum = None
-        if time_quantum_data:
-            try:
-                time_quantum = int(time_quantum_data)
-                if time_quantum <= 0:
-                    show_error_dialog("Input Error", "Time quantum must be a positive integer.")
+        # Process Deadlines, Periods and Tickets if applicable
+        deadlines = []
+        periods = []
+        tickets = []
+        for label, data, values, parse in (("deadlines", deadline_data, deadlines, lambda token: parse_time(token, scale)),
+                                           ("periods", period_data, periods, lambda token: parse_time(token, scale)),
+                                           ("tickets", tickets_data, tickets, int)):
+            if data:
+                try:
+                    values.extend(map(parse, data.split(',')))
+                except ValueError:
+                    show_error_dialog("Input Error", f"The {label} must be valid {'integers' if parse is int else 'numbers'}.")
+                    return
+                if len(values) != len(arrival_times):
+                    show_error_dialog("Input Error", f"Number of {label} must match the number of processes.")
+                    return
+                if any(x <= 0 for x in values):
+                    show_error_dialog("Input Error", f"The {label} must be positive {'integers' if parse is int else 'numbers'}.")
                     return
-            except ValueError:
-                show_error_dialog("Input Error", "Time quantum must be a valid integer.")
-                return
 
     except ValueError:
-        show_error_dialog("Input Error", "Please enter valid integers separated by commas.")
+        show_error_dialog("Input Error", "Please enter valid numbers separated by commas.")
         return
 
-    # Assign Process Names
-    process_names = [chr(65 + i) for i in range(len(arrival_times))]
-
-    # Populate processes list
+    # Populate processes list (ids follow the input order)
     processes = [
-        Process(name=process_names[i], arrival_time=arrival_times[i], burst_time=burst_times[i],
-                priority=priorities[i] if priorities else None)
+        Process(name=process_name(i), pid=i, arrival_time=arrival_times[i], burst_time=burst_times[i],
+                priority=priorities[i] if priorities else None,
+                deadline=deadlines[i] if deadlines else None,
+                period=periods[i] if periods else None,
+                tickets=tickets[i] if tickets else None,
+                bursts=burst_sequences[i])
         for i in range(len(arrival_times))
     ]
 
-    # Call the selected algorithm function
+    set_time_resolution(decimals)
+    run_and_show(processes, algorithm, time_quantum, context_switch, seed, aging_interval, record_history)
+
+# Function to run the selected algorithm and display its results
+def run_and_show(proc_list, algorithm, time_quantum=None, context_switch=0, seed=0, aging_interval=None, record_history=False):
+    workload = workload_hash(proc_list, time_scale) if record_history else None
+    # Long preemptive runs snapshot themselves, so an interrupted run can pick up where it stopped
+    checkpoint_path = None
+    if algorithm in SCHEDULERS and "checkpoint" in SCHEDULERS[algorithm].capabilities and not aging_interval:
+        try:
+            checkpoint_path = checkpoint_file(proc_list, algorithm, context_switch, time_scale)
+        except OSError:
+            pass  # Runs without snapshots when the home directory is not writable
+        if checkpoint_path is not None and os.path.exists(checkpoint_path) and not messagebox.askyesno(
+                "Resume Run", "This workload's last run was interrupted. Resume it from its latest snapshot?"):
+            os.remove(checkpoint_path)
     try:
-        if algorithm == "First Come First Serve, FCFS":
-            gantt_chart = fcfs_scheduling(processes)
-        elif algorithm == "Shortest Job First, SJF (non-preemptive)":
-            gantt_chart = sjf_scheduling(processes)
-        elif algorithm == "Shortest Remaining Time First, SRTF":
-            gantt_chart = srtf_scheduling(processes)
-        elif algorithm == "Round-Robin, RR":
-            if time_quantum is None:
-                show_error_dialog("Input Error", "Please provide a valid Time Quantum for Round-Robin scheduling.")
-                return
-            gantt_chart = round_robin_scheduling(processes, time_quantum)
-        elif algorithm == "Priority (non-preemptive)":
-            gantt_chart = priority_scheduling(processes)
-        elif algorithm == "Priority (preemptive)":
-            gantt_chart = preemptive_priority_scheduling(processes)
-
-        # Display results in a new window
-        show_results(processes, gantt_chart, algorithm)
-        
+        gantt_chart = run_algorithm(proc_list, algorithm, time_quantum, context_switch, seed, aging_interval, checkpoint_path)
+    except ValueError as e:
+        show_error_dialog("Input Error", str(e))
+        return
     except Exception as e:
         show_error_dialog("Simulation Error", f"An error occurred during simulation: {str(e)}")
+        return
+
+    # Record the run in the history database if requested
+    if record_history:
+        options = dict(time_quantum=time_quantum, context_switch=context_switch, seed=seed, aging_interval=aging_interval)
+        record_run(history_row(proc_list, gantt_chart, algorithm, options, workload, time_scale))
+
+    # Display results in a new window
+    show_results(proc_list, gantt_chart, algorithm)
+
+# Helper function to add one run to the history database, reporting failures in a dialog
+def record_run(row):
+    try:
+        history = RunHistory()
+        history.record([row])
+        history.close()
+    except sqlite3.Error as e:
+        show_error_dialog("History Error", f"Could not record the run: {str(e)}")
+
+# Function to call the selected algorithm function
+def run_algorithm(proc_list, algorithm, time_quantum=None, context_switch=0, seed=0, aging_interval=None, checkpoint_path=None):
+    """Run one algorithm by its dropdown name and return the Gantt chart.
+
+    The algorithm is looked up in the scheduler registry (loading its plugin
+    on first use).  checkpoint_path enables periodic snapshots (and
+    resuming from them) for algorithms with the "checkpoint" capability.
+    Workloads over SHARD_MIN_PROCESSES without context-switch cost go
+    through sharded_scheduling for algorithms with "busy_periods"; those
+    runs are fast and only take snapshots when they cannot be split.
+    Raises ValueError when an input the algorithm needs is missing.
+    """
+    scheduler = get_scheduler(algorithm)
+    if "quantum" in scheduler.required and time_quantum is None:
+        raise ValueError(f"Please provide a valid Time Quantum for {algorithm}.")
+    if "priority" in scheduler.required and any(proc.priority is None for proc in proc_list):
+        raise ValueError(f"Please provide Priorities for {algorithm}.")
+    # Long workloads split into independent busy periods when the algorithm allows it
+    if "busy_periods" in scheduler.capabilities and not context_switch and len(proc_list) > SHARD_MIN_PROCESSES:
+        return sharded_scheduling(proc_list, algorithm, time_quantum, seed, aging_interval, checkpoint_path=checkpoint_path)
+    options = dict(time_quantum=time_quantum, context_switch=context_switch, seed=seed,
+                   aging_interval=aging_interval, checkpoint_path=checkpoint_path)
+    return scheduler.run(proc_list, options)
 
 # Function to show enhanced error dialog
 def show_error_dialog(title, message):
@@ -168,31 +433,162 @@ def show_error_dialog(title, message):
     )
     ok_button.pack(pady=10)
 
+# Helper function to read an entry that may not have been built yet
+def entry_text(entry):
+    return entry.get() if entry is not None else ""
+
 # Algorithm selection function
 def algorithm_selected(algorithm):
-    if "Priority" in algorithm:
-        priority_label.grid(row=3, column=0, padx=20, pady=10, sticky="w")
-        priority_entry.grid(row=3, column=1, padx=20, pady=10, sticky="ew")
-        time_quantum_label.grid_forget()
-        time_quantum_entry.grid_forget()
-    elif algorithm == "Round-Robin, RR":
-        priority_label.grid_forget()
-        priority_entry.grid_forget()
-        time_quantum_label.grid(row=3, column=0, padx=20, pady=10, sticky="w")
-        time_quantum_entry.grid(row=3, column=1, padx=20, pady=10, sticky="ew")
-    else:
-        priority_label.grid_forget()
-        priority_entry.grid_forget()
-        time_quantum_label.grid_forget()
-        time_quantum_entry.grid_forget()
+    # Hide every optional field, then show the ones the algorithm needs
+    ensure_optional_fields()
+    for widget in (priority_label, priority_entry, time_quantum_label, time_quantum_entry,
+                   deadline_label, deadline_entry, period_label, period_entry,
+                   tickets_label, tickets_entry, seed_label, seed_entry, aging_label, aging_entry):
+        widget.grid_forget()
+
+    try:
+        scheduler = get_scheduler(algorithm)
+    except Exception as e:
+        show_error_dialog("Plugin Error", f"Could not load {algorithm}: {str(e)}")
+        return
+    fields = {
+        "priority": (priority_label, priority_entry),
+        "aging": (aging_label, aging_entry),
+        "quantum": (time_quantum_label, time_quantum_entry),
+        "deadline": (deadline_label, deadline_entry),
+        "period": (period_label, period_entry),
+        "tickets": (tickets_label, tickets_entry),
+        "seed": (seed_label, seed_entry),
+    }
+    for row, field in enumerate((f for f in scheduler.inputs if f in fields), start=3):
+        label, entry = fields[field]
+        label.grid(row=row, column=0, padx=20, pady=10, sticky="w")
+        entry.grid(row=row, column=1, padx=20, pady=10, sticky="ew")
+
+# Function to build the hidden per-algorithm fields on first use
+def ensure_optional_fields():
+    """Create the optional input fields the first time anything needs them.
+
+    They start hidden, so building them is deferred until an algorithm is
+    selected or a button reads them, which keeps them off the startup path.
+    """
+    global priority_label, priority_entry, time_quantum_label, time_quantum_entry, aging_label, aging_entry
+    global deadline_label, deadline_entry, period_label, period_entry
+    global tickets_label, tickets_entry, seed_label, seed_entry
+    if priority_entry is not None:
+        return
+    input_section = optional_section
+
+    # Priority (initially hidden)
+    priority_label = ctk.CTkLabel(
+        input_section, 
+        text="🎯 Priorities (comma-separated):", 
+        font=ctk.CTkFont(size=14, weight="bold")
+    )
+    priority_entry = ctk.CTkEntry(
+        input_section,
+        font=ctk.CTkFont(size=14),
+        width=300,
+        height=35,
+        corner_radius=10,
+        placeholder_text="e.g., 1,4,2,3 (lower = higher priority)"
+    )
+
+    # Time Quantum (initially hidden)
+    time_quantum_label = ctk.CTkLabel(
+        input_section, 
+        text="🕐 Time Quantum:", 
+        font=ctk.CTkFont(size=14, weight="bold")
+    )
+    time_quantum_entry = ctk.CTkEntry(
+        input_section,
+        font=ctk.CTkFont(size=14),
+        width=300,
+        height=35,
+        corner_radius=10,
+        placeholder_text="e.g., 2"
+    )
+
+    # Aging for priority algorithms (initially hidden)
+    aging_label = ctk.CTkLabel(
+        input_section, 
+        text="⏫ Aging Interval:", 
+        font=ctk.CTkFont(size=14, weight="bold")
+    )
+    aging_entry = ctk.CTkEntry(
+        input_section,
+        font=ctk.CTkFont(size=14),
+        width=300,
+        height=35,
+        corner_radius=10,
+        placeholder_text="e.g., 5 (optional, waiting 5 units = 1 level)"
+    )
+
+    # Deadlines and Periods for real-time algorithms (initially hidden)
+    deadline_label = ctk.CTkLabel(
+        input_section, 
+        text="⏲️ Deadlines (comma-separated):", 
+        font=ctk.CTkFont(size=14, weight="bold")
+    )
+    deadline_entry = ctk.CTkEntry(
+        input_section,
+        font=ctk.CTkFont(size=14),
+        width=300,
+        height=35,
+        corner_radius=10,
+        placeholder_text="e.g., 15,8,30,25 (relative to each release)"
+    )
+    period_label = ctk.CTkLabel(
+        input_section, 
+        text="🔄 Periods (comma-separated):", 
+        font=ctk.CTkFont(size=14, weight="bold")
+    )
+    period_entry = ctk.CTkEntry(
+        input_section,
+        font=ctk.CTkFont(size=14),
+        width=300,
+        height=35,
+        corner_radius=10,
+        placeholder_text="e.g., 20,5,10,20 (optional, one-shot if empty)"
+    )
+
+    # Tickets and Seed for proportional-share algorithms (initially hidden)
+    tickets_label = ctk.CTkLabel(
+        input_section, 
+        text="🎟️ Tickets (comma-separated):", 
+        font=ctk.CTkFont(size=14, weight="bold")
+    )
+    tickets_entry = ctk.CTkEntry(
+        input_section,
+        font=ctk.CTkFont(size=14),
+        width=300,
+        height=35,
+        corner_radius=10,
+        placeholder_text="e.g., 100,50,250,100 (optional, equal if empty)"
+    )
+    seed_label = ctk.CTkLabel(
+        input_section, 
+        text="🎲 Random Seed:", 
+        font=ctk.CTkFont(size=14, weight="bold")
+    )
+    seed_entry = ctk.CTkEntry(
+        input_section,
+        font=ctk.CTkFont(size=14),
+        width=300,
+        height=35,
+        corner_radius=10,
+        placeholder_text="e.g., 42 (optional, default 0)"
+    )
 
 # Function to create input fields based on the selected algorithm
 def create_input_fields():
     global algo_dropdown  # Make algo_dropdown global to access in other functions
+    global priority_entry
 
     # Clear previous widgets
     for widget in input_frame.winfo_children():
         widget.destroy()
+    priority_entry = None  # The optional fields went with them
 
     # Title Section
     title_label = ctk.CTkLabel(
@@ -217,7 +613,7 @@ def create_input_fields():
 
     algo_dropdown = ctk.CTkOptionMenu(
         algo_frame, 
-        values=algorithms, 
+        values=scheduler_names(), 
         command=algorithm_selected,
         font=ctk.CTkFont(size=14),
         dropdown_font=ctk.CTkFont(size=12),
@@ -274,41 +670,40 @@ def create_input_fields():
         width=300,
         height=35,
         corner_radius=10,
-        placeholder_text="e.g., 5,3,8,6"
+        placeholder_text="e.g., 5,3,8,6 or 5/3/2 for CPU/I-O/CPU"
     )
     burst_entry.grid(row=2, column=1, padx=20, pady=10, sticky="ew")
 
-    # Priority (initially hidden)
-    global priority_label, priority_entry
-    priority_label = ctk.CTkLabel(
-        input_section, 
-        text="🎯 Priorities (comma-separated):", 
-        font=ctk.CTkFont(size=14, weight="bold")
-    )
-    priority_entry = ctk.CTkEntry(
-        input_section,
-        font=ctk.CTkFont(size=14),
-        width=300,
-        height=35,
-        corner_radius=10,
-        placeholder_text="e.g., 1,4,2,3 (lower = higher priority)"
-    )
+    # Optional per-algorithm fields are only built once they are needed
+    global optional_section
+    optional_section = input_section
 
-    # Time Quantum (initially hidden)
-    global time_quantum_label, time_quantum_entry
-    time_quantum_label = ctk.CTkLabel(
+    # Context Switch Overhead (optional, applies to every algorithm)
+    context_switch_label = ctk.CTkLabel(
         input_section, 
-        text="🕐 Time Quantum:", 
+        text="🔁 Context Switch Time:", 
         font=ctk.CTkFont(size=14, weight="bold")
     )
-    time_quantum_entry = ctk.CTkEntry(
+    context_switch_label.grid(row=9, column=0, padx=20, pady=(10, 20), sticky="w")
+
+    context_switch_entry = ctk.CTkEntry(
         input_section,
         font=ctk.CTkFont(size=14),
         width=300,
         height=35,
         corner_radius=10,
-        placeholder_text="e.g., 2"
+        placeholder_text="e.g., 1 (optional, default 0)"
     )
+    context_switch_entry.grid(row=9, column=1, padx=20, pady=(10, 20), sticky="ew")
+
+    # The example loaders fill optional fields too, so those are built first
+    def load_example():
+        ensure_optional_fields()
+        load_example_data(arrival_entry, burst_entry, priority_entry, time_quantum_entry, context_switch_entry, deadline_entry, period_entry, tickets_entry, seed_entry, aging_entry)
+
+    def load_random():
+        ensure_optional_fields()
+        load_random_data(arrival_entry, burst_entry, priority_entry)
 
     # Submit Button with gradient effect
     button_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
@@ -318,7 +713,7 @@ def create_input_fields():
     example_button = ctk.CTkButton(
         button_frame, 
         text="📝 Load Example",
-        command=lambda: load_example_data(arrival_entry, burst_entry, priority_entry, time_quantum_entry),
+        command=load_example,
         font=ctk.CTkFont(size=14),
         width=150,
         height=40,
@@ -330,6 +725,47 @@ def create_input_fields():
         hover_color=COLORS['info']
     )
     example_button.pack(side="left", padx=(0, 20))
+
+    # Random workload button fills in a freshly generated workload
+    random_button = ctk.CTkButton(
+        button_frame, 
+        text="🎲 Random Workload",
+        command=load_random,
+        font=ctk.CTkFont(size=14),
+        width=150,
+        height=40,
+        corner_radius=20,
+        fg_color="transparent",
+        border_width=2,
+        border_color=COLORS['info'],
+        text_color=COLORS['info'],
+        hover_color=COLORS['info']
+    )
+    random_button.pack(side="left", padx=(0, 20))
+    
+    # Trace file button runs the selected algorithm on a binary trace
+    trace_button = ctk.CTkButton(
+        button_frame, 
+        text="📂 Open Trace",
+        command=lambda: open_trace_file(
+            algo_dropdown.get(),
+            entry_text(time_quantum_entry),
+            context_switch_entry.get(),
+            entry_text(seed_entry),
+            entry_text(aging_entry),
+            bool(history_checkbox.get())
+        ),
+        font=ctk.CTkFont(size=14),
+        width=150,
+        height=40,
+        corner_radius=20,
+        fg_color="transparent",
+        border_width=2,
+        border_color=COLORS['info'],
+        text_color=COLORS['info'],
+        hover_color=COLORS['info']
+    )
+    trace_button.pack(side="left", padx=(0, 20))
     
     submit_button = ctk.CTkButton(
         button_frame, 
@@ -337,9 +773,16 @@ def create_input_fields():
         command=lambda: process_input(
             arrival_entry.get(), 
             burst_entry.get(),
-            priority_entry.get(), 
-            time_quantum_entry.get(),
-            algo_dropdown.get()
+            entry_text(priority_entry), 
+            entry_text(time_quantum_entry),
+            algo_dropdown.get(),
+            context_switch_entry.get(),
+            entry_text(deadline_entry),
+            entry_text(period_entry),
+            entry_text(tickets_entry),
+            entry_text(seed_entry),
+            entry_text(aging_entry),
+            record_history=bool(history_checkbox.get())
         ),
         font=ctk.CTkFont(size=18, weight="bold"),
         width=250,
@@ -365,6 +808,34 @@ def create_input_fields():
     )
     help_button.pack(side="left", padx=(20, 0))
 
+    # History options
+    history_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
+    history_frame.grid(row=4, column=0, columnspan=3, padx=20, pady=(0, 20))
+
+    global history_checkbox
+    history_checkbox = ctk.CTkCheckBox(
+        history_frame,
+        text="🗄️ Save runs to history",
+        font=ctk.CTkFont(size=13)
+    )
+    history_checkbox.pack(side="left", padx=(0, 20))
+
+    history_button = ctk.CTkButton(
+        history_frame,
+        text="🗄️ Browse History",
+        command=show_history_browser,
+        font=ctk.CTkFont(size=13),
+        width=150,
+        height=32,
+        corner_radius=16,
+        fg_color="transparent",
+        border_width=2,
+        border_color=COLORS['secondary'],
+        text_color=COLORS['secondary'],
+        hover_color=COLORS['secondary']
+    )
+    history_button.pack(side="left")
+
     # Configure grid weights for responsive design
     input_frame.grid_columnconfigure(0, weight=1)
     input_frame.grid_columnconfigure(1, weight=1)
@@ -372,29 +843,131 @@ def create_input_fields():
     input_section.grid_columnconfigure(1, weight=1)
 
 # Function to load example data
-def load_example_data(arrival_entry, burst_entry, priority_entry, time_quantum_entry):
+def load_example_data(arrival_entry, burst_entry, priority_entry, time_quantum_entry, context_switch_entry, deadline_entry, period_entry, tickets_entry, seed_entry, aging_entry):
     # Clear existing data
     arrival_entry.delete(0, 'end')
     burst_entry.delete(0, 'end')
     priority_entry.delete(0, 'end')
     time_quantum_entry.delete(0, 'end')
+    context_switch_entry.delete(0, 'end')
+    deadline_entry.delete(0, 'end')
+    period_entry.delete(0, 'end')
+    tickets_entry.delete(0, 'end')
+    seed_entry.delete(0, 'end')
+    aging_entry.delete(0, 'end')
     
     # Insert example data
     arrival_entry.insert(0, "0,1,2,3")
     burst_entry.insert(0, "5,3,8,6")
     priority_entry.insert(0, "2,1,4,3")
     time_quantum_entry.insert(0, "2")
+    context_switch_entry.insert(0, "0")
+    deadline_entry.insert(0, "15,8,30,25")
+    period_entry.insert(0, "20,10,40,40")
+    tickets_entry.insert(0, "100,50,250,100")
+    seed_entry.insert(0, "42")
+
+# Function to fill the process fields with a random synthetic workload
+def load_random_data(arrival_entry, burst_entry, priority_entry, count=8):
+    generator = WorkloadGenerator(count, seed=random.randrange(1 << 30), arrival_rate=0.5)
+    for entry, column in ((arrival_entry, "arrival"), (burst_entry, "burst"), (priority_entry, "priority")):
+        entry.delete(0, 'end')
+        entry.insert(0, ",".join(map(str, generator.values(column))))
+
+# Function to pick a binary trace file and simulate it
+def open_trace_file(algorithm, time_quantum_data, context_switch_data, seed_data, aging_data, record_history=False):
+    trace_path = filedialog.askopenfilename(
+        title="Open Trace File",
+        filetypes=[("CPU traces", f"*{TRACE_EXTENSION}"), ("All files", "*.*")]
+    )
+    if trace_path:
+        process_input("", "", "", time_quantum_data, algorithm, context_switch_data,
+                      seed_data=seed_data, aging_data=aging_data, trace_path=trace_path,
+                      record_history=record_history)
+
+# Function to show the run history browser
+def show_history_browser(page_size=50):
+    try:
+        history = RunHistory()
+    except sqlite3.Error as e:
+        show_error_dialog("History Error", f"Could not open the history database: {str(e)}")
+        return
+
+    history_window = ctk.CTkToplevel(root)
+    history_window.title("🗄️ Simulation History")
+    history_window.geometry("1000x600")
+    history_window.configure(fg_color=("white", "gray15"))
+    history_window.protocol("WM_DELETE_WINDOW", lambda: [history.close(), history_window.destroy()])
+
+    # Filter and paging controls
+    controls = ctk.CTkFrame(history_window, fg_color="transparent")
+    controls.pack(fill="x", padx=20, pady=(20, 10))
+
+    columns = ("ID", "Date", "Algorithm", "Quantum", "Processes", "Avg TAT", "Avg WT", "Avg RT", "CPU %", "Switches", "Workload")
+    tree = ttk.Treeview(history_window, columns=columns, show='headings', height=page_size // 2)
+    for col in columns:
+        tree.heading(col, text=col)
+        tree.column(col, width=160 if col in ("Algorithm", "Date") else 80, anchor="center")
+    tree.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+    # Ids that start each page visited so far, for going back to newer pages
+    page_starts = [None]
+    state = {'last_id': None}
+
+    def load_page():
+        for item in tree.get_children():
+            tree.delete(item)
+        selected = algorithm_filter.get()
+        rows = history.page(page_starts[-1], page_size, None if selected == "All algorithms" else selected)
+        for row in rows:
+            tree.insert("", "end", values=(
+                row['id'], row['created_at'], row['algorithm'],
+                row['quantum'] if row['quantum'] is not None else "N/A",
+                row['num_processes'], f"{row['avg_turnaround']:.2f}", f"{row['avg_waiting']:.2f}",
+                f"{row['avg_response']:.2f}", f"{row['cpu_utilization']:.1f}", row['context_switches'],
+                row['workload_hash'][:10]
+            ))
+        state['last_id'] = rows[-1]['id'] if len(rows) == page_size else None
+        older_button.configure(state="normal" if state['last_id'] is not None else "disabled")
+        newer_button.configure(state="normal" if len(page_starts) > 1 else "disabled")
+
+    def older():
+        page_starts.append(state['last_id'])
+        load_page()
+
+    def newer():
+        page_starts.pop()
+        load_page()
+
+    def refilter(_):
+        del page_starts[1:]
+        load_page()
+
+    algorithm_filter = ctk.CTkOptionMenu(controls, values=["All algorithms"] + scheduler_names(), command=refilter, width=300)
+    algorithm_filter.pack(side="left")
+    older_button = ctk.CTkButton(controls, text="Older ▶", command=older, width=100)
+    older_button.pack(side="right")
+    newer_button = ctk.CTkButton(controls, text="◀ Newer", command=newer, width=100)
+    newer_button.pack(side="right", padx=10)
+
+    load_page()
 
 # Function to show help dialog
 def show_help_dialog():
+    global help_window
+    # The help window is built once and only hidden when closed
+    if help_window is not None and help_window.winfo_exists():
+        help_window.deiconify()
+        help_window.lift()
+        return
     help_window = ctk.CTkToplevel(root)
+    help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
     help_window.title("📚 Help - CPU Scheduling Simulator")
     help_window.geometry("600x500")
     help_window.configure(fg_color=("white", "gray15"))
     help_window.resizable(True, True)
     
     # Center the help window
-    help_window.update_idletasks()
     x = (help_window.winfo_screenwidth() // 2) - (300)
     y = (help_window.winfo_screenheight() // 2) - (250)
     help_window.geometry(f"600x500+{x}+{y}")
@@ -413,30 +986,68 @@ def show_help_dialog():
     help_title.pack(pady=(0, 20))
     
     help_sections = [
+        ("🗄️ Run History",
+         "• Tick 'Save runs to history' to record each simulation in a local database\n"
+         "• Browse History pages through past runs, newest first\n"
+         "• Runs of the same workload share a workload hash, whatever the process order"),
+        
+        ("📂 Trace Files",
+         "• Open Trace runs the selected algorithm on a binary .cputrace file\n"
+         "• Traces hold arrival, burst and optional priority/deadline columns\n"
+         "• Files are memory-mapped, so even very large traces open instantly\n"
+         "• Time Quantum, Context Switch, Aging and Seed come from the form"),
+        
         ("🔢 Input Format", 
-         "• Arrival Times: Enter comma-separated integers (e.g., 0,1,2,3)\n"
-         "• Burst Times: Enter comma-separated integers (e.g., 5,3,8,6)\n"
-         "• All values must be positive integers\n"
+         "• Arrival Times: Enter comma-separated numbers (e.g., 0,1,2,3)\n"
+         "• Burst Times: Enter comma-separated numbers (e.g., 5,3,8,6)\n"
+         "• Times may have up to 6 decimal places (e.g., 0.25,1.5)\n"
+         "• Bursts must be positive and arrivals non-negative\n"
+         "• CPU/I-O algorithm: write bursts as CPU/I-O/CPU, e.g., 5/3/2\n"
          "• Number of arrival times must equal number of burst times"),
         
         ("🎯 Priority Scheduling",
          "• Required for Priority algorithms\n"
          "• Lower numbers indicate higher priority\n"
          "• Example: 1,4,2,3 (Process A has highest priority)\n"
-         "• Must provide same number of priorities as processes"),
+         "• Must provide same number of priorities as processes\n"
+         "• Optional Aging Interval: every N units spent waiting raise a\n"
+         "  process by one priority level, so low-priority work cannot starve"),
         
         ("🕐 Time Quantum",
          "• Required for Round-Robin scheduling\n"
          "• Specifies the time slice for each process\n"
-         "• Must be a positive integer\n"
+         "• Must be a positive number\n"
          "• Common values: 1, 2, 3, 4"),
         
+        ("🔁 Context Switch Time",
+         "• Optional overhead charged each time the CPU changes process\n"
+         "• Shown as its own segment in the Gantt chart\n"
+         "• Leave empty or 0 to ignore switching cost\n"
+         "• Small quanta with large overhead lower real throughput"),
+        
+        ("⏲️ Real-Time Scheduling",
+         "• Deadlines are relative to each job's release time\n"
+         "• Periods make a process release a new job every period\n"
+         "• Without a period the process runs once; without a deadline its period is used\n"
+         "• EDF runs the job with the earliest absolute deadline\n"
+         "• RMS gives fixed priority to the shortest period (or deadline)"),
+        
+        ("🎟️ Proportional-Share Scheduling",
+         "• Lottery and Stride use the Time Quantum plus per-process Tickets\n"
+         "• More tickets means a larger share of the CPU\n"
+         "• Lottery draws a random winner each quantum (same seed = same schedule)\n"
+         "• Stride is the deterministic counterpart of lottery scheduling"),
+        
         ("🖥️ Scheduling Algorithms",
          "• FCFS: Processes run in arrival order\n"
          "• SJF: Shortest job runs first (non-preemptive)\n"
          "• SRTF: Shortest remaining time first (preemptive)\n"
          "• Round-Robin: Time quantum-based scheduling\n"
-         "• Priority: Based on priority values (preemptive/non-preemptive)"),
+         "• Priority: Based on priority values (preemptive/non-preemptive)\n"
+         "• EDF / RMS: Preemptive real-time scheduling with deadline-miss metrics\n"
+         "• Lottery / Stride: Proportional-share scheduling by tickets\n"
+         "• CPU/I-O Bursts: Processes block on a shared I/O device between CPU bursts\n"
+         "  (FCFS ready queue, or Round-Robin when a Time Quantum is given)"),
         
         ("📊 Results Explanation",
          "• Gantt Chart: Visual timeline of process execution\n"
@@ -470,7 +1081,7 @@ def show_help_dialog():
     close_button = ctk.CTkButton(
         help_window,
         text="✅ Got it!",
-        command=help_window.destroy,
+        command=help_window.withdraw,
         font=ctk.CTkFont(size=14, weight="bold"),
         fg_color=COLORS['success'],
         hover_color=COLORS['secondary'],
@@ -552,7 +1163,46 @@ def show_results(proc_list, gantt_chart, algorithm):
         fg_color=COLORS['secondary'],
         hover_color=COLORS['success']
     )
-    new_sim_button.pack(side="left")
+    new_sim_button.pack(side="left", padx=(0, 10))
+    
+    export_button = ctk.CTkButton(
+        button_frame,
+        text="💾 Export Run",
+        command=lambda: export_run_dialog(proc_list, gantt_chart, algorithm),
+        font=ctk.CTkFont(size=14, weight="bold"),
+        width=130,
+        height=35,
+        corner_radius=20,
+        fg_color=COLORS['accent'],
+        hover_color=COLORS['warning']
+    )
+    export_button.pack(side="left", padx=(0, 10))
+    
+    save_chart_button = ctk.CTkButton(
+        button_frame,
+        text="🖼️ Save Chart",
+        command=lambda: save_gantt_dialog(gantt_chart),
+        font=ctk.CTkFont(size=14, weight="bold"),
+        width=130,
+        height=35,
+        corner_radius=20,
+        fg_color=COLORS['accent'],
+        hover_color=COLORS['warning']
+    )
+    save_chart_button.pack(side="left", padx=(0, 10))
+    
+    replay_button = ctk.CTkButton(
+        button_frame,
+        text="⏯️ Replay",
+        command=lambda: show_replay_window(proc_list, gantt_chart),
+        font=ctk.CTkFont(size=14, weight="bold"),
+        width=110,
+        height=35,
+        corner_radius=20,
+        fg_color=COLORS['info'],
+        hover_color=COLORS['primary']
+    )
+    replay_button.pack(side="left")
     
     # Algorithm title with icon
     title_label = ctk.CTkLabel(
@@ -599,25 +1249,85 @@ def show_results(proc_list, gantt_chart, algorithm):
     )
     gantt_canvas.pack(fill='x', padx=10, pady=10)
 
-    # Drawing Enhanced Gantt Chart
-    draw_enhanced_gantt_chart(gantt_canvas, gantt_chart)
+    # Drawing Enhanced Gantt Chart (large runs get the tiled, zoomable view)
+    if len(gantt_chart) > GANTT_TILE_THRESHOLD:
+        gantt_view = gantt_canvas.tile_view = GanttTileView(gantt_canvas, gantt_chart, gantt_process_colors(gantt_chart))
+    else:
+        gantt_view = draw_enhanced_gantt_chart(gantt_canvas, gantt_chart)
+
+    # Details of the segment clicked on the chart
+    inspect_label = ctk.CTkLabel(
+        canvas_frame,
+        text="Hover over the chart to see what ran when; click a segment for its process's details.",
+        font=ctk.CTkFont(size=12),
+        text_color=("gray40", "gray70"),
+        justify="left"
+    )
+    inspect_label.pack(fill='x', padx=15, pady=(0, 10))
+
+    # Load Over Time Section
+    telemetry_rows = build_telemetry(proc_list, gantt_chart).series()
+    if telemetry_rows:
+        telemetry_frame = ctk.CTkFrame(main_scrollable, corner_radius=15)
+        telemetry_frame.pack(fill='x', padx=10, pady=10)
+
+        telemetry_header = ctk.CTkFrame(telemetry_frame, corner_radius=10, height=50, fg_color=COLORS['info'])
+        telemetry_header.pack(fill='x', padx=15, pady=(15, 10))
+        telemetry_header.pack_propagate(False)
+
+        ctk.CTkLabel(
+            telemetry_header,
+            text="📉 Load Over Time",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color="white"
+        ).pack(pady=10)
+
+        create_telemetry_chart(telemetry_frame, telemetry_rows)
 
     # Statistics Cards Section
     stats_frame = ctk.CTkFrame(main_scrollable, corner_radius=15, fg_color="transparent")
     stats_frame.pack(fill='x', padx=10, pady=10)
     
     # Calculate averages
-    if len(proc_list) > 0:
-        avg_tat = sum(proc.turnaround_time for proc in proc_list) / len(proc_list)
-        avg_wt = sum(proc.waiting_time for proc in proc_list) / len(proc_list)
-        avg_rt = sum(proc.response_time for proc in proc_list if proc.response_time != -1) / len([p for p in proc_list if p.response_time != -1]) if any(p.response_time != -1 for p in proc_list) else 0
-        total_completion_time = max(proc.completion_time for proc in proc_list) if proc_list else 0
-        cpu_utilization = (sum(proc.burst_time for proc in proc_list) / total_completion_time * 100) if total_completion_time > 0 else 0
-    else:
-        avg_tat = avg_wt = avg_rt = cpu_utilization = 0
+    metrics = compute_run_metrics(proc_list, gantt_chart)
+
+    # Tail latency percentiles
+    extra_stats = []
+    for metric, icon, color in (("turnaround", "⏱️", COLORS['primary']), ("waiting", "⏳", COLORS['warning']), ("response", "🚀", COLORS['info'])):
+        values = metrics['percentiles'][metric]
+        extra_stats.append((icon, f"{metric.title()} p50 / p95 / p99", " / ".join(format_time(values[label]) for label, _ in PERCENTILES), color))
+
+    # Deadline metrics only exist for runs of the real-time engines
+    if metrics['deadline_jobs']:
+        extra_stats.append(("⏲️", "Deadline Miss Ratio", f"{metrics['miss_ratio'] * 100:.1f}% ({metrics['deadline_misses']}/{metrics['deadline_jobs']})", COLORS['danger']))
+        extra_stats.append(("📉", "Max Lateness", format_time(max(metrics['lateness'])), COLORS['warning']))
+
+    # Device metrics only exist for runs with I/O bursts
+    if metrics['io_utilization']:
+        extra_stats.append(("💾", "I/O Device Utilization", f"{metrics['io_utilization']:.1f}%", COLORS['info']))
+        extra_stats.append(("⌛", "Avg I/O Queue Wait", format_time(metrics['avg_io_wait'], 2), COLORS['warning']))
 
     # Create statistics cards
-    create_stats_cards(stats_frame, avg_tat, avg_wt, avg_rt, cpu_utilization, len(proc_list))
+    create_stats_cards(stats_frame, metrics['avg_turnaround'], metrics['avg_waiting'], metrics['avg_response'],
+                       metrics['cpu_utilization'], len(proc_list), metrics['context_switches'], metrics['throughput'], extra_stats)
+
+    # Lateness distribution for real-time runs
+    if metrics['deadline_jobs']:
+        deadline_frame = ctk.CTkFrame(main_scrollable, corner_radius=15)
+        deadline_frame.pack(fill='x', padx=10, pady=10)
+        
+        deadline_header = ctk.CTkFrame(deadline_frame, corner_radius=10, height=50, fg_color=COLORS['danger'])
+        deadline_header.pack(fill='x', padx=15, pady=(15, 10))
+        deadline_header.pack_propagate(False)
+        
+        ctk.CTkLabel(
+            deadline_header, 
+            text="⏲️ Lateness Distribution (finish - deadline)", 
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color="white"
+        ).pack(pady=10)
+        
+        create_lateness_histogram(deadline_frame, metrics['lateness'])
 
     # Process Details Table Section
     table_frame = ctk.CTkFrame(main_scrollable, corner_radius=15)
@@ -636,7 +1346,32 @@ def show_results(proc_list, gantt_chart, algorithm):
     ).pack(pady=15)
 
     # Enhanced Process Table
-    create_enhanced_table(table_frame, proc_list)
+    process_table, select_process = create_enhanced_table(table_frame, proc_list)
+
+    # Clicking a segment shows its process's metrics and selects its table row
+    if gantt_view is not None:
+        processes_by_name = {proc.name: proc for proc in proc_list}
+
+        def segment_selected(proc_name, start, duration):
+            proc = processes_by_name.get(proc_name)
+            if proc is None:
+                process_table.selection_remove(process_table.selection())
+                if proc_name is None:
+                    inspect_label.configure(text="")
+                else:
+                    label = {"Idle": "Idle", "Switch": "Context switch"}.get(proc_name, proc_name)
+                    inspect_label.configure(text=f"{label} from {format_time(start)} to {format_time(start + duration)}")
+                return
+            response = format_time(proc.response_time) if proc.response_time != -1 else "N/A"
+            inspect_label.configure(text=(
+                f"Process {proc.name} ran from {format_time(start)} to {format_time(start + duration)}  ·  "
+                f"arrival {format_time(proc.arrival_time)}, burst {format_time(proc.burst_time)}, "
+                f"completion {format_time(proc.completion_time)}, turnaround {format_time(proc.turnaround_time)}, "
+                f"waiting {format_time(proc.waiting_time)}, response {response}"
+            ))
+            select_process(proc.name)
+
+        gantt_canvas.inspector = GanttInspector(gantt_canvas, gantt_chart, gantt_view, segment_selected)
     
     # Add Process Color Reference Card
     color_ref_frame = ctk.CTkFrame(main_scrollable, corner_radius=15)
@@ -664,51 +1399,378 @@ def show_results(proc_list, gantt_chart, algorithm):
     results_frame.bind("<Key>", lambda e: show_input_form() if e.keysym == "Escape" else None)
     results_frame.focus_set()
 
-# Function to create color reference
-def create_color_reference(parent_frame, proc_list):
-    # Get unique process names and assign colors
-    unique_processes = list(set(proc.name for proc in proc_list))
-    process_colors = {}
-    for i, proc_name in enumerate(sorted(unique_processes)):
-        process_colors[proc_name] = COLORS['process_colors'][i % len(COLORS['process_colors'])]
-    
-    # Create color reference grid
-    ref_canvas = tk.Canvas(
-        parent_frame,
-        height=80,
-        bg=("white" if ctk.get_appearance_mode() == "Light" else "#2b2b2b"),
-        highlightthickness=0
+# Helper function to decide whether a trace can run in summary-only mode
+def summary_trace_supported(trace, algorithm, aging_interval=None):
+    """The algorithm needs a summary policy (without aging) and the trace must be sorted by arrival."""
+    if aging_interval or "summary" not in get_scheduler(algorithm).capabilities:
+        return False
+    arrivals = trace.arrival_times
+    return all(arrivals[i] <= arrivals[i + 1] for i in range(len(arrivals) - 1))
+
+# Function to show the metrics of a summary-only run (no Gantt chart or per-process table)
+def show_summary_results(summary, algorithm):
+    input_frame.pack_forget()
+    root.title(f"🖥️ {algorithm} - Results")
+
+    global results_frame
+    results_frame = ctk.CTkFrame(
+        main_container,
+        corner_radius=20,
+        fg_color=("white", "gray20"),
+        border_width=2,
+        border_color=("gray80", "gray30")
     )
-    ref_canvas.pack(fill='x', padx=15, pady=15)
-    
-    # Draw color reference
-    start_x = 20
-    start_y = 40
-    box_size = 30
-    spacing = 150
-    
-    for i, (proc_name, color) in enumerate(process_colors.items()):
-        x = start_x + i * spacing
-        
-        # Draw color box
-        ref_canvas.create_rectangle(
-            x, start_y - box_size//2, 
-            x + box_size, start_y + box_size//2,
-            fill=color, outline="black", width=2
-        )
-        
-        # Draw process label
-        ref_canvas.create_text(
-            x + box_size + 10, start_y,
-            text=f"Process {proc_name}",
-            fill=("black" if ctk.get_appearance_mode() == "Light" else "white"),
-            font=("Arial", 12, "bold"),
-            anchor="w"
+    results_frame.pack(fill="both", expand=True, padx=10, pady=10)
+    main_scrollable = ctk.CTkScrollableFrame(results_frame, corner_radius=0)
+    main_scrollable.pack(fill="both", expand=True, padx=10, pady=10)
+
+    header_frame = ctk.CTkFrame(main_scrollable, corner_radius=15, height=120)
+    header_frame.pack(fill='x', padx=10, pady=(10, 20))
+    header_frame.pack_propagate(False)
+    ctk.CTkButton(
+        header_frame,
+        text="⬅️ Back",
+        command=show_input_form,
+        font=ctk.CTkFont(size=14, weight="bold"),
+        width=100,
+        height=35,
+        corner_radius=20,
+        fg_color=COLORS['info'],
+        hover_color=COLORS['primary']
+    ).place(x=20, y=15)
+    ctk.CTkLabel(
+        header_frame,
+        text=f"🖥️ {algorithm}",
+        font=ctk.CTkFont(size=28, weight="bold"),
+        text_color=COLORS['primary']
+    ).pack(pady=(20, 5))
+    ctk.CTkLabel(
+        header_frame,
+        text=f"Summary of {summary.completed:,} processes: too many to draw or list",
+        font=ctk.CTkFont(size=16),
+        text_color=("gray60", "gray40")
+    ).pack()
+
+    telemetry_rows = summary.telemetry.series()
+    if telemetry_rows:
+        telemetry_frame = ctk.CTkFrame(main_scrollable, corner_radius=15)
+        telemetry_frame.pack(fill='x', padx=10, pady=10)
+        telemetry_header = ctk.CTkFrame(telemetry_frame, corner_radius=10, height=50, fg_color=COLORS['info'])
+        telemetry_header.pack(fill='x', padx=15, pady=(15, 10))
+        telemetry_header.pack_propagate(False)
+        ctk.CTkLabel(
+            telemetry_header,
+            text="📉 Load Over Time",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color="white"
+        ).pack(pady=10)
+        create_telemetry_chart(telemetry_frame, telemetry_rows)
+
+    stats_frame = ctk.CTkFrame(main_scrollable, corner_radius=15, fg_color="transparent")
+    stats_frame.pack(fill='x', padx=10, pady=10)
+    metrics = summary.metrics()
+    extra_stats = []
+    for metric, icon, color in (("turnaround", "⏱️", COLORS['primary']), ("waiting", "⏳", COLORS['warning']), ("response", "🚀", COLORS['info'])):
+        values = metrics['percentiles'][metric]
+        extra_stats.append((icon, f"{metric.title()} p50 / p95 / p99", " / ".join(format_time(values[label]) for label, _ in PERCENTILES), color))
+    create_stats_cards(stats_frame, metrics['avg_turnaround'], metrics['avg_waiting'], metrics['avg_response'],
+                       metrics['cpu_utilization'], metrics['completed'], metrics['context_switches'], metrics['throughput'], extra_stats)
+
+    results_frame.bind("<Key>", lambda e: show_input_form() if e.keysym == "Escape" else None)
+    results_frame.focus_set()
+
+# Function to ask for a directory and export the current run there
+def export_run_dialog(proc_list, gantt_chart, algorithm):
+    directory = filedialog.askdirectory(title="Export Run To Directory")
+    if not directory:
+        return
+    try:
+        metadata = export_run(directory, proc_list, gantt_chart, algorithm, time_scale=time_scale)
+    except OSError as e:
+        show_error_dialog("Export Error", f"Could not export the run: {str(e)}")
+        return
+    messagebox.showinfo("Export Complete", f"Wrote {metadata['num_segments']} segments and {metadata['num_processes']} processes to {directory}")
+
+# Function to ask for a file name and save the Gantt chart as SVG or PNG
+def save_gantt_dialog(gantt_chart):
+    path = filedialog.asksaveasfilename(
+        title="Save Gantt Chart",
+        defaultextension=".svg",
+        filetypes=[("SVG image", "*.svg"), ("PNG image", "*.png")]
+    )
+    if not path:
+        return
+    writer = write_gantt_png if path.lower().endswith(".png") else write_gantt_svg
+    theme = "light" if ctk.get_appearance_mode() == "Light" else "dark"
+    try:
+        writer(path, gantt_chart, theme=theme)
+    except (OSError, ValueError) as e:
+        show_error_dialog("Export Error", f"Could not save the chart: {str(e)}")
+        return
+    messagebox.showinfo("Export Complete", f"Saved the Gantt chart to {path}")
+
+# Function to open the timeline replay of a run
+def show_replay_window(proc_list, gantt_chart):
+    global replay_window
+    if replay_window is not None and replay_window.winfo_exists():
+        replay_window.destroy()
+    replay = TimelineReplay(proc_list, gantt_chart)
+    total_time = replay.index.total_time
+    if total_time <= 0:
+        show_error_dialog("Replay Error", "The run has an empty schedule.")
+        return
+    process_colors = gantt_process_colors(gantt_chart)
+    light = ctk.get_appearance_mode() == "Light"
+    text_color = "black" if light else "white"
+
+    replay_window = ctk.CTkToplevel(root)
+    replay_window.title("⏯️ Timeline Replay")
+    replay_window.geometry("900x480")
+    replay_window.configure(fg_color=("white", "gray15"))
+    window = replay_window
+
+    width, start_x = 860, 40
+    strip_y, strip_height = 50, 30
+    scale = (width - 2 * start_x) / total_time
+    canvas = tk.Canvas(window, width=width, height=330, bg=("white" if light else "#2b2b2b"), highlightthickness=0)
+    canvas.pack(padx=20, pady=(20, 10))
+
+    # Whole run in miniature (segments under a pixel merged), drawn once; only the cursor moves
+    for proc_name, _, _, x0, x1, _ in gantt_layout(gantt_chart, scale, start_x, 1):
+        canvas.create_rectangle(x0, strip_y, max(x1, x0 + 1), strip_y + strip_height, fill=process_colors[proc_name], outline="")
+    cursor = canvas.create_line(start_x, strip_y - 6, start_x, strip_y + strip_height + 6, fill=COLORS['danger'], width=3)
+    time_text = canvas.create_text(start_x, 25, anchor="w", fill=text_color, font=("Arial", 14, "bold"))
+    canvas.create_text(start_x, 115, anchor="w", text="Running", fill=text_color, font=("Arial", 11, "bold"))
+    running_box = canvas.create_rectangle(start_x, 130, start_x + 24, 154, outline="black")
+    running_text = canvas.create_text(start_x + 34, 142, anchor="w", fill=text_color, font=("Arial", 12))
+    waiting_title = canvas.create_text(start_x, 185, anchor="w", fill=text_color, font=("Arial", 11, "bold"))
+    # Fixed slots for the waiting processes, updated in place
+    slots = []
+    per_row = REPLAY_QUEUE_ROWS // 2
+    slot_width = (width - 2 * start_x) // per_row
+    for k in range(REPLAY_QUEUE_ROWS):
+        x = start_x + (k % per_row) * slot_width
+        y = 200 + (k // per_row) * 50
+        box = canvas.create_rectangle(x, y, x + slot_width - 10, y + 40, outline="", fill="")
+        label = canvas.create_text(x + (slot_width - 10) / 2, y + 20, fill="white", font=("Arial", 10, "bold"))
+        slots.append((box, label))
+    completed_text = canvas.create_text(start_x, 315, anchor="w", fill=text_color, font=("Arial", 11))
+
+    state = {'time': 0.0, 'playing': False, 'after': None, 'last_tick': None, 'shown': {}}
+
+    # Helper function to reconfigure a canvas item only when its options changed
+    def update_item(item, **options):
+        if state['shown'].get(item) != options:
+            state['shown'][item] = options
+            canvas.itemconfigure(item, **options)
+
+    def render(time, move_slider=True):
+        time = min(max(0.0, time), total_time)
+        state['time'] = time
+        frame = replay.frame(time)
+        x = start_x + time * scale
+        canvas.coords(cursor, x, strip_y - 6, x, strip_y + strip_height + 6)
+        update_item(time_text, text=f"t = {format_time(time, 2)} / {format_time(total_time)}")
+        running = frame['running']
+        if running is None:
+            update_item(running_box, fill="")
+            update_item(running_text, text="Run finished")
+        else:
+            proc_name, start, duration = running
+            update_item(running_box, fill=process_colors[proc_name])
+            if frame['running_remaining'] is None:
+                label = "Idle" if proc_name == "Idle" else "Context switch"
+                update_item(running_text, text=f"{label}  ·  {format_time(start)} → {format_time(start + duration)}")
+            else:
+                update_item(running_text, text=f"Process {proc_name}  ·  {format_time(frame['running_remaining'], 2)} left  ·  "
+                                               f"this slice {format_time(start)} → {format_time(start + duration)}")
+        more = frame['waiting_count'] - len(frame['waiting'])
+        update_item(waiting_title, text=f"Waiting ({frame['waiting_count']})" + (f", {more} more not shown" if more > 0 else ""))
+        for k, (box, label) in enumerate(slots):
+            if k < len(frame['waiting']):
+                proc_name, remaining = frame['waiting'][k]
+                update_item(box, fill=process_colors.get(proc_name, COLORS['secondary']))
+                update_item(label, text=f"{proc_name}\n{format_time(remaining, 2)} left")
+            else:
+                update_item(box, fill="")
+                update_item(label, text="")
+        update_item(completed_text, text=f"Completed: {frame['completed']} / {len(proc_list)}")
+        if move_slider:
+            slider.set(time)
+
+    def tick():
+        now = monotonic()
+        speed = float(speed_menu.get().rstrip("x")) * max(1, total_time / 60)
+        render(state['time'] + (now - state['last_tick']) * speed)
+        state['last_tick'] = now
+        if state['time'] >= total_time:
+            pause()
+        else:
+            state['after'] = window.after(16, tick)
+
+    def play():
+        if state['time'] >= total_time:
+            state['time'] = 0.0
+        state['playing'] = True
+        state['last_tick'] = monotonic()
+        play_button.configure(text="⏸ Pause")
+        state['after'] = window.after(16, tick)
+
+    def pause():
+        state['playing'] = False
+        if state['after'] is not None:
+            window.after_cancel(state['after'])
+            state['after'] = None
+        play_button.configure(text="▶ Play")
+
+    def toggle(_=None):
+        if state['playing']:
+            pause()
+        else:
+            play()
+
+    def step(forward):
+        pause()
+        time = state['time']
+        render(replay.next_boundary(time) if forward else replay.previous_boundary(time))
+
+    def strip_clicked(event):
+        if strip_y - 10 <= event.y <= strip_y + strip_height + 10:
+            pause()
+            render((event.x - start_x) / scale)
+
+    def close():
+        global replay_window
+        pause()
+        window.destroy()
+        replay_window = None
+
+    controls = ctk.CTkFrame(window, fg_color="transparent")
+    controls.pack(fill="x", padx=20, pady=(0, 20))
+    ctk.CTkButton(controls, text="⏮ Back", command=lambda: step(False), width=90).pack(side="left")
+    play_button = ctk.CTkButton(controls, text="▶ Play", command=toggle, width=100)
+    play_button.pack(side="left", padx=10)
+    ctk.CTkButton(controls, text="Next ⏭", command=lambda: step(True), width=90).pack(side="left")
+    speed_menu = ctk.CTkOptionMenu(controls, values=["0.25x", "0.5x", "1x", "2x", "4x", "16x"], width=90)
+    speed_menu.set("1x")
+    speed_menu.pack(side="right")
+    slider = ctk.CTkSlider(controls, from_=0, to=total_time, command=lambda value: [pause(), render(value, False)])
+    slider.pack(side="left", fill="x", expand=True, padx=20)
+
+    canvas.bind("<Button-1>", strip_clicked)
+    canvas.bind("<B1-Motion>", strip_clicked)
+    window.bind("<space>", toggle)
+    window.bind("<Left>", lambda e: step(False))
+    window.bind("<Right>", lambda e: step(True))
+    window.protocol("WM_DELETE_WINDOW", close)
+    render(0.0)
+
+# Searchable legend that only draws the entries in view
+class ProcessLegend:
+    """Legend of process colors for any number of processes.
+
+    Names are kept sorted by their case-folded form, so a search for a
+    prefix is a bisect range, and only the rows that fit on the canvas are
+    drawn, from a fixed pool of items reconfigured on every scroll.  The
+    cost of a keystroke or a scroll does not grow with the process count.
+    """
+    def __init__(self, parent_frame, names, rows=3, columns=6, entry_width=150, row_height=34):
+        self.names = sorted(names, key=str.casefold)
+        self.keys = [name.casefold() for name in self.names]
+        self.rows, self.columns, self.row_height = rows, columns, row_height
+        self.lo, self.hi = 0, len(self.names)
+        self.top_row = 0
+        light = ctk.get_appearance_mode() == "Light"
+
+        controls = ctk.CTkFrame(parent_frame, fg_color="transparent")
+        controls.pack(fill='x', padx=15, pady=(5, 0))
+        self.search_entry = ctk.CTkEntry(controls, placeholder_text="🔍 Search processes by name", width=260)
+        self.search_entry.pack(side="left")
+        self.search_entry.bind("<KeyRelease>", self.search)
+        self.count_label = ctk.CTkLabel(controls, text="", text_color=("gray40", "gray70"))
+        self.count_label.pack(side="left", padx=15)
+
+        body = ctk.CTkFrame(parent_frame, fg_color="transparent")
+        body.pack(fill='x', padx=15, pady=(5, 15))
+        self.canvas = tk.Canvas(
+            body,
+            width=columns * entry_width + 20,
+            height=rows * row_height + 10,
+            bg=("white" if light else "#2b2b2b"),
+            highlightthickness=0
         )
+        self.canvas.pack(side="left", fill='x', expand=True)
+        self.scrollbar = ctk.CTkScrollbar(body, orientation="vertical", command=self.scroll)
+        self.scrollbar.pack(side="right", fill='y')
+        self.canvas.bind("<MouseWheel>", lambda e: self.scroll("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self.scroll("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.scroll("scroll", 1, "units"))
+
+        # One box and label per visible slot, reused for whatever is scrolled into view
+        self.slots = []
+        for k in range(rows * columns):
+            x = 10 + (k % columns) * entry_width
+            y = 10 + (k // columns) * row_height + row_height // 2
+            box = self.canvas.create_rectangle(x, y - 10, x + 20, y + 10, outline="black", width=2)
+            label = self.canvas.create_text(x + 28, y, anchor="w", fill=("black" if light else "white"),
+                                            font=("Arial", 11, "bold"))
+            self.slots.append((box, label))
+        self.refresh()
+
+    def total_rows(self):
+        return max(1, math.ceil((self.hi - self.lo) / self.columns))
+
+    def search(self, event=None):
+        query = self.search_entry.get().strip().casefold()
+        self.lo = bisect.bisect_left(self.keys, query)
+        self.hi = bisect.bisect_left(self.keys, query + "\U0010ffff") if query else len(self.keys)
+        self.top_row = 0
+        self.refresh()
+
+    def scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            row = int(float(amount) * self.total_rows())
+        else:
+            row = self.top_row + int(amount) * (self.rows if unit == "pages" else 1)
+        row = min(max(0, row), max(0, self.total_rows() - self.rows))
+        if row != self.top_row:
+            self.top_row = row
+            self.refresh()
+
+    def refresh(self):
+        first = self.lo + self.top_row * self.columns
+        for k, (box, label) in enumerate(self.slots):
+            index = first + k
+            if index < self.hi:
+                name = self.names[index]
+                self.canvas.itemconfigure(box, fill=process_color(name), state="normal")
+                self.canvas.itemconfigure(label, text=f"Process {name}", state="normal")
+            else:
+                self.canvas.itemconfigure(box, state="hidden")
+                self.canvas.itemconfigure(label, state="hidden")
+        matches = self.hi - self.lo
+        self.count_label.configure(text=f"{len(self.names)} processes" if matches == len(self.names) else f"{matches} of {len(self.names)} match")
+        total = self.total_rows()
+        self.scrollbar.set(self.top_row / total, min(1.0, (self.top_row + self.rows) / total))
+
+# Function to create color reference
+def create_color_reference(parent_frame, proc_list):
+    return ProcessLegend(parent_frame, set(proc.name for proc in proc_list))
 
-# Function to draw enhanced Gantt chart
+# Helper function to map each name in a Gantt chart to its color
+def gantt_process_colors(gantt_chart):
+    unique_processes = set(proc_name for proc_name, _ in gantt_chart if proc_name not in ("Idle", "Switch"))
+    process_colors = {proc_name: process_color(proc_name) for proc_name in unique_processes}
+    
+    # Add idle and context switch colors
+    process_colors["Idle"] = "#BDC3C7"
+    process_colors["Switch"] = COLORS['switch']
+    return process_colors
+
+# Function to draw enhanced Gantt chart, returning where it was drawn
 def draw_enhanced_gantt_chart(canvas, gantt_chart):
     canvas.delete("all")
+    light = ctk.get_appearance_mode() == "Light"
     
     # Calculate dimensions
     canvas.update_idletasks()
@@ -732,54 +1794,61 @@ def draw_enhanced_gantt_chart(canvas, gantt_chart):
     scale = chart_width / total_time
     
     # Create a mapping of process names to colors
-    unique_processes = list(set(proc_name for proc_name, _ in gantt_chart if proc_name != "Idle"))
-    process_colors = {}
-    for i, proc_name in enumerate(sorted(unique_processes)):
-        process_colors[proc_name] = COLORS['process_colors'][i % len(COLORS['process_colors'])]
-    
-    # Add idle color
-    process_colors["Idle"] = "#BDC3C7"
+    process_colors = gantt_process_colors(gantt_chart)
+    gradient_colors = {name: lighten_color(color, 0.3) for name, color in process_colors.items()}
     
     # Draw chart background
     canvas.create_rectangle(
         start_x - 5, start_y - 5, 
         start_x + chart_width + 5, start_y + height + 5,
-        fill=("gray95" if ctk.get_appearance_mode() == "Light" else "gray30"),
-        outline=("gray80" if ctk.get_appearance_mode() == "Light" else "gray50"),
+        fill=("gray95" if light else "gray30"),
+        outline=("gray80" if light else "gray50"),
         width=2
     )
     
     # Draw legend
     legend_y = start_y + height + 50
     legend_x = start_x
-    canvas.create_text(legend_x, legend_y, text="Legend:", fill=("black" if ctk.get_appearance_mode() == "Light" else "white"), font=("Arial", 10, "bold"), anchor="w")
+    canvas.create_text(legend_x, legend_y, text="Legend:", fill=("black" if light else "white"), font=("Arial", 10, "bold"), anchor="w")
     legend_x += 60
     
-    for proc_name in sorted(process_colors.keys()):
-        if proc_name != "Idle":  # Show idle separately
-            color = process_colors[proc_name]
-            # Draw color box
-            canvas.create_rectangle(legend_x, legend_y - 8, legend_x + 15, legend_y + 8, fill=color, outline="black")
-            # Draw process name
-            canvas.create_text(legend_x + 20, legend_y, text=f"Process {proc_name}", fill=("black" if ctk.get_appearance_mode() == "Light" else "white"), font=("Arial", 9), anchor="w")
-            legend_x += 100
+    # As many processes as fit on one line next to idle and switch; the color reference lists them all
+    proc_names = sorted((name for name in process_colors if name not in ("Idle", "Switch")), key=str.casefold)
+    fits = max(1, (canvas_width - legend_x - 220) // 100)
+    if len(proc_names) > fits:
+        fits -= 1
+    for proc_name in proc_names[:fits]:
+        color = process_colors[proc_name]
+        # Draw color box
+        canvas.create_rectangle(legend_x, legend_y - 8, legend_x + 15, legend_y + 8, fill=color, outline="black")
+        # Draw process name
+        canvas.create_text(legend_x + 20, legend_y, text=f"Process {proc_name}", fill=("black" if light else "white"), font=("Arial", 9), anchor="w")
+        legend_x += 100
+    if len(proc_names) > fits:
+        canvas.create_text(legend_x, legend_y, text=f"+{len(proc_names) - fits} more", fill=("black" if light else "white"), font=("Arial", 9, "italic"), anchor="w")
+        legend_x += 100
     
     # Add idle to legend
     if "Idle" in process_colors:
         canvas.create_rectangle(legend_x, legend_y - 8, legend_x + 15, legend_y + 8, fill=process_colors["Idle"], outline="black", stipple="gray50")
-        canvas.create_text(legend_x + 20, legend_y, text="Idle Time", fill=("black" if ctk.get_appearance_mode() == "Light" else "white"), font=("Arial", 9), anchor="w")
+        canvas.create_text(legend_x + 20, legend_y, text="Idle Time", fill=("black" if light else "white"), font=("Arial", 9), anchor="w")
+        legend_x += 100
     
-    # Draw processes
-    current_x = start_x
-    time_position = 0
+    # Add context switch overhead to legend only when the run had any
+    if any(proc_name == "Switch" for proc_name, _ in gantt_chart):
+        canvas.create_rectangle(legend_x, legend_y - 8, legend_x + 15, legend_y + 8, fill=process_colors["Switch"], outline="black")
+        canvas.create_text(legend_x + 20, legend_y, text="Context Switch", fill=("black" if light else "white"), font=("Arial", 9), anchor="w")
     
-    for i, (proc_name, duration) in enumerate(gantt_chart):
-        end_x = current_x + duration * scale
-        
+    # Draw processes at the positions of the shared layout stage
+    for i, (proc_name, time_position, duration, current_x, end_x, _) in enumerate(gantt_layout(gantt_chart, scale, start_x)):
         if proc_name == "Idle":
             color = process_colors["Idle"]
             text_color = "#2C3E50"
             pattern = "diagonal"
+        elif proc_name == "Switch":
+            color = process_colors["Switch"]
+            text_color = "white"
+            pattern = "switch"
         else:
             color = process_colors[proc_name]
             text_color = "white"
@@ -795,12 +1864,19 @@ def draw_enhanced_gantt_chart(canvas, gantt_chart):
             )
             
             # Add subtle gradient by drawing a lighter rectangle on top
-            gradient_color = lighten_color(color, 0.3)
+            gradient_color = gradient_colors[proc_name]
             canvas.create_rectangle(
                 current_x, start_y, end_x, start_y + height//3,
                 fill=gradient_color, outline="", stipple="gray25",
                 tags=f"gradient_{i}"
             )
+        elif pattern == "switch":
+            # Draw context switch overhead as a flat, narrower band
+            canvas.create_rectangle(
+                current_x, start_y + height // 4, end_x, start_y + height - height // 4,
+                fill=color, outline="white", width=1,
+                tags=f"process_{i}"
+            )
         else:
             # Draw diagonal stripes for idle time
             canvas.create_rectangle(
@@ -836,7 +1912,7 @@ def draw_enhanced_gantt_chart(canvas, gantt_chart):
             # Show duration inside the rectangle
             canvas.create_text(
                 (current_x + end_x) / 2, start_y + height / 2 + 8,
-                text=f"({duration})", fill=text_color, 
+                text=f"({format_time(duration)})", fill=text_color, 
                 font=("Arial", 9)
             )
         elif rect_width > 20:  # Show only process name if medium width
@@ -849,7 +1925,7 @@ def draw_enhanced_gantt_chart(canvas, gantt_chart):
         # Time markers
         canvas.create_text(
             current_x, start_y + height + 20,
-            text=str(time_position), fill=("black" if ctk.get_appearance_mode() == "Light" else "white"),
+            text=format_time(time_position), fill=("black" if light else "white"),
             font=("Arial", 10, "bold")
         )
         
@@ -857,23 +1933,22 @@ def draw_enhanced_gantt_chart(canvas, gantt_chart):
         canvas.create_line(
             current_x, start_y - 5,
             current_x, start_y + height + 5,
-            fill=("gray70" if ctk.get_appearance_mode() == "Light" else "gray60"),
+            fill=("gray70" if light else "gray60"),
             width=1
         )
-        
-        current_x = end_x
-        time_position += duration
     
     # Final time marker and grid line
+    current_x = start_x + total_time * scale
+    time_position = total_time
     canvas.create_text(
         current_x, start_y + height + 20,
-        text=str(time_position), fill=("black" if ctk.get_appearance_mode() == "Light" else "white"),
+        text=format_time(time_position), fill=("black" if light else "white"),
         font=("Arial", 10, "bold")
     )
     canvas.create_line(
         current_x, start_y - 5,
         current_x, start_y + height + 5,
-        fill=("gray70" if ctk.get_appearance_mode() == "Light" else "gray60"),
+        fill=("gray70" if light else "gray60"),
         width=1
     )
     
@@ -881,16 +1956,17 @@ def draw_enhanced_gantt_chart(canvas, gantt_chart):
     canvas.create_line(
         start_x, start_y + height + 15,
         current_x, start_y + height + 15,
-        fill=("gray50" if ctk.get_appearance_mode() == "Light" else "gray70"),
+        fill=("gray50" if light else "gray70"),
         width=2
     )
     
     # Add axis labels
     canvas.create_text(
         (start_x + current_x) / 2, start_y + height + 35,
-        text="Time →", fill=("black" if ctk.get_appearance_mode() == "Light" else "white"),
+        text="Time →", fill=("black" if light else "white"),
         font=("Arial", 10, "bold")
     )
+    return GanttGeometry(start_x, start_y, height, scale)
 
 # Helper function to lighten colors for gradient effect
 def lighten_color(color, factor):
@@ -905,23 +1981,1069 @@ def lighten_color(color, factor):
     # Convert back to hex
     return '#%02x%02x%02x' % lightened_rgb
 
+# Function to stream RGB pixel rows into a PNG file
+def write_png(f, width, height, rows):
+    """Write height rows of width * 3 RGB bytes each as a PNG image to f.
+
+    Rows may come from a generator; they are compressed as they arrive, so
+    memory does not depend on the image height.
+    """
+    def chunk(tag, data):
+        f.write(struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+    f.write(b"\x89PNG\r\n\x1a\n")
+    chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+    compressor = zlib.compressobj(6)
+    pending = []
+    pending_size = 0
+    for row in rows:
+        pending.append(compressor.compress(b"\x00" + bytes(row)))  # Filter type 0 on every row
+        pending_size += len(pending[-1])
+        if pending_size >= 1 << 16:
+            chunk(b"IDAT", b"".join(pending))
+            pending, pending_size = [], 0
+    pending.append(compressor.flush())
+    chunk(b"IDAT", b"".join(pending))
+    chunk(b"IEND", b"")
+
+# Function to encode RGB pixel rows as PNG bytes
+def encode_png(width, height, rows):
+    buffer = io.BytesIO()
+    write_png(buffer, width, height, rows)
+    return buffer.getvalue()
+
+# Helper function to turn "#rrggbb" into bytes
+def hex_to_rgb(color):
+    color = color.lstrip('#')
+    return bytes(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+# Charts with more segments than this are drawn as cached image tiles
+GANTT_TILE_THRESHOLD = 300
+GANTT_TILE_WIDTH = 256
+GANTT_TILE_CACHE = 96  # Tiles kept per chart, least recently used evicted first
+GANTT_MAX_ZOOM = 64  # Pixels per time unit at the deepest zoom level
+
+# Function to rasterise a strip of Gantt spans into pixel rows
+def gantt_raster_rows(width, height, background, spans, x_origin=0):
+    """Return height RGB rows for spans of (start px, stop px, kind, (base, light) colors, separator).
+
+    kind is "Idle", "Switch" or "" for a process.  Processes fill the strip
+    with a lighter top third, switches a narrower band, idle time gets
+    diagonal stripes (phased by x_origin so neighbouring strips line up),
+    and separator draws a white column where the span starts.  Rows are
+    shared between identical lines, so memory is O(width).
+    """
+    # Row templates: above the switch band, inside it above/below the gradient, and below it
+    top, band_top, band, bottom = (bytearray(background * width) for _ in range(4))
+    idle_spans = []
+    for start, stop, kind, (base, light), separator in spans:
+        if kind == "Switch":
+            band_top[start * 3:stop * 3] = band[start * 3:stop * 3] = base * (stop - start)
+        elif kind == "Idle":
+            top[start * 3:stop * 3] = band_top[start * 3:stop * 3] = base * (stop - start)
+            band[start * 3:stop * 3] = bottom[start * 3:stop * 3] = base * (stop - start)
+            idle_spans.append((start, stop))
+        else:
+            top[start * 3:stop * 3] = band_top[start * 3:stop * 3] = light * (stop - start)
+            band[start * 3:stop * 3] = bottom[start * 3:stop * 3] = base * (stop - start)
+        if separator and stop - start >= 3:
+            for row in (top, band_top, band, bottom):
+                row[start * 3:start * 3 + 3] = b"\xff\xff\xff"
+    stripe = hex_to_rgb("#999999")
+    rows = []
+    for y in range(height):
+        if y < height // 4:
+            row = top
+        elif y < height // 3:
+            row = band_top
+        elif y < height - height // 4:
+            row = band
+        else:
+            row = bottom
+        if idle_spans:
+            # Diagonal stripes over idle time, two pixels wide every eight
+            row = bytearray(row)
+            for start, stop in idle_spans:
+                for column in range(start + (-(x_origin + start + y)) % 8, stop, 8):
+                    row[column * 3:min(column + 2, stop) * 3] = stripe * (min(column + 2, stop) - column)
+        rows.append(row)
+    return rows
+
+# Function to lay out Gantt segments in pixel space, shared by every renderer
+def gantt_layout(gantt_chart, scale, start_x=0, lod_px=0):
+    """Yield (name, start time, duration, x0, x1, count) for each block to draw.
+
+    Walks gantt_chart once, holding only the current block, so any iterable
+    works.  With lod_px > 0, runs of segments narrower than lod_px pixels
+    are collapsed into blocks about lod_px wide, named after the member
+    that ran longest; count is the number of segments in the block.
+    """
+    time = 0
+    group = None  # [name, start, duration, longest member, count]
+    for proc_name, duration in gantt_chart:
+        if lod_px and duration * scale < lod_px:
+            if group is None:
+                group = [proc_name, time, 0, -1, 0]
+            group[2] += duration
+            group[4] += 1
+            if duration > group[3]:
+                group[0], group[3] = proc_name, duration
+            time += duration
+            if group[2] * scale >= lod_px:
+                yield (group[0], group[1], group[2], start_x + group[1] * scale, start_x + time * scale, group[4])
+                group = None
+            continue
+        if group is not None:
+            yield (group[0], group[1], group[2], start_x + group[1] * scale, start_x + time * scale, group[4])
+            group = None
+        yield (proc_name, time, duration, start_x + time * scale, start_x + (time + duration) * scale, 1)
+        time += duration
+    if group is not None:
+        yield (group[0], group[1], group[2], start_x + group[1] * scale, start_x + time * scale, group[4])
+
+# Helper function to pick round-numbered time ticks about spacing pixels apart
+def time_ticks(t0, t1, scale, spacing=100):
+    step = 10 ** math.floor(math.log10(max(1e-9, spacing / scale)))
+    for factor in (1, 2, 5, 10):
+        if step * factor * scale >= spacing:
+            step *= factor
+            break
+    tick = math.ceil(t0 / step) * step
+    while tick <= t1:
+        yield tick
+        tick += step
+
+# Rasteriser for Gantt chart tiles, safe to call from worker threads
+class GanttTileRenderer:
+    """Renders fixed-size tiles of a Gantt chart into PNG bytes.
+
+    Only reads data prepared in the constructor, so tiles can be rendered
+    on any thread.  Segments are found with bisect on their start times;
+    when a tile covers more segments than pixels, each pixel column shows
+    the segment under its centre instead.
+    """
+    def __init__(self, gantt_chart, process_colors, background, height=60):
+        self.height = height
+        self.starts = array('d')
+        self.kinds = []
+        rgb = {name: hex_to_rgb(color) for name, color in process_colors.items()}
+        gradient = {name: hex_to_rgb(lighten_color(color, 0.3)) for name, color in process_colors.items()}
+        self.colors = []
+        time = 0
+        for proc_name, duration in gantt_chart:
+            self.starts.append(time)
+            self.kinds.append(proc_name if proc_name in ("Idle", "Switch") else "")
+            self.colors.append((rgb[proc_name], gradient[proc_name]))
+            time += duration
+        self.starts.append(time)
+        self.total_time = time
+        self.background = hex_to_rgb(background)
+
+    def render(self, scale, index):
+        width = GANTT_TILE_WIDTH
+        x0 = index * width
+        starts, kinds, colors = self.starts, self.kinds, self.colors
+        last = len(starts) - 2
+        spans = []
+        first = max(0, bisect.bisect_right(starts, x0 / scale) - 1)
+        end = min(last + 1, bisect.bisect_left(starts, (x0 + width) / scale))
+        if end - first > width:
+            # Zoomed out: sample the segment under each pixel column
+            for column in range(width):
+                time = (x0 + column + 0.5) / scale
+                if time >= self.total_time:
+                    break
+                seg = bisect.bisect_right(starts, time) - 1
+                if spans and spans[-1][4] == seg:
+                    spans[-1][1] = column + 1
+                else:
+                    spans.append([column, column + 1, kinds[seg], colors[seg], seg])
+        else:
+            for seg in range(first, end):
+                start = max(0, round(starts[seg] * scale) - x0)
+                stop = min(width, round(starts[seg + 1] * scale) - x0)
+                if stop > start:
+                    spans.append([start, stop, kinds[seg], colors[seg], seg])
+        # A segment gets a separator only where it really begins, not where the tile cuts it
+        for span in spans:
+            span[4] = round(starts[span[4]] * scale) - x0 == span[0]
+        rows = gantt_raster_rows(width, self.height, self.background, spans, x0)
+        return encode_png(width, self.height, rows)
+
+# Worker threads shared by every tiled Gantt view
+_tile_executor = None
+
+def tile_executor():
+    global _tile_executor
+    if _tile_executor is None:
+        _tile_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gantt-tiles")
+    return _tile_executor
+
+# Zoomable, pannable Gantt chart drawn from cached image tiles
+class GanttTileView:
+    """Shows a large Gantt chart on a canvas as image tiles.
+
+    Zoom level 0 fits the whole run into the canvas and each level doubles
+    the scale.  Missing tiles are rendered on worker threads and turned
+    into PhotoImages on the main thread, kept in an LRU cache keyed by
+    appearance mode, scale (zoom level and canvas width) and tile index; a
+    tile that fails to render is cached blank.  Labels and the time axis
+    are drawn as canvas items for the visible part only.
+    Mouse wheel zooms around the pointer and dragging pans.
+    """
+    def __init__(self, canvas, gantt_chart, process_colors, start_x=60, start_y=40, height=60):
+        self.canvas = canvas
+        self.gantt_chart = gantt_chart
+        self.process_colors = process_colors
+        self.start_x, self.start_y, self.height = start_x, start_y, height
+        self.renderers = {}  # Appearance mode -> GanttTileRenderer
+        self.tiles = OrderedDict()
+        self.pending = {}
+        self.level = 0
+        self.offset = 0  # Pixels scrolled at the current level
+        self.drag_x = None
+        self.polling = False
+        self.render_failed = False  # Reported once, however many tiles fail
+        self.on_redraw = None  # Called after every redraw, e.g. by GanttInspector
+        self.total_time = sum(duration for _, duration in gantt_chart)
+        canvas.bind("<Configure>", self.resized)
+        canvas.bind("<MouseWheel>", lambda e: self.zoom(1 if e.delta > 0 else -1, e.x))
+        canvas.bind("<Button-4>", lambda e: self.zoom(1, e.x))
+        canvas.bind("<Button-5>", lambda e: self.zoom(-1, e.x))
+        canvas.bind("<ButtonPress-1>", self.start_drag)
+        canvas.bind("<B1-Motion>", self.drag)
+        self.redraw()
+
+    def view_width(self):
+        width = self.canvas.winfo_width()
+        return (width if width > 1 else 800) - 2 * self.start_x
+
+    def scale(self):
+        return self.view_width() / self.total_time * 2 ** self.level
+
+    def time_at(self, x):
+        return (x - self.start_x + self.offset) / self.scale()
+
+    def x_at(self, time):
+        return self.start_x + time * self.scale() - self.offset
+
+    def clamp_offset(self):
+        limit = max(0, self.total_time * self.scale() - self.view_width())
+        self.offset = min(max(0, self.offset), limit)
+
+    def zoom(self, step, pointer_x):
+        max_level = max(0, math.ceil(math.log2(max(1, GANTT_MAX_ZOOM * self.total_time / self.view_width()))))
+        level = min(max(0, self.level + step), max_level)
+        if level == self.level:
+            return
+        anchor = min(max(0, pointer_x - self.start_x), self.view_width())
+        self.offset = (self.offset + anchor) * 2 ** (level - self.level) - anchor
+        self.level = level
+        self.clamp_offset()
+        self.redraw()
+
+    def resized(self, event):
+        self.clamp_offset()
+        self.redraw()
+
+    def start_drag(self, event):
+        self.drag_x = event.x
+
+    def drag(self, event):
+        if self.drag_x is not None:
+            self.offset -= event.x - self.drag_x
+            self.drag_x = event.x
+            self.clamp_offset()
+            self.redraw()
+
+    def renderer(self, mode):
+        if mode not in self.renderers:
+            background = "#F2F2F2" if mode == "Light" else "#4D4D4D"
+            self.renderers[mode] = GanttTileRenderer(self.gantt_chart, self.process_colors, background, self.height)
+        return self.renderers[mode]
+
+    def redraw(self):
+        canvas = self.canvas
+        canvas.delete("gantt_tile", "gantt_overlay")
+        mode = ctk.get_appearance_mode()
+        text_color = "black" if mode == "Light" else "white"
+        scale = self.scale()
+        view_width = self.view_width()
+        first = int(self.offset // GANTT_TILE_WIDTH)
+        last = int((self.offset + view_width) // GANTT_TILE_WIDTH)
+        visible = set()
+        for index in range(first, last + 1):
+            key = (mode, scale, index)  # The scale changes with the zoom level and the canvas width
+            visible.add(key)
+            x = self.start_x + index * GANTT_TILE_WIDTH - self.offset
+            image = self.tiles.get(key)
+            if image is not None:
+                self.tiles.move_to_end(key)
+                canvas.create_image(x, self.start_y, image=image, anchor="nw", tags="gantt_tile")
+            elif key not in self.pending:
+                self.pending[key] = tile_executor().submit(self.renderer(mode).render, scale, index)
+        # Tiles that scrolled away before their turn came are dropped
+        for key in [key for key in self.pending if key not in visible]:
+            if self.pending[key].cancel():
+                del self.pending[key]
+        # Keep tiles from spilling over the margins
+        bg = canvas.cget("bg")
+        canvas.create_rectangle(0, self.start_y, self.start_x, self.start_y + self.height, fill=bg, outline="", tags="gantt_overlay")
+        canvas.create_rectangle(self.start_x + view_width, self.start_y, self.start_x * 2 + view_width, self.start_y + self.height,
+                                fill=bg, outline="", tags="gantt_overlay")
+        self.draw_overlay(scale, view_width, text_color)
+        if self.on_redraw is not None:
+            self.on_redraw()
+        if self.pending and not self.polling:
+            self.polling = True
+            canvas.after(16, self.poll)
+
+    def draw_overlay(self, scale, view_width, text_color):
+        canvas = self.canvas
+        t0 = self.offset / scale
+        t1 = (self.offset + view_width) / scale
+        starts = self.renderer(ctk.get_appearance_mode()).starts
+        first = max(0, bisect.bisect_right(starts, t0) - 1)
+        end = bisect.bisect_left(starts, t1)
+        # Names only where segments are wide enough, and only when few are visible
+        if end - first <= 200:
+            for seg in range(first, min(end, len(self.gantt_chart))):
+                proc_name, duration = self.gantt_chart[seg]
+                if duration * scale > 40 and proc_name not in ("Idle", "Switch"):
+                    x = self.start_x + (starts[seg] + duration / 2) * scale - self.offset
+                    if self.start_x <= x <= self.start_x + view_width:
+                        canvas.create_text(x, self.start_y + self.height / 2, text=proc_name, fill="white",
+                                           font=("Arial", 10, "bold"), tags="gantt_overlay")
+        # Time axis with about one tick per 100 pixels, on round numbers
+        axis_y = self.start_y + self.height + 15
+        canvas.create_line(self.start_x, axis_y, self.start_x + view_width, axis_y, fill=text_color, width=2, tags="gantt_overlay")
+        for tick in time_ticks(t0, t1, scale):
+            x = self.start_x + tick * scale - self.offset
+            canvas.create_line(x, axis_y - 4, x, axis_y + 4, fill=text_color, tags="gantt_overlay")
+            canvas.create_text(x, axis_y + 14, text=format_time(tick), fill=text_color, font=("Arial", 9), tags="gantt_overlay")
+        zoom = f"zoom x{2 ** self.level}" if self.level else "whole run"
+        canvas.create_text(self.start_x, self.start_y - 15, anchor="w", fill=text_color, font=("Arial", 9),
+                           text=f"{zoom}  ·  scroll to zoom, drag to pan", tags="gantt_overlay")
+
+    def poll(self):
+        self.polling = False
+        finished = [key for key, future in self.pending.items() if future.done()]
+        for key in finished:
+            future = self.pending.pop(key)
+            if future.cancelled():
+                continue
+            try:
+                image = tk.PhotoImage(data=base64.b64encode(future.result()))
+            except Exception as e:
+                # A failed tile stays blank instead of being requested again on every redraw
+                if not self.render_failed:
+                    self.render_failed = True
+                    print(f"Could not render a Gantt chart tile: {e}", file=sys.stderr)
+                image = tk.PhotoImage(width=GANTT_TILE_WIDTH, height=self.height)
+            self.tiles[key] = image
+            while len(self.tiles) > GANTT_TILE_CACHE:
+                self.tiles.popitem(last=False)
+        if finished:
+            self.redraw()
+        elif self.pending:
+            self.polling = True
+            self.canvas.after(16, self.poll)
+
+# Where a fully drawn Gantt chart sits on its canvas
+class GanttGeometry:
+    """Maps canvas x coordinates to times for draw_enhanced_gantt_chart."""
+    def __init__(self, start_x, start_y, height, scale):
+        self.start_x, self.start_y, self.height, self.scale = start_x, start_y, height, scale
+
+    def time_at(self, x):
+        return (x - self.start_x) / self.scale
+
+    def x_at(self, time):
+        return self.start_x + time * self.scale
+
+# Interval index over a Gantt chart's timeline
+class GanttIndex:
+    """Finds the segment running at a given time in O(log n).
+
+    starts holds the prefix sums of the durations (one extra entry for the
+    end of the run), so the segment at time t is the last start <= t.
+    """
+    def __init__(self, gantt_chart):
+        self.gantt_chart = gantt_chart
+        self.starts = array('d', accumulate((duration for _, duration in gantt_chart), initial=0))
+        self.total_time = self.starts[-1]
+
+    def segment_at(self, time):
+        """Return (index, name, start, duration) of the segment at time, or None outside the run."""
+        if not 0 <= time < self.total_time:
+            return None
+        index = bisect.bisect_right(self.starts, time) - 1
+        proc_name, duration = self.gantt_chart[index]
+        return index, proc_name, self.starts[index], duration
+
+# Hover tooltips and click-to-select on a Gantt chart canvas
+class GanttInspector:
+    """Shows what ran under the pointer and reports clicked segments.
+
+    A GanttIndex answers every lookup, so the canvas needs three bindings
+    in total instead of one per drawn item.  view is a GanttGeometry or a
+    GanttTileView; on_select(proc_name, start, duration) gets clicks on a
+    segment, and on_select(None, None, None) clicks beside the chart.
+    """
+    def __init__(self, canvas, gantt_chart, view, on_select=None):
+        self.canvas = canvas
+        self.view = view
+        self.index = GanttIndex(gantt_chart)
+        self.on_select = on_select
+        self.selected = None  # (start, duration) of the clicked segment
+        self.press_x = None
+        canvas.bind("<Motion>", self.hover, add="+")
+        canvas.bind("<Leave>", lambda e: canvas.delete("gantt_tooltip"), add="+")
+        canvas.bind("<ButtonPress-1>", self.press, add="+")
+        canvas.bind("<ButtonRelease-1>", self.release, add="+")
+        if isinstance(view, GanttTileView):
+            view.on_redraw = self.draw_selection
+
+    def segment_under(self, x, y):
+        view = self.view
+        if not view.start_y <= y <= view.start_y + view.height:
+            return None
+        return self.index.segment_at(view.time_at(x))
+
+    def hover(self, event):
+        canvas = self.canvas
+        canvas.delete("gantt_tooltip")
+        segment = self.segment_under(event.x, event.y)
+        if segment is None:
+            return
+        _, proc_name, start, duration = segment
+        label = {"Idle": "Idle", "Switch": "Context switch"}.get(proc_name, f"Process {proc_name}")
+        text = f"{label}\n{format_time(start)} → {format_time(start + duration)} ({format_time(duration)})"
+        light = ctk.get_appearance_mode() == "Light"
+        # Keep the tooltip inside the canvas on the right-hand side
+        anchor = "ne" if event.x > canvas.winfo_width() - 160 else "nw"
+        x = event.x - 12 if anchor == "ne" else event.x + 12
+        item = canvas.create_text(x, event.y + 12, text=text, anchor=anchor, font=("Arial", 9),
+                                  fill=("black" if light else "white"), tags="gantt_tooltip")
+        x0, y0, x1, y1 = canvas.bbox(item)
+        box = canvas.create_rectangle(x0 - 4, y0 - 3, x1 + 4, y1 + 3, fill=("lightyellow" if light else "gray15"),
+                                      outline=("gray50" if light else "gray70"), tags="gantt_tooltip")
+        canvas.tag_lower(box, item)
+
+    def press(self, event):
+        self.press_x = event.x
+
+    def release(self, event):
+        # A drag that pans the tiled view is not a click
+        if self.press_x is None or abs(event.x - self.press_x) > 3:
+            return
+        self.press_x = None
+        segment = self.segment_under(event.x, event.y)
+        if segment is None:
+            self.selected = None
+            self.draw_selection()
+            if self.on_select is not None:
+                self.on_select(None, None, None)
+            return
+        _, proc_name, start, duration = segment
+        self.selected = (start, duration)
+        self.draw_selection()
+        if self.on_select is not None:
+            self.on_select(proc_name, start, duration)
+
+    def draw_selection(self):
+        canvas = self.canvas
+        canvas.delete("gantt_selected")
+        if self.selected is not None:
+            start, duration = self.selected
+            view = self.view
+            # Clip to the visible part of the chart (the tiled view may be zoomed in)
+            x0 = max(view.x_at(start), view.start_x)
+            x1 = min(view.x_at(start + duration), view.x_at(self.index.total_time), canvas.winfo_width() - view.start_x)
+            if x1 >= x0:
+                canvas.create_rectangle(x0, view.start_y - 2, max(x1, x0 + 2), view.start_y + view.height + 2,
+                                        outline=COLORS['warning'], width=3, tags="gantt_selected")
+        canvas.tag_raise("gantt_tooltip")
+
+REPLAY_QUEUE_ROWS = 12  # Waiting processes shown by the replay window
+
+# Index over a finished run for stepping and seeking through its timeline
+class TimelineReplay:
+    """Reconstructs what the scheduler looked like at any moment of a run.
+
+    Everything is precomputed once from the engine output, so any time can
+    be looked up directly in O(log n): arrival and completion times are
+    kept sorted for counting, a max-tree over completion times in arrival
+    order finds the processes still in the system, the running segment
+    comes from a GanttIndex and remaining times from per-process prefix
+    sums of CPU time.
+    """
+    def __init__(self, proc_list, gantt_chart):
+        self.procs = sorted(proc_list, key=lambda p: p.arrival_time)
+        self.index = GanttIndex(gantt_chart)
+        self.slots = {proc.name: i for i, proc in enumerate(self.procs)}
+        self.arrivals = array('d', (proc.arrival_time for proc in self.procs))
+        # Processes that never finished stay in the system for good
+        completions = [proc.completion_time if proc.completion_time > proc.arrival_time else math.inf for proc in self.procs]
+        self.completions = array('d', sorted(completions))
+        # Max-tree over completion times, leaves in arrival order
+        self.size = 1 << max(0, len(completions) - 1).bit_length()
+        self.tree = array('d', repeat(-math.inf, 2 * self.size))
+        self.tree[self.size:self.size + len(completions)] = array('d', completions)
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+        # Start of each CPU segment and CPU time received before it, per process
+        self.cpu_starts = [array('d') for _ in self.procs]
+        self.cpu_before = [array('d', [0]) for _ in self.procs]
+        time = 0
+        for proc_name, duration in gantt_chart:
+            i = self.slots.get(proc_name)
+            if i is not None:
+                self.cpu_starts[i].append(time)
+                self.cpu_before[i].append(self.cpu_before[i][-1] + duration)
+            time += duration
+        # CPU time owed over the whole run; a periodic process owes a burst for every job it ran
+        self.demand = [before[-1] if proc.period else sum(proc.bursts[0::2])
+                       for proc, before in zip(self.procs, self.cpu_before)]
+
+    def in_system_from(self, i, time):
+        """Return the first process index >= i that completes after time (len(procs) if none)."""
+        tree, size = self.tree, self.size
+        node = i + size
+        if node >= 2 * size:
+            return len(self.procs)
+        # Climb to the first subtree at or right of i that holds one
+        while tree[node] <= time:
+            while node & 1:
+                node >>= 1
+            if node == 0:
+                return len(self.procs)
+            node += 1
+        while node < size:
+            node = 2 * node if tree[2 * node] > time else 2 * node + 1
+        return node - size
+
+    def remaining(self, i, time):
+        demand = self.demand[i]
+        proc = self.procs[i]
+        if proc.period and time >= proc.arrival_time:
+            # Only the jobs released by time are owed so far
+            demand = min(demand, (int((time - proc.arrival_time) // proc.period) + 1) * proc.burst_time)
+        starts = self.cpu_starts[i]
+        j = bisect.bisect_right(starts, time) - 1
+        if j < 0:
+            return demand
+        before = self.cpu_before[i]
+        executed = before[j] + min(time - starts[j], before[j + 1] - before[j])
+        return max(0, demand - executed)
+
+    def frame(self, time, limit=REPLAY_QUEUE_ROWS):
+        """Return the state at time as a dict.
+
+        running is (name, start, duration) of the segment at time or None,
+        waiting the first limit processes in the system but not running as
+        (name, remaining CPU time), in arrival order.
+        """
+        segment = self.index.segment_at(time)
+        running = segment[1:] if segment is not None else None
+        running_slot = self.slots.get(running[0]) if running is not None else None
+        arrived = bisect.bisect_right(self.arrivals, time)
+        completed = bisect.bisect_right(self.completions, time)
+        waiting = []
+        i = self.in_system_from(0, time)
+        while i < arrived and len(waiting) < limit:
+            if i != running_slot:
+                waiting.append((self.procs[i].name, self.remaining(i, time)))
+            i = self.in_system_from(i + 1, time)
+        running_present = running_slot is not None and running_slot < arrived and self.tree[self.size + running_slot] > time
+        return {
+            'time': time,
+            'running': running,
+            'running_remaining': self.remaining(running_slot, time) if running_slot is not None else None,
+            'waiting': waiting,
+            'waiting_count': arrived - completed - running_present,
+            'completed': completed,
+        }
+
+    def next_boundary(self, time):
+        """Return the first segment boundary after time (the end of the run at most)."""
+        starts = self.index.starts
+        return starts[min(bisect.bisect_right(starts, time), len(starts) - 1)]
+
+    def previous_boundary(self, time):
+        """Return the last segment boundary before time (0 at least)."""
+        return self.index.starts[max(0, bisect.bisect_left(self.index.starts, time) - 1)]
+
+# Colors of the exported Gantt charts
+GANTT_EXPORT_THEMES = {
+    "light": {"background": "#FFFFFF", "chart": "#F2F2F2", "text": "#000000", "axis": "#808080"},
+    "dark": {"background": "#2B2B2B", "chart": "#4D4D4D", "text": "#FFFFFF", "axis": "#B3B3B3"},
+}
+
+SVG_LEGEND_ROWS = 4  # Processes past these legend rows are only counted
+
+# Helper function to check the options shared by the Gantt exporters
+def gantt_export_setup(gantt_chart, width, theme):
+    if theme not in GANTT_EXPORT_THEMES:
+        raise ValueError(f"Unknown theme {theme}; use one of {', '.join(GANTT_EXPORT_THEMES)}")
+    total_time = sum(duration for _, duration in gantt_chart)
+    if total_time <= 0:
+        raise ValueError("The Gantt chart is empty.")
+    if width < 200:
+        raise ValueError("The image must be at least 200 pixels wide.")
+    return total_time, gantt_process_colors(gantt_chart), GANTT_EXPORT_THEMES[theme]
+
+# Function to write a Gantt chart as SVG without a display
+def write_gantt_svg(path, gantt_chart, width=1200, lod_px=1.0, theme="light"):
+    """Stream gantt_chart into an SVG file and return the number of blocks drawn.
+
+    gantt_chart may be any re-iterable sequence of (name, duration); it is
+    walked once for the totals and once through gantt_layout while the
+    elements are written, so memory does not grow with the number of
+    segments.  lod_px collapses runs of narrower segments (0 draws all).
+    """
+    total_time, process_colors, colors = gantt_export_setup(gantt_chart, width, theme)
+    start_x, start_y, height = 60, 40, 60
+    scale = (width - 2 * start_x) / total_time
+    legend_names = sorted((name for name in process_colors if name not in ("Idle", "Switch")), key=str.casefold)
+    per_row = max(1, (width - 2 * start_x) // 110)
+    # At most SVG_LEGEND_ROWS rows, the last ending with idle, switch and a count of the rest
+    shown = min(len(legend_names), max(0, per_row * SVG_LEGEND_ROWS - 3))
+    hidden = len(legend_names) - shown
+    legend_names = legend_names[:shown] + ["Idle", "Switch"] + ([f"+{hidden} more"] if hidden else [])
+    legend_y = start_y + height + 60
+    image_height = legend_y + 22 * math.ceil(len(legend_names) / per_row) + 10
+    blocks = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{image_height}" '
+                f'viewBox="0 0 {width} {image_height}" font-family="Arial, sans-serif">\n')
+        f.write(f'<defs><pattern id="idle" width="8" height="8" patternUnits="userSpaceOnUse">'
+                f'<rect width="8" height="8" fill="{process_colors["Idle"]}"/>'
+                f'<path d="M0,8 L8,0" stroke="#999999" stroke-width="2"/></pattern></defs>\n')
+        f.write(f'<rect width="100%" height="100%" fill="{colors["background"]}"/>\n')
+        f.write(f'<rect x="{start_x - 5}" y="{start_y - 5}" width="{width - 2 * start_x + 10}" height="{height + 10}" '
+                f'fill="{colors["chart"]}" stroke="{colors["axis"]}" stroke-width="2"/>\n')
+        for proc_name, start, duration, x0, x1, count in gantt_layout(gantt_chart, scale, start_x, lod_px):
+            blocks += 1
+            w = x1 - x0
+            if proc_name == "Switch":
+                f.write(f'<rect x="{x0:.2f}" y="{start_y + height // 4}" width="{w:.2f}" height="{height - 2 * (height // 4)}" fill="{process_colors["Switch"]}"/>\n')
+            elif proc_name == "Idle":
+                f.write(f'<rect x="{x0:.2f}" y="{start_y}" width="{w:.2f}" height="{height}" fill="url(#idle)"/>\n')
+            else:
+                color = process_colors[proc_name]
+                f.write(f'<rect x="{x0:.2f}" y="{start_y}" width="{w:.2f}" height="{height}" fill="{color}"/>\n')
+                if w >= 3:
+                    f.write(f'<rect x="{x0:.2f}" y="{start_y}" width="{w:.2f}" height="{height // 3}" fill="{lighten_color(color, 0.3)}"/>\n')
+                if w > 40 and count == 1:
+                    f.write(f'<text x="{(x0 + x1) / 2:.2f}" y="{start_y + height / 2 + 4}" fill="white" font-size="11" '
+                            f'font-weight="bold" text-anchor="middle">{html.escape(proc_name)}</text>\n')
+        axis_y = start_y + height + 15
+        f.write(f'<line x1="{start_x}" y1="{axis_y}" x2="{width - start_x}" y2="{axis_y}" stroke="{colors["axis"]}" stroke-width="2"/>\n')
+        for tick in time_ticks(0, total_time, scale):
+            x = start_x + tick * scale
+            f.write(f'<line x1="{x:.2f}" y1="{axis_y - 4}" x2="{x:.2f}" y2="{axis_y + 4}" stroke="{colors["axis"]}"/>'
+                    f'<text x="{x:.2f}" y="{axis_y + 18}" fill="{colors["text"]}" font-size="10" text-anchor="middle">{format_time(tick)}</text>\n')
+        for i, name in enumerate(legend_names):
+            x = start_x + (i % per_row) * 110
+            y = legend_y + (i // per_row) * 22
+            if i == shown + 2:
+                f.write(f'<text x="{x}" y="{y + 4}" fill="{colors["text"]}" font-size="10" font-style="italic">{name}</text>\n')
+                continue
+            fill = "url(#idle)" if name == "Idle" else process_colors[name]
+            label = {"Idle": "Idle Time", "Switch": "Context Switch"}.get(name, f"Process {name}")
+            f.write(f'<rect x="{x}" y="{y - 8}" width="15" height="15" fill="{fill}" stroke="black"/>'
+                    f'<text x="{x + 20}" y="{y + 4}" fill="{colors["text"]}" font-size="10">{html.escape(label)}</text>\n')
+        f.write("</svg>\n")
+    return blocks
+
+# Function to write a Gantt chart as PNG without a display
+def write_gantt_png(path, gantt_chart, width=1200, lod_px=1.0, theme="light"):
+    """Stream gantt_chart into a PNG image of the chart strip and time axis.
+
+    Segments go through gantt_layout (collapsing anything under a pixel,
+    whatever lod_px says) straight into one strip of pixel rows, so memory
+    is O(width) however many segments there are.  PNG has no text; use
+    write_gantt_svg for labels and a legend.
+    """
+    total_time, process_colors, colors = gantt_export_setup(gantt_chart, width, theme)
+    margin, bar_height = 20, 60
+    scale = (width - 2 * margin) / total_time
+    rgb = {name: (hex_to_rgb(color), hex_to_rgb(lighten_color(color, 0.3))) for name, color in process_colors.items()}
+    background = hex_to_rgb(colors["background"])
+    axis = hex_to_rgb(colors["axis"])
+
+    def spans():
+        for proc_name, start, duration, x0, x1, count in gantt_layout(gantt_chart, scale, margin, max(lod_px, 1.0)):
+            a, b = round(x0), round(x1)
+            if b > a:
+                yield (a, b, proc_name if proc_name in ("Idle", "Switch") else "", rgb[proc_name], count == 1)
+    bar_rows = gantt_raster_rows(width, bar_height, background, spans())
+    axis_row = bytearray(background * width)
+    axis_row[margin * 3:(width - margin) * 3] = axis * (width - 2 * margin)
+    tick_row = bytearray(background * width)
+    for tick in time_ticks(0, total_time, scale):
+        x = min(width - 1, round(margin + tick * scale))
+        tick_row[x * 3:x * 3 + 3] = axis
+    blank = bytes(background * width)
+
+    def rows():
+        for _ in range(margin):
+            yield blank
+        yield from bar_rows
+        for _ in range(6):
+            yield blank
+        yield axis_row
+        yield axis_row
+        for _ in range(6):
+            yield tick_row
+        for _ in range(margin):
+            yield blank
+    with open(path, "wb") as f:
+        write_png(f, width, 2 * margin + bar_height + 14, rows())
+
+# Gantt chart of a run written by export_run, streamed from its .npy columns
+class ExportedGantt:
+    """Iterates (name, duration) over an exported run without loading it.
+
+    The columns are memory-mapped, so iterating does not depend on the
+    size of the run and can be repeated.
+    """
+    def __init__(self, directory):
+        with open(os.path.join(directory, "metadata.json")) as f:
+            self.metadata = json.load(f)
+        self.directory = directory
+        self.names = self.metadata["process_names"]
+
+    def __len__(self):
+        return self.metadata["num_segments"]
+
+    def __iter__(self):
+        durations = read_npy_column(os.path.join(self.directory, "gantt_duration.npy"))
+        owners = read_npy_column(os.path.join(self.directory, "gantt_process.npy"))
+        names = self.names
+        for owner, duration in zip(owners, durations):
+            yield (names[owner] if owner >= 0 else ("Idle" if owner == -1 else "Switch"), duration)
+
+# Command line: render an exported run's Gantt chart without opening a window
+def export_gantt_command(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog="pg.py export-gantt",
+                                     description="Render the Gantt chart of a run saved with Export Run as SVG or PNG.")
+    parser.add_argument("run_directory")
+    parser.add_argument("output", help="output file, .svg or .png")
+    parser.add_argument("--width", type=int, default=1200)
+    parser.add_argument("--lod", type=float, default=1.0, help="collapse segments narrower than this many pixels (0 = off)")
+    parser.add_argument("--theme", choices=sorted(GANTT_EXPORT_THEMES), default="light")
+    args = parser.parse_args(argv)
+    gantt_chart = ExportedGantt(args.run_directory)
+    # Tick labels in the units the run's times were typed in
+    set_time_resolution(len(str(gantt_chart.metadata.get("time_scale", 1))) - 1)
+    writer = write_gantt_png if args.output.lower().endswith(".png") else write_gantt_svg
+    writer(args.output, gantt_chart, args.width, args.lod, args.theme)
+
+# Helper function to find the 0-based nearest rank of quantile q among count sorted values
+def quantile_rank(q, count):
+    return max(math.ceil(q * count) - 1, 0)
+
+# Streaming quantile estimator with bounded memory
+class QuantileSketch:
+    """Quantiles of a stream of values in one pass.
+
+    Up to exact_limit values are kept as-is and quantiles are exact.  Past
+    that they are folded into logarithmic buckets, so any quantile is within
+    the given relative accuracy and memory grows only with log(max / min),
+    not with the number of values.
+    """
+    def __init__(self, accuracy=0.01, exact_limit=4096):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.exact_limit = exact_limit
+        self.exact = []  # None once the sketch switched to buckets
+        self.buckets = Counter()  # (sign, bucket index) -> count
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.exact is None:
+            self._add_to_bucket(value)
+        else:
+            self.exact.append(value)
+            if len(self.exact) > self.exact_limit:
+                for kept in self.exact:
+                    self._add_to_bucket(kept)
+                self.exact = None
+
+    def _add_to_bucket(self, value):
+        if value == 0:
+            self.buckets[(0, 0)] += 1
+        else:
+            sign = 1 if value > 0 else -1
+            self.buckets[(sign, math.ceil(math.log(abs(value)) / self.log_gamma))] += 1
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def quantile(self, q):
+        """Return the nearest-rank q quantile, e.g. q=0.95 for p95 (the largest of up to 20 values)."""
+        if not self.count:
+            return 0
+        rank = quantile_rank(q, self.count)
+        if self.exact is not None:
+            self.exact.sort()
+            return self.exact[rank]
+        if rank == 0 or rank == self.count - 1:
+            return self.min if rank == 0 else self.max
+        # Negative buckets (largest magnitude first), zero, then positive buckets
+        ordered = sorted(self.buckets.items(), key=lambda item: (item[0][0], item[0][1] * item[0][0]))
+        seen = 0
+        for (sign, index), count in ordered:
+            seen += count
+            if seen > rank:
+                if sign == 0:
+                    return 0
+                estimate = sign * 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+# Percentiles reported for every run
+PERCENTILES = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+
+# Function to summarise per-process metrics in a single pass
+def summarize_processes(proc_list):
+    turnaround = QuantileSketch()
+    waiting = QuantileSketch()
+    response = QuantileSketch()
+    summary = {'makespan': 0, 'completed_jobs': 0, 'io_time': 0, 'io_wait_time': 0, 'lateness': Counter()}
+    for proc in proc_list:
+        turnaround.add(proc.turnaround_time)
+        waiting.add(proc.waiting_time)
+        if proc.response_time != -1:
+            response.add(proc.response_time)
+        if proc.completion_time > summary['makespan']:
+            summary['makespan'] = proc.completion_time
+        summary['completed_jobs'] += max(1, proc.jobs_completed)
+        summary['io_time'] += proc.io_time
+        summary['io_wait_time'] += proc.io_wait_time
+        if proc.lateness_counts:
+            summary['lateness'].update(proc.lateness_counts)
+    summary['sketches'] = {'turnaround': turnaround, 'waiting': waiting, 'response': response}
+    summary['percentiles'] = {
+        metric: {label: sketch.quantile(q) for label, q in PERCENTILES}
+        for metric, sketch in summary['sketches'].items()
+    }
+    return summary
+
+# Function to compute the summary metrics of a finished run
+def compute_run_metrics(proc_list, gantt_chart):
+    summary = summarize_processes(proc_list)
+    sketches = summary['sketches']
+    metrics = {
+        'avg_turnaround': sketches['turnaround'].mean(),
+        'avg_waiting': sketches['waiting'].mean(),
+        'avg_response': sketches['response'].mean(),
+        'percentiles': summary['percentiles'],
+        'cpu_utilization': 0, 'throughput': 0, 'io_utilization': 0,
+        'makespan': summary['makespan'],
+        'avg_io_wait': summary['io_wait_time'] / len(proc_list) if proc_list else 0
+    }
+    total_completion_time = summary['makespan']
+    if total_completion_time > 0:
+        # Busy time comes from the timeline so periodic processes count every job they ran
+        busy_time = sum(duration for proc_name, duration in gantt_chart if proc_name not in ("Idle", "Switch"))
+        metrics['cpu_utilization'] = busy_time / total_completion_time * 100
+        metrics['throughput'] = summary['completed_jobs'] / total_completion_time
+        # Device metrics only exist for runs with I/O bursts
+        metrics['io_utilization'] = summary['io_time'] / total_completion_time * 100
+
+    # Context switches are counted from the timeline so they are reported even without overhead
+    metrics['context_switches'] = count_context_switches(gantt_chart)
+
+    # Deadline metrics only exist for runs of the real-time engines
+    deadline_jobs, deadline_misses, miss_ratio = deadline_metrics(summary['lateness'])
+    metrics.update(deadline_jobs=deadline_jobs, deadline_misses=deadline_misses, miss_ratio=miss_ratio, lateness=summary['lateness'])
+    return metrics
+
+# Helper function to convert a time from engine units to the units it was typed in
+def unscale_time(value, time_scale):
+    return value if time_scale == 1 or value is None else value / time_scale
+
+# Function to convert compute_run_metrics() results to the units the times were typed in
+def unscale_metrics(metrics, time_scale):
+    if time_scale == 1:
+        return metrics
+    metrics = dict(metrics)
+    for key in ('avg_turnaround', 'avg_waiting', 'avg_response', 'makespan', 'avg_io_wait'):
+        metrics[key] /= time_scale
+    metrics['throughput'] *= time_scale
+    metrics['percentiles'] = {metric: {label: value / time_scale for label, value in values.items()}
+                              for metric, values in metrics['percentiles'].items()}
+    metrics['lateness'] = Counter({value / time_scale: count for value, count in metrics['lateness'].items()})
+    return metrics
+
+# Helper function to count context switches in a Gantt chart
+def count_context_switches(gantt_chart):
+    """Count how often the CPU changes from one process to a different one.
+
+    Idle and switch-overhead segments are skipped, so a process resuming
+    after an idle gap is only counted if a different process ran before it.
+    """
+    switches = 0
+    last_name = None
+    for proc_name, _ in gantt_chart:
+        if proc_name in ("Idle", "Switch"):
+            continue
+        if last_name is not None and proc_name != last_name:
+            switches += 1
+        last_name = proc_name
+    return switches
+
+# Number of windows kept per telemetry series
+TELEMETRY_WINDOWS = 256
+
+# Down-sampled load series of a run held in fixed-size buffers
+class Telemetry:
+    """Ready-queue depth, CPU busy fraction and completions per time window.
+
+    Every series is a fixed array of `capacity` windows.  When an event
+    falls past the last window, neighbouring windows are merged pairwise and
+    the window width doubles, so memory never grows with the length of the
+    run.  Queue depth is kept as per-window step deltas plus their integral
+    inside the window, which makes every update O(1) and lets events arrive
+    in any order.
+    """
+    def __init__(self, capacity=TELEMETRY_WINDOWS, window=1):
+        self.capacity = capacity
+        self.window = window
+        self.busy = array('d', [0.0]) * capacity
+        self.steps = array('q', [0]) * capacity
+        self.partial = array('d', [0.0]) * capacity
+        self.completions = array('q', [0]) * capacity
+        self.end_time = 0
+
+    def _fit(self, time):
+        if time > self.end_time:
+            self.end_time = time
+        while time >= self.capacity * self.window:
+            self._compact()
+
+    def _compact(self):
+        window = self.window
+        half = self.capacity // 2
+        for i in range(half):
+            a, b = 2 * i, 2 * i + 1
+            self.busy[i] = self.busy[a] + self.busy[b]
+            # Steps of the first half stay in the system for the whole second half
+            self.partial[i] = self.partial[a] + window * self.steps[a] + self.partial[b]
+            self.steps[i] = self.steps[a] + self.steps[b]
+            self.completions[i] = self.completions[a] + self.completions[b]
+        for i in range(half, self.capacity):
+            self.busy[i] = self.partial[i] = 0
+            self.steps[i] = self.completions[i] = 0
+        self.window = window * 2
+
+    def add_step(self, time, delta):
+        """Change the number of processes in the system by delta at time."""
+        self._fit(time)
+        index = time // self.window
+        self.steps[index] += delta
+        self.partial[index] += delta * ((index + 1) * self.window - time)
+
+    def add_busy(self, start, duration):
+        if duration <= 0:
+            return
+        self._fit(start + duration)
+        end = start + duration
+        while start < end:
+            index = start // self.window
+            window_end = min(end, (index + 1) * self.window)
+            self.busy[index] += window_end - start
+            start = window_end
+
+    def add_completion(self, time):
+        self._fit(time)
+        self.completions[time // self.window] += 1
+
+    def series(self):
+        """Return (window start, avg ready depth, busy fraction, completions) rows."""
+        rows = []
+        in_system = 0
+        window = self.window
+        for index in range(min(self.capacity, self.end_time // window + 1)):
+            start = index * window
+            # The last window is only as long as the run
+            length = min(window, self.end_time - start)
+            if length <= 0:
+                # Completions at the very end of the run belong to the last window
+                if rows:
+                    rows[-1] = rows[-1][:3] + (rows[-1][3] + self.completions[index],)
+                break
+            occupied = in_system * length + self.partial[index] - self.steps[index] * (window - length)
+            busy = self.busy[index]
+            rows.append((start, max(0.0, (occupied - busy) / length), busy / length, self.completions[index]))
+            in_system += self.steps[index]
+        return rows
+
+# Function to build the telemetry series of a finished run in one pass
+def build_telemetry(proc_list, gantt_chart, capacity=TELEMETRY_WINDOWS):
+    """A process counts as ready from each release until its job is done, except while blocked on I/O."""
+    telemetry = Telemetry(capacity)
+    periodic = {proc.name: proc for proc in proc_list if proc.period}
+    used = Counter()  # CPU time each periodic process has had so far
+    time = 0
+    for proc_name, duration in gantt_chart:
+        if proc_name not in ("Idle", "Switch"):
+            telemetry.add_busy(time, duration)
+            proc = periodic.get(proc_name)
+            if proc is not None:
+                # A process's jobs run in release order, so job j is done after (j + 1) bursts of CPU
+                before = used[proc_name]
+                used[proc_name] += duration
+                for job in range(before // proc.burst_time, used[proc_name] // proc.burst_time):
+                    finish = time + (job + 1) * proc.burst_time - before
+                    telemetry.add_step(proc.arrival_time + job * proc.period, 1)
+                    telemetry.add_step(finish, -1)
+                    telemetry.add_completion(finish)
+        time += duration
+    for proc in proc_list:
+        if proc.period:
+            continue
+        telemetry.add_step(proc.arrival_time, 1)
+        telemetry.add_step(proc.completion_time, -1)
+        telemetry.add_completion(proc.completion_time)
+        if len(proc.bursts) > 1:
+            for blocked, unblocked in proc.blocked_spans:
+                telemetry.add_step(blocked, -1)
+                telemetry.add_step(unblocked, 1)
+    return telemetry
+
 # Function to create statistics cards
-def create_stats_cards(parent_frame, avg_tat, avg_wt, avg_rt, cpu_util, num_processes):
+def create_stats_cards(parent_frame, avg_tat, avg_wt, avg_rt, cpu_util, num_processes, num_switches=0, throughput=0, extra_stats=()):
     # Create grid of stat cards
     stats = [
-        ("⏱️", "Avg Turnaround Time", f"{avg_tat:.2f}", COLORS['primary']),
-        ("⏳", "Avg Waiting Time", f"{avg_wt:.2f}", COLORS['warning']),
-        ("🚀", "Avg Response Time", f"{avg_rt:.2f}", COLORS['info']),
+        ("⏱️", "Avg Turnaround Time", format_time(avg_tat, 2), COLORS['primary']),
+        ("⏳", "Avg Waiting Time", format_time(avg_wt, 2), COLORS['warning']),
+        ("🚀", "Avg Response Time", format_time(avg_rt, 2), COLORS['info']),
         ("📊", "CPU Utilization", f"{cpu_util:.1f}%", COLORS['success']),
+        ("🔁", "Context Switches", str(num_switches), COLORS['danger']),
+        ("📦", "Throughput (proc/unit)", f"{throughput * time_scale:.3f}", COLORS['secondary']),
         ("🔢", "Total Processes", str(num_processes), COLORS['accent'])
     ]
+    stats.extend(extra_stats)
     
     cards_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
     cards_frame.pack(fill='x', padx=0, pady=10)
     
     for i, (icon, label, value, color) in enumerate(stats):
         card = ctk.CTkFrame(cards_frame, corner_radius=15, height=120)
-        card.grid(row=0, column=i, padx=8, pady=5, sticky="ew")
+        card.grid(row=i // 5, column=i % 5, padx=8, pady=5, sticky="ew")
         card.grid_propagate(False)
         
         # Icon
@@ -947,20 +3069,99 @@ def create_stats_cards(parent_frame, avg_tat, avg_wt, avg_rt, cpu_util, num_proc
         )
         label_label.pack(pady=(0, 15))
         
-        cards_frame.grid_columnconfigure(i, weight=1)
+        cards_frame.grid_columnconfigure(i % 5, weight=1)
 
-# Function to create enhanced table
-def create_enhanced_table(parent_frame, proc_list):
-    table_container = ctk.CTkFrame(parent_frame, corner_radius=10, fg_color=("white", "gray25"))
-    table_container.pack(fill='both', expand=True, padx=15, pady=(0, 15))
-    
-    # Create Treeview with custom styling
+# Function to draw the lateness histogram of real-time jobs
+def create_lateness_histogram(parent_frame, lateness, max_bins=20):
+    hist_canvas = tk.Canvas(
+        parent_frame,
+        height=180,
+        bg=("white" if ctk.get_appearance_mode() == "Light" else "#2b2b2b"),
+        highlightthickness=0
+    )
+    hist_canvas.pack(fill='x', padx=15, pady=(0, 15))
+    hist_canvas.update_idletasks()
+    canvas_width = hist_canvas.winfo_width()
+    if canvas_width <= 1:  # Canvas not yet rendered
+        canvas_width = 800
+    text_color = "black" if ctk.get_appearance_mode() == "Light" else "white"
+
+    # Group lateness values into at most max_bins equal-width buckets
+    low, high = min(lateness), max(lateness)
+    bin_width = max(1, math.ceil((high - low + 1) / max_bins))
+    bins = Counter()
+    for value, count in lateness.items():
+        bins[(value - low) // bin_width] += count
+    num_bins = (high - low) // bin_width + 1
+    peak = max(bins.values())
+
+    start_x, base_y, bar_area = 60, 140, 110
+    bar_width = (canvas_width - 120) / num_bins
+    for b in range(num_bins):
+        count = bins.get(b, 0)
+        bin_low = low + b * bin_width
+        bin_high = bin_low + bin_width - 1
+        x0 = start_x + b * bar_width
+        bar_height = bar_area * count / peak
+        # Early jobs in green, late jobs (deadline misses) in red
+        color = COLORS['danger'] if bin_high > 0 else COLORS['success']
+        hist_canvas.create_rectangle(x0 + 2, base_y - bar_height, x0 + bar_width - 2, base_y, fill=color, outline="")
+        if count:
+            hist_canvas.create_text(x0 + bar_width / 2, base_y - bar_height - 8, text=str(count), fill=text_color, font=("Arial", 9))
+        label = format_time(bin_low) if bin_width == 1 else f"{format_time(bin_low)}..{format_time(bin_high)}"
+        hist_canvas.create_text(x0 + bar_width / 2, base_y + 12, text=label, fill=text_color, font=("Arial", 8))
+    hist_canvas.create_line(start_x, base_y, start_x + num_bins * bar_width, base_y, fill=text_color, width=1)
+
+# Function to draw the telemetry series as three stacked strips
+def create_telemetry_chart(parent_frame, rows):
+    strip_height, gap = 70, 25
+    chart_canvas = tk.Canvas(
+        parent_frame,
+        height=3 * (strip_height + gap) + 10,
+        bg=("white" if ctk.get_appearance_mode() == "Light" else "#2b2b2b"),
+        highlightthickness=0
+    )
+    chart_canvas.pack(fill='x', padx=15, pady=(0, 15))
+    chart_canvas.update_idletasks()
+    canvas_width = chart_canvas.winfo_width()
+    if canvas_width <= 1:  # Canvas not yet rendered
+        canvas_width = 800
+    text_color = "black" if ctk.get_appearance_mode() == "Light" else "white"
+
+    start_x = 60
+    step = (canvas_width - start_x - 40) / len(rows)
+    strips = (
+        ("Ready queue depth", 1, COLORS['warning'], max(max(row[1] for row in rows), 1)),
+        ("CPU busy fraction", 2, COLORS['success'], 1),
+        ("Completions", 3, COLORS['primary'], max(max(row[3] for row in rows), 1)),
+    )
+    for s, (title, column, color, peak) in enumerate(strips):
+        base_y = 20 + s * (strip_height + gap) + strip_height
+        chart_canvas.create_text(start_x, base_y - strip_height - 8, text=f"{title} (max {peak:g})", anchor="w", fill=text_color, font=("Arial", 9, "bold"))
+        for i, row in enumerate(rows):
+            x0 = start_x + i * step
+            bar_height = strip_height * row[column] / peak
+            if bar_height > 0:
+                chart_canvas.create_rectangle(x0, base_y - bar_height, x0 + max(step - 1, 1), base_y, fill=color, outline="")
+        chart_canvas.create_line(start_x, base_y, start_x + len(rows) * step, base_y, fill=text_color, width=1)
+    # Time axis labels at both ends of the run
+    chart_canvas.create_text(start_x, base_y + 10, text=format_time(rows[0][0]), fill=text_color, font=("Arial", 8))
+    window = rows[1][0] - rows[0][0] if len(rows) > 1 else 1
+    chart_canvas.create_text(start_x + len(rows) * step, base_y + 10, text=f"{format_time(rows[-1][0])} (window {format_time(window)})", anchor="e", fill=text_color, font=("Arial", 8))
+
+# Function to configure the Treeview style, once per appearance mode
+def configure_table_style():
+    global table_style_mode
+    mode = ctk.get_appearance_mode()
+    if mode == table_style_mode:
+        return
+    table_style_mode = mode
     style = ttk.Style()
     style.theme_use("clam")
     
     # Configure Treeview colors
-    bg_color = "white" if ctk.get_appearance_mode() == "Light" else "#2b2b2b"
-    fg_color = "black" if ctk.get_appearance_mode() == "Light" else "white"
+    bg_color = "white" if mode == "Light" else "#2b2b2b"
+    fg_color = "black" if mode == "Light" else "white"
     select_color = COLORS['primary']
     
     style.configure("Custom.Treeview",
@@ -976,18 +3177,49 @@ def create_enhanced_table(parent_frame, proc_list):
                    foreground="white",
                    font=("Arial", 11, "bold"),
                    relief="flat")
+
+# Function to create enhanced table, returning it and each process's row id
+TABLE_PAGE_ROWS = 500  # Process table rows built at a time
+TABLE_VISIBLE_ROWS = 20
+
+def create_enhanced_table(parent_frame, proc_list):
+    """Return the table and select_process(name), which shows that process's page and selects its row."""
+    num_pages = max(1, math.ceil(len(proc_list) / TABLE_PAGE_ROWS))
+    if num_pages > 1:
+        pager = ctk.CTkFrame(parent_frame, fg_color="transparent")
+        pager.pack(fill='x', padx=15, pady=(0, 5))
+        next_button = ctk.CTkButton(pager, text="Next ▶", command=lambda: load_page(state['page'] + 1), width=100)
+        next_button.pack(side="right")
+        page_label = ctk.CTkLabel(pager, text="")
+        page_label.pack(side="right", padx=10)
+        prev_button = ctk.CTkButton(pager, text="◀ Previous", command=lambda: load_page(state['page'] - 1), width=100)
+        prev_button.pack(side="right")
+
+    table_container = ctk.CTkFrame(parent_frame, corner_radius=10, fg_color=("white", "gray25"))
+    table_container.pack(fill='both', expand=True, padx=15, pady=(0, 15))
+    
+    # Create Treeview with custom styling
+    configure_table_style()
     
     columns = (
         "Process", "Arrival Time", "Burst Time", "Priority", 
         "Completion Time", "Turnaround Time", "Waiting Time", "Response Time"
     )
+    # Real-time runs also show the timing constraints and per-process misses
+    realtime = any(proc.lateness_counts for proc in proc_list)
+    if realtime:
+        columns += ("Deadline", "Period", "Jobs", "Misses")
+    # Runs with I/O bursts also show each process's burst sequence and I/O times
+    has_io = any(proc.io_time for proc in proc_list)
+    if has_io:
+        columns += ("Bursts (CPU/I-O)", "I/O Time", "I/O Wait")
     
     tree = ttk.Treeview(
         table_container, 
         columns=columns, 
         show='headings',
         style="Custom.Treeview",
-        height=len(proc_list) + 2
+        height=min(len(proc_list), TABLE_VISIBLE_ROWS) + 2
     )
     
     # Configure column headings and widths
@@ -999,7 +3231,14 @@ def create_enhanced_table(parent_frame, proc_list):
         "Completion Time": (120, "center"),
         "Turnaround Time": (120, "center"),
         "Waiting Time": (110, "center"),
-        "Response Time": (110, "center")
+        "Response Time": (110, "center"),
+        "Deadline": (80, "center"),
+        "Period": (80, "center"),
+        "Jobs": (60, "center"),
+        "Misses": (70, "center"),
+        "Bursts (CPU/I-O)": (130, "center"),
+        "I/O Time": (80, "center"),
+        "I/O Wait": (80, "center")
     }
     
     for col in columns:
@@ -1007,22 +3246,56 @@ def create_enhanced_table(parent_frame, proc_list):
         tree.heading(col, text=col)
         tree.column(col, width=width, anchor=anchor, minwidth=60)
     
-    # Add data to table
-    for i, proc in enumerate(proc_list):
-        # Alternate row colors
-        tags = ("evenrow",) if i % 2 == 0 else ("oddrow",)
-        
-        tree.insert("", "end", values=(
+    # Only one page of rows exists at a time, so long runs do not build a row per process
+    page_of = {proc.name: i // TABLE_PAGE_ROWS for i, proc in enumerate(proc_list)}
+    state = {'page': None, 'rows': {}}
+
+    def row_values(proc):
+        values = (
             proc.name,
-            proc.arrival_time,
-            proc.burst_time,
+            format_time(proc.arrival_time),
+            format_time(proc.burst_time),
             proc.priority if proc.priority is not None else "N/A",
-            proc.completion_time,
-            proc.turnaround_time,
-            proc.waiting_time,
-            proc.response_time if proc.response_time != -1 else "N/A"
-        ), tags=tags)
-    
+            format_time(proc.completion_time),
+            format_time(proc.turnaround_time),
+            format_time(proc.waiting_time),
+            format_time(proc.response_time) if proc.response_time != -1 else "N/A"
+        )
+        if realtime:
+            values += (
+                format_time(proc.deadline) if proc.deadline is not None else "N/A",
+                format_time(proc.period) if proc.period is not None else "N/A",
+                proc.jobs_completed,
+                proc.deadline_misses
+            )
+        if has_io:
+            values += ("/".join(map(format_time, proc.bursts)), format_time(proc.io_time), format_time(proc.io_wait_time))
+        return values
+
+    def load_page(page):
+        if page == state['page']:
+            return
+        tree.delete(*tree.get_children())
+        state['page'] = page
+        state['rows'] = {}
+        start = page * TABLE_PAGE_ROWS
+        for i, proc in enumerate(proc_list[start:start + TABLE_PAGE_ROWS], start):
+            # Alternate row colors
+            tags = ("evenrow",) if i % 2 == 0 else ("oddrow",)
+            state['rows'][proc.name] = tree.insert("", "end", values=row_values(proc), tags=tags)
+        if num_pages > 1:
+            page_label.configure(text=f"Processes {start + 1}-{min(start + TABLE_PAGE_ROWS, len(proc_list))} of {len(proc_list)}")
+            prev_button.configure(state="normal" if page > 0 else "disabled")
+            next_button.configure(state="normal" if page < num_pages - 1 else "disabled")
+
+    def select_process(proc_name):
+        load_page(page_of[proc_name])
+        row = state['rows'][proc_name]
+        tree.selection_set(row)
+        tree.see(row)
+
+    load_page(0)
+
     # Configure row tags
     tree.tag_configure("evenrow", background=("gray95" if ctk.get_appearance_mode() == "Light" else "gray20"))
     tree.tag_configure("oddrow", background=("white" if ctk.get_appearance_mode() == "Light" else "gray25"))
@@ -1036,16 +3309,22 @@ def create_enhanced_table(parent_frame, proc_list):
     tree.pack(side="left", fill="both", expand=True, padx=10, pady=10)
     v_scrollbar.pack(side="right", fill="y", pady=10)
     h_scrollbar.pack(side="bottom", fill="x", padx=10)
+    return tree, select_process
 
 # First-Come-First-Serve Scheduling
-def fcfs_scheduling(proc_list):
+def fcfs_scheduling(proc_list, context_switch=0):
     proc_list.sort(key=lambda p: p.arrival_time)
     time = 0
     gantt_chart = []
+    last_proc = None
     for proc in proc_list:
         if time < proc.arrival_time:
             gantt_chart.append(("Idle", proc.arrival_time - time))
             time = proc.arrival_time
+        if context_switch and last_proc is not None:
+            gantt_chart.append(("Switch", context_switch))
+            time += context_switch
+        last_proc = proc
         proc.completion_time = time + proc.burst_time
         proc.turnaround_time = proc.completion_time - proc.arrival_time
         proc.waiting_time = proc.turnaround_time - proc.burst_time
@@ -1056,15 +3335,24 @@ def fcfs_scheduling(proc_list):
     return gantt_chart
 
 # Shortest Job First Scheduling (Non-Preemptive)
-def sjf_scheduling(proc_list):
-    proc_list.sort(key=lambda p: (p.arrival_time, p.burst_time))
+def sjf_scheduling(proc_list, context_switch=0):
+    return nonpreemptive_scheduling(proc_list, lambda p: p.burst_time, context_switch)
+
+# Non-preemptive core shared by SJF and Priority: run the ready process with the smallest key(proc)
+def nonpreemptive_scheduling(proc_list, key, context_switch=0):
+    proc_list.sort(key=lambda p: (p.arrival_time, key(p)))
     time = 0
     gantt_chart = []
-    completed = []
+    completed = set()
+    last_proc = None
     while len(completed) < len(proc_list):
         available_procs = [p for p in proc_list if p.arrival_time <= time and p not in completed]
         if available_procs:
-            proc = min(available_procs, key=lambda p: p.burst_time)
+            proc = min(available_procs, key=key)
+            if context_switch and last_proc is not None:
+                gantt_chart.append(("Switch", context_switch))
+                time += context_switch
+            last_proc = proc
             proc.completion_time = time + proc.burst_time
             proc.turnaround_time = proc.completion_time - proc.arrival_time
             proc.waiting_time = proc.turnaround_time - proc.burst_time
@@ -1072,15 +3360,31 @@ def sjf_scheduling(proc_list):
                 proc.response_time = time - proc.arrival_time
             gantt_chart.append((proc.name, proc.burst_time))
             time = proc.completion_time
-            completed.append(proc)
+            completed.add(proc)
         else:
-            time += 1
-            gantt_chart.append(("Idle", 1))
+            # Nothing has arrived yet: idle straight to the next arrival
+            next_arrival = min(p.arrival_time for p in proc_list if p not in completed)
+            gantt_chart.append(("Idle", next_arrival - time))
+            time = next_arrival
     return gantt_chart
 
+CHECKPOINT_INTERVAL = 5  # Seconds between snapshots of a checkpointed run
+
 # Shortest Remaining Time First Scheduling (Preemptive)
-# Shortest Remaining Time First Scheduling (Preemptive)
-def srtf_scheduling(proc_list):
+def srtf_scheduling(proc_list, context_switch=0, checkpoint_path=None, checkpoint_interval=CHECKPOINT_INTERVAL):
+    return preemptive_scheduling(proc_list, lambda x: x.remaining_time, context_switch, checkpoint_path, checkpoint_interval)
+
+# Preemptive core shared by SRTF and preemptive Priority: run the ready process with the smallest key(proc)
+def preemptive_scheduling(proc_list, key, context_switch=0, checkpoint_path=None, checkpoint_interval=CHECKPOINT_INTERVAL):
+    """Event-driven: the running process keeps the CPU until it finishes or the next arrival.
+
+    The ready queue is stable-sorted by key only when something arrives or
+    finishes, which is the order re-sorting it every time unit would give,
+    so ties are broken exactly as before.  Cost grows with the number of
+    processes, not with the length of the run.  With checkpoint_path, the
+    state is saved every checkpoint_interval seconds and a run resumes from
+    a snapshot of the same workload; a snapshot of any other is deleted.
+    """
     time = 0
     completed = 0
     n = len(proc_list)
@@ -1088,42 +3392,146 @@ def srtf_scheduling(proc_list):
     proc_list.sort(key=lambda x: x.arrival_time)
     ready_queue = []
     prev_proc = None
+    last_proc = None
+    start_time = 0
+    i = 0  # next process to arrive
+    # Resume from the latest snapshot of this workload, if there is one
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        try:
+            time, completed, prev_proc, start_time, last_proc, ready_queue, gantt_chart = load_checkpoint(checkpoint_path, proc_list)
+        except ValueError:
+            os.remove(checkpoint_path)  # Left by another workload or damaged: start afresh
+        else:
+            # Processes are admitted in arrival order, so the admitted ones are a prefix of proc_list
+            queued = set(ready_queue)
+            i = sum(1 for proc in proc_list if proc in queued or proc.remaining_time == 0)
+    next_checkpoint = monotonic() + checkpoint_interval
     while completed != n:
-        for proc in proc_list:
-            if proc.arrival_time <= time and proc not in ready_queue and proc.remaining_time > 0:
-                ready_queue.append(proc)
+        # Snapshot the state every checkpoint_interval seconds (an event costs far more than reading the clock)
+        if checkpoint_path is not None and monotonic() >= next_checkpoint:
+            save_checkpoint(checkpoint_path, proc_list, time, completed, prev_proc, start_time, last_proc, ready_queue, gantt_chart)
+            next_checkpoint = monotonic() + checkpoint_interval
+        while i < n and proc_list[i].arrival_time <= time:
+            ready_queue.append(proc_list[i])
+            i += 1
         if ready_queue:
-            ready_queue.sort(key=lambda x: x.remaining_time)
+            ready_queue.sort(key=key)
             current_proc = ready_queue[0]
             if current_proc != prev_proc:
                 if prev_proc is not None and time > 0:
                     gantt_chart.append((prev_proc.name, time - start_time))
+                if context_switch and last_proc is not None and last_proc != current_proc:
+                    gantt_chart.append(("Switch", context_switch))
+                    time += context_switch
                 start_time = time
                 prev_proc = current_proc
+                last_proc = current_proc
             if current_proc.response_time == -1:
                 current_proc.response_time = time - current_proc.arrival_time
-            current_proc.remaining_time -= 1
-            time += 1
+            # Run at least one unit, then until completion or the next arrival
+            run = current_proc.remaining_time
+            if i < n:
+                run = min(run, max(proc_list[i].arrival_time - time, 1))
+            current_proc.remaining_time -= run
+            time += run
             if current_proc.remaining_time == 0:
                 current_proc.completion_time = time
                 current_proc.turnaround_time = current_proc.completion_time - current_proc.arrival_time
                 current_proc.waiting_time = current_proc.turnaround_time - current_proc.burst_time
-                ready_queue.remove(current_proc)
+                ready_queue.pop(0)
                 completed += 1
         else:
             if prev_proc is not None and time > 0:
                 gantt_chart.append((prev_proc.name, time - start_time))
                 prev_proc = None
-            gantt_chart.append(("Idle", 1))
-            time += 1
+            gantt_chart.append(("Idle", proc_list[i].arrival_time - time))
+            time = proc_list[i].arrival_time
     if prev_proc is not None:
         gantt_chart.append((prev_proc.name, time - start_time))
+    # A finished run must not be resumed from its snapshot again
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
     return gantt_chart
 
 
+# Checkpoint format: zlib-compressed header plus int64 arrays of per-process state,
+# ready queue order and the partial Gantt chart (process index, -1 = Idle, -2 = Switch)
+CHECKPOINT_MAGIC = b"CPUCKPT1"
+CHECKPOINT_HEADER = struct.Struct("<8s32sqqqqqqqq")  # magic, workload digest, clock, completed, running, segment start, last run, processes, ready, segments
+
+CHECKPOINT_DIR = os.path.join(os.path.expanduser("~"), ".cpu_scheduler_checkpoints")
+
+# Helper function to name the snapshot file of a GUI run, one per workload, algorithm and switch cost
+def checkpoint_file(proc_list, algorithm, context_switch, time_scale=1):
+    """The workload is identified by checkpoint_digest, in input order, like the snapshot inside."""
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    key = f"{checkpoint_digest(proc_list).hex()}:{time_scale}:{algorithm}:{context_switch}"
+    return os.path.join(CHECKPOINT_DIR, hashlib.sha256(key.encode()).hexdigest()[:32] + ".ckpt")
+
+# Helper function to fingerprint a workload in its scheduling order
+def checkpoint_digest(proc_list):
+    rows = [(proc.name, proc.arrival_time, proc.burst_time, proc.priority) for proc in proc_list]
+    return hashlib.sha256(repr(rows).encode()).digest()
+
+# Function to atomically write a snapshot of a preemptive engine (see preemptive_scheduling)
+def save_checkpoint(path, proc_list, time, completed, prev_proc, start_time, last_proc, ready_queue, gantt_chart):
+    index_of = {proc.name: i for i, proc in enumerate(proc_list)}
+    index_of["Idle"] = -1
+    index_of["Switch"] = -2
+    header = CHECKPOINT_HEADER.pack(
+        CHECKPOINT_MAGIC, checkpoint_digest(proc_list), time, completed,
+        index_of[prev_proc.name] if prev_proc is not None else -3, start_time,
+        index_of[last_proc.name] if last_proc is not None else -3,
+        len(proc_list), len(ready_queue), len(gantt_chart)
+    )
+    state = array('q')
+    for proc in proc_list:
+        state.extend((proc.remaining_time, proc.response_time, proc.completion_time, proc.turnaround_time, proc.waiting_time))
+    state.extend(index_of[proc.name] for proc in ready_queue)
+    state.extend(index_of[proc_name] for proc_name, _ in gantt_chart)
+    state.extend(duration for _, duration in gantt_chart)
+    if sys.byteorder == "big":
+        state.byteswap()
+    # Write next to the target and rename, so a crash never leaves a torn snapshot
+    with open(path + ".tmp", "wb") as f:
+        f.write(zlib.compress(header + state.tobytes(), 1))
+    os.replace(path + ".tmp", path)
+
+# Function to restore a snapshot written by save_checkpoint into proc_list
+def load_checkpoint(path, proc_list):
+    """Return (time, completed, prev_proc, start_time, last_proc, ready_queue, gantt_chart).
+
+    Raises ValueError, before touching proc_list, when the snapshot is of
+    another workload or damaged.
+    """
+    with open(path, "rb") as f:
+        try:
+            data = zlib.decompress(f.read())
+            header = CHECKPOINT_HEADER.unpack_from(data)
+        except (zlib.error, struct.error):
+            raise ValueError("Checkpoint file is damaged.")
+    magic, digest, time, completed, prev_index, start_time, last_index, n, num_ready, num_segments = header
+    if magic != CHECKPOINT_MAGIC or n != len(proc_list) or digest != checkpoint_digest(proc_list):
+        raise ValueError("Checkpoint does not belong to this workload.")
+    state = array('q')
+    state.frombytes(data[CHECKPOINT_HEADER.size:])
+    if sys.byteorder == "big":
+        state.byteswap()
+    for i, proc in enumerate(proc_list):
+        proc.remaining_time, proc.response_time, proc.completion_time, proc.turnaround_time, proc.waiting_time = state[5 * i:5 * i + 5]
+    pos = 5 * n
+    ready_queue = [proc_list[i] for i in state[pos:pos + num_ready]]
+    pos += num_ready
+    names = {-1: "Idle", -2: "Switch"}
+    owners = state[pos:pos + num_segments]
+    durations = state[pos + num_segments:pos + 2 * num_segments]
+    gantt_chart = [(names[i] if i < 0 else proc_list[i].name, duration) for i, duration in zip(owners, durations)]
+    prev_proc = proc_list[prev_index] if prev_index >= 0 else None
+    last_proc = proc_list[last_index] if last_index >= 0 else None
+    return time, completed, prev_proc, start_time, last_proc, ready_queue, gantt_chart
 
 # Round-Robin Scheduling
-def round_robin_scheduling(proc_list, quantum=2):
+def round_robin_scheduling(proc_list, quantum=2, context_switch=0):
     time = 0
     completed = 0
     n = len(proc_list)
@@ -1131,10 +3539,19 @@ def round_robin_scheduling(proc_list, quantum=2):
     queue = []
     proc_list.sort(key=lambda x: x.arrival_time)
     queue.append(proc_list[0])
+    # The CPU idles until the first process arrives
+    if proc_list[0].arrival_time > 0:
+        gantt_chart.append(("Idle", proc_list[0].arrival_time))
+        time = proc_list[0].arrival_time
     i = 1
+    last_proc = None
     while completed != n:
         if queue:
             current_proc = queue.pop(0)
+            if context_switch and last_proc is not None and last_proc != current_proc:
+                gantt_chart.append(("Switch", context_switch))
+                time += context_switch
+            last_proc = current_proc
             if current_proc.response_time == -1:
                 current_proc.response_time = time - current_proc.arrival_time
             exec_time = min(quantum, current_proc.remaining_time)
@@ -1169,143 +3586,1877 @@ def round_robin_scheduling(proc_list, quantum=2):
 
 
 # Priority Scheduling (Non-Preemptive)
-def priority_scheduling(proc_list):
-    proc_list.sort(key=lambda p: (p.arrival_time, p.priority))
-    time = 0
+def priority_scheduling(proc_list, context_switch=0):
+    return nonpreemptive_scheduling(proc_list, lambda p: p.priority, context_switch)
+
+# Priority Scheduling (Preemptive)
+def preemptive_priority_scheduling(proc_list, context_switch=0, checkpoint_path=None, checkpoint_interval=CHECKPOINT_INTERVAL):
+    return preemptive_scheduling(proc_list, lambda x: x.priority, context_switch, checkpoint_path, checkpoint_interval)
+
+# Priority Scheduling with Aging (preemptive or non-preemptive)
+def aging_priority_scheduling(proc_list, aging_interval=None, preemptive=True, context_switch=0):
+    """Event-driven priority scheduling where waiting processes age linearly.
+
+    A process waiting since r has effective priority
+    priority - (t - r) / aging_interval.  Scaled by aging_interval this is
+    key - t with key = priority * aging_interval + r, so every waiting
+    process loses priority at the same rate and the heap order never
+    changes.  Only the running process keeps the effective priority it was
+    dispatched with, and the moment the best waiting process overtakes it
+    is scheduled as an event, so aging costs O(log n) per event.
+    A process that loses the CPU starts aging again from its base priority.
+    Without aging_interval the schedule matches priority_scheduling and
+    preemptive_priority_scheduling, including tie-breaking.
+    """
+    proc_list.sort(key=lambda x: x.arrival_time)
+    n = len(proc_list)
+    scale = aging_interval or 1
+    age = 1 if aging_interval else 0
+    ready_queue = []
     gantt_chart = []
-    completed = []
-    while len(completed) < len(proc_list):
-        available_procs = [p for p in proc_list if p.arrival_time <= time and p not in completed]
-        if available_procs:
-            proc = min(available_procs, key=lambda p: p.priority)
-            proc.completion_time = time + proc.burst_time
-            proc.turnaround_time = proc.completion_time - proc.arrival_time
-            proc.waiting_time = proc.turnaround_time - proc.burst_time
-            if proc.response_time == -1:
-                proc.response_time = time - proc.arrival_time
-            gantt_chart.append((proc.name, proc.burst_time))
-            time = proc.completion_time
-            completed.append(proc)
-        else:
-            time += 1
-            gantt_chart.append(("Idle", 1))
+    time = 0
+    completed = 0
+    i = 0
+    running = None
+    running_key = 0  # Scaled effective priority of the running process
+    last_proc = None
+    while completed != n:
+        # Admit arrivals
+        while i < n and proc_list[i].arrival_time <= time:
+            proc = proc_list[i]
+            heapq.heappush(ready_queue, (proc.priority * scale + age * proc.arrival_time, i, proc))
+            i += 1
+
+        # Preempt when the best waiting process is now strictly better
+        if preemptive and running is not None and ready_queue and ready_queue[0][0] - age * time < running_key:
+            heapq.heappush(ready_queue, (running.priority * scale + age * time, running_index, running))
+            running = None
+
+        if running is None:
+            if not ready_queue:
+                gantt_chart.append(("Idle", proc_list[i].arrival_time - time))
+                time = proc_list[i].arrival_time
+                continue
+            key, running_index, running = heapq.heappop(ready_queue)
+            running_key = key - age * time
+            if context_switch and last_proc is not None and last_proc != running:
+                gantt_chart.append(("Switch", context_switch))
+                time += context_switch
+            last_proc = running
+            if running.response_time == -1:
+                running.response_time = time - running.arrival_time
+
+        # Run until completion, the next arrival or the next aging crossover
+        # (at least one time unit, so arrivals during a switch wait for the next tick)
+        next_time = time + running.remaining_time
+        if preemptive:
+            if i < n:
+                next_time = min(next_time, max(proc_list[i].arrival_time, time + 1))
+            if age and ready_queue:
+                next_time = min(next_time, max(ready_queue[0][0] - running_key + 1, time + 1))
+        append_slice(gantt_chart, running.name, next_time - time)
+        running.remaining_time -= next_time - time
+        time = next_time
+        if running.remaining_time == 0:
+            finish_process(running, time)
+            completed += 1
+            running = None
     return gantt_chart
 
-# Priority Scheduling (Non-Preemptive)
-def priority_scheduling(proc_list):
-    proc_list.sort(key=lambda p: (p.arrival_time, p.priority))
-    time = 0
+# Real-Time Scheduling core shared by EDF and RMS (Preemptive)
+def realtime_scheduling(proc_list, job_key, horizon=None, context_switch=0):
+    """Event-driven preemptive scheduler for deadline/periodic processes.
+
+    Periodic jobs are released lazily from a heap of next release times, so
+    memory stays O(n) however long the hyperperiod is.  Each event costs
+    O(log n).  job_key(proc, absolute_deadline) orders the ready heap.
+    Per process, completion_time is the finish of the last job and
+    turnaround_time is the worst-case job turnaround.
+    """
+    proc_list.sort(key=lambda x: x.arrival_time)
     gantt_chart = []
-    completed = []
-    while len(completed) < len(proc_list):
-        available_procs = [p for p in proc_list if p.arrival_time <= time and p not in completed]
-        if available_procs:
-            proc = min(available_procs, key=lambda p: p.priority)
-            proc.completion_time = time + proc.burst_time
-            proc.turnaround_time = proc.completion_time - proc.arrival_time
-            proc.waiting_time = proc.turnaround_time - proc.burst_time
-            if proc.response_time == -1:
-                proc.response_time = time - proc.arrival_time
-            gantt_chart.append((proc.name, proc.burst_time))
-            time = proc.completion_time
-            completed.append(proc)
+    if not proc_list:
+        return gantt_chart
+
+    # Periodic processes keep releasing jobs until the horizon (default: one hyperperiod)
+    if horizon is None:
+        hyperperiod = 1
+        for proc in proc_list:
+            if proc.period:
+                hyperperiod = hyperperiod * proc.period // math.gcd(hyperperiod, proc.period)
+        horizon = max(proc.arrival_time for proc in proc_list) + hyperperiod
+
+    releases = [(proc.arrival_time, idx, proc) for idx, proc in enumerate(proc_list)]
+    heapq.heapify(releases)
+    ready_queue = []
+    for proc in proc_list:
+        proc.jobs_completed = 0
+        proc.deadline_misses = 0
+        proc.lateness_counts = Counter()
+        proc.turnaround_time = 0
+
+    time = 0
+    last_proc = None
+    while releases or ready_queue:
+        # Release every job that is due by now and schedule the next one of its process
+        while releases and releases[0][0] <= time:
+            release, idx, proc = heapq.heappop(releases)
+            relative_deadline = proc.deadline if proc.deadline is not None else proc.period
+            abs_deadline = release + relative_deadline if relative_deadline is not None else math.inf
+            job = [proc, proc.burst_time, release, abs_deadline]
+            heapq.heappush(ready_queue, (job_key(proc, abs_deadline), release, idx, job))
+            if proc.period and release + proc.period < horizon:
+                heapq.heappush(releases, (release + proc.period, idx, proc))
+
+        if not ready_queue:
+            gantt_chart.append(("Idle", releases[0][0] - time))
+            time = releases[0][0]
+            continue
+
+        job = ready_queue[0][3]
+        current_proc = job[0]
+        if context_switch and last_proc is not None and last_proc != current_proc:
+            gantt_chart.append(("Switch", context_switch))
+            time += context_switch
+        last_proc = current_proc
+        if releases and releases[0][0] <= time:
+            continue  # Jobs released during the switch may preempt before it runs
+        if current_proc.response_time == -1:
+            current_proc.response_time = time - current_proc.arrival_time
+
+        # Run until the job finishes or the next release may preempt it
+        run_until = time + job[1]
+        if releases and releases[0][0] < run_until:
+            run_until = releases[0][0]
+        run = run_until - time
+        if gantt_chart and gantt_chart[-1][0] == current_proc.name:
+            gantt_chart[-1] = (current_proc.name, gantt_chart[-1][1] + run)
         else:
-            time += 1
-            gantt_chart.append(("Idle", 1))
+            gantt_chart.append((current_proc.name, run))
+        job[1] -= run
+        time = run_until
+
+        if job[1] == 0:
+            heapq.heappop(ready_queue)
+            current_proc.jobs_completed += 1
+            current_proc.completion_time = time
+            current_proc.turnaround_time = max(current_proc.turnaround_time, time - job[2])
+            current_proc.waiting_time = current_proc.turnaround_time - current_proc.burst_time
+            if job[3] != math.inf:
+                lateness = time - job[3]
+                current_proc.lateness_counts[lateness] += 1
+                if lateness > 0:
+                    current_proc.deadline_misses += 1
     return gantt_chart
 
-# Priority Scheduling (Preemptive)
-def preemptive_priority_scheduling(proc_list):
+# Earliest Deadline First Scheduling (Preemptive)
+def edf_scheduling(proc_list, horizon=None, context_switch=0):
+    return realtime_scheduling(proc_list, lambda proc, abs_deadline: abs_deadline, horizon, context_switch)
+
+# Rate-Monotonic Scheduling (Preemptive, fixed priority by period)
+def rms_scheduling(proc_list, horizon=None, context_switch=0):
+    def rate_key(proc, abs_deadline):
+        if proc.period:
+            return proc.period
+        return proc.deadline if proc.deadline is not None else math.inf
+    return realtime_scheduling(proc_list, rate_key, horizon, context_switch)
+
+# Helper function to aggregate deadline metrics from the merged job lateness Counter
+def deadline_metrics(lateness):
+    """Return (jobs with deadlines, misses, miss ratio)."""
+    total_jobs = sum(lateness.values())
+    misses = sum(count for value, count in lateness.items() if value > 0)
+    miss_ratio = misses / total_jobs if total_jobs else 0
+    return total_jobs, misses, miss_ratio
+
+# Fenwick (binary indexed) tree over ticket counts for lottery draws
+class FenwickTree:
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+
+    def add(self, index, delta):
+        self.total += delta
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def find(self, target):
+        """Return the smallest index whose prefix sum exceeds target (0 <= target < total)."""
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+# Helper function to append a slice to a Gantt chart, merging with the previous slice of the same process
+def append_slice(gantt_chart, proc_name, duration):
+    if gantt_chart and gantt_chart[-1][0] == proc_name:
+        gantt_chart[-1] = (proc_name, gantt_chart[-1][1] + duration)
+    else:
+        gantt_chart.append((proc_name, duration))
+
+# Helper function to record the completion of a process at the given time
+def finish_process(proc, time):
+    proc.completion_time = time
+    proc.turnaround_time = proc.completion_time - proc.arrival_time
+    proc.waiting_time = proc.turnaround_time - proc.burst_time
+
+# Lottery Scheduling (Preemptive, proportional share)
+def lottery_scheduling(proc_list, quantum=2, seed=0, context_switch=0):
+    """Each quantum goes to a ticket drawn uniformly at random.
+
+    Arrived processes hold their tickets in a Fenwick tree, so each draw and
+    each arrival or completion costs O(log n).  The same seed always yields
+    the same schedule.
+    """
+    rng = random.Random(seed)
+    proc_list.sort(key=lambda x: x.arrival_time)
+    n = len(proc_list)
+    tickets = FenwickTree(n)
+    gantt_chart = []
     time = 0
     completed = 0
+    i = 0
+    last_proc = None
+    while completed != n:
+        # Arrived processes enter the lottery
+        while i < n and proc_list[i].arrival_time <= time:
+            tickets.add(i, proc_list[i].tickets or 100)
+            i += 1
+        if tickets.total == 0:
+            gantt_chart.append(("Idle", proc_list[i].arrival_time - time))
+            time = proc_list[i].arrival_time
+            continue
+
+        winner = tickets.find(rng.randrange(tickets.total))
+        current_proc = proc_list[winner]
+        if context_switch and last_proc is not None and last_proc != current_proc:
+            gantt_chart.append(("Switch", context_switch))
+            time += context_switch
+        last_proc = current_proc
+        if current_proc.response_time == -1:
+            current_proc.response_time = time - current_proc.arrival_time
+        exec_time = min(quantum, current_proc.remaining_time)
+        append_slice(gantt_chart, current_proc.name, exec_time)
+        time += exec_time
+        current_proc.remaining_time -= exec_time
+        if current_proc.remaining_time == 0:
+            tickets.add(winner, -(current_proc.tickets or 100))
+            finish_process(current_proc, time)
+            completed += 1
+    return gantt_chart
+
+# Stride Scheduling (Preemptive, deterministic proportional share)
+def stride_scheduling(proc_list, quantum=2, context_switch=0, stride1=1 << 20):
+    """Each quantum goes to the process with the smallest pass value.
+
+    A process's pass advances by stride1 / tickets every time it runs, and a
+    newly arrived process starts at the current pass so it cannot monopolise
+    the CPU.  The ready set is a heap, so each quantum costs O(log n).
+    """
+    proc_list.sort(key=lambda x: x.arrival_time)
     n = len(proc_list)
+    ready_queue = []
     gantt_chart = []
+    time = 0
+    completed = 0
+    i = 0
+    current_pass = 0
+    last_proc = None
+    while completed != n:
+        while i < n and proc_list[i].arrival_time <= time:
+            heapq.heappush(ready_queue, (current_pass, i, proc_list[i]))
+            i += 1
+        if not ready_queue:
+            gantt_chart.append(("Idle", proc_list[i].arrival_time - time))
+            time = proc_list[i].arrival_time
+            continue
+
+        current_pass, idx, current_proc = heapq.heappop(ready_queue)
+        if context_switch and last_proc is not None and last_proc != current_proc:
+            gantt_chart.append(("Switch", context_switch))
+            time += context_switch
+        last_proc = current_proc
+        if current_proc.response_time == -1:
+            current_proc.response_time = time - current_proc.arrival_time
+        exec_time = min(quantum, current_proc.remaining_time)
+        append_slice(gantt_chart, current_proc.name, exec_time)
+        time += exec_time
+        current_proc.remaining_time -= exec_time
+        if current_proc.remaining_time > 0:
+            stride = stride1 // (current_proc.tickets or 100)
+            heapq.heappush(ready_queue, (current_pass + stride, idx, current_proc))
+        else:
+            finish_process(current_proc, time)
+            completed += 1
+    return gantt_chart
+
+# CPU/I-O Burst Scheduling (discrete-event, FCFS or Round-Robin ready queue)
+def io_burst_scheduling(proc_list, quantum=None, context_switch=0):
+    """Simulate processes alternating CPU bursts with I/O on one shared device.
+
+    An event heap drives arrivals, CPU slice ends and I/O completions, so
+    the cost is O(log n) per burst transition instead of per time unit.
+    Blocked processes queue FIFO for the device.  waiting_time is the time
+    spent in the ready queue and io_wait_time the time queued for the device.
+    blocked_spans lists each process's (blocked, back in the ready queue) times.
+    """
+    ARRIVAL, IO_DONE, CPU_DONE = 0, 1, 2  # Same-time events are handled in this order
     proc_list.sort(key=lambda x: x.arrival_time)
+    events = []
+    seq = 0
+    for proc in proc_list:
+        proc.burst_index = 0
+        proc.remaining_time = proc.bursts[0]
+        proc.io_wait_time = 0
+        proc.blocked_spans = []
+        events.append((proc.arrival_time, ARRIVAL, seq, proc))
+        seq += 1
+    heapq.heapify(events)
+
+    gantt_chart = []
     ready_queue = []
-    prev_proc = None
-    while completed != n:
-        for proc in proc_list:
-            if proc.arrival_time <= time and proc not in ready_queue and proc.remaining_time > 0:
+    ready_head = 0
+    device_queue = []
+    device_head = 0
+    device_busy = False
+    running = None
+    last_proc = None
+    cpu_free_at = 0  # End of the last CPU activity, used to record idle gaps
+    time = 0
+
+    def start_io(proc, now):
+        nonlocal device_busy, seq
+        device_busy = True
+        proc.io_wait_time += now - proc.blocked_at
+        heapq.heappush(events, (now + proc.bursts[proc.burst_index], IO_DONE, seq, proc))
+        seq += 1
+
+    while events:
+        time = events[0][0]
+        # Apply every event that happens at this instant before dispatching
+        while events and events[0][0] == time:
+            _, kind, _, proc = heapq.heappop(events)
+            if kind == ARRIVAL:
                 ready_queue.append(proc)
-        if ready_queue:
-            ready_queue.sort(key=lambda x: x.priority)
-            current_proc = ready_queue[0]
-            if current_proc != prev_proc:
-                if prev_proc is not None and time > 0:
-                    gantt_chart.append((prev_proc.name, time - start_time))
-                start_time = time
-                prev_proc = current_proc
-            if current_proc.response_time == -1:
-                current_proc.response_time = time - current_proc.arrival_time
-            current_proc.remaining_time -= 1
-            time += 1
-            if current_proc.remaining_time == 0:
-                current_proc.completion_time = time
-                current_proc.turnaround_time = current_proc.completion_time - current_proc.arrival_time
-                current_proc.waiting_time = current_proc.turnaround_time - current_proc.burst_time
-                ready_queue.remove(current_proc)
-                completed += 1
-        else:
-            if prev_proc is not None and time > 0:
-                gantt_chart.append((prev_proc.name, time - start_time))
-                prev_proc = None
-            gantt_chart.append(("Idle", 1))
-            time += 1
-    if prev_proc is not None:
-        gantt_chart.append((prev_proc.name, time - start_time))
+            elif kind == IO_DONE:
+                proc.blocked_spans.append((proc.blocked_at, time))
+                proc.burst_index += 1
+                proc.remaining_time = proc.bursts[proc.burst_index]
+                ready_queue.append(proc)
+                device_busy = False
+                if device_head < len(device_queue):
+                    start_io(device_queue[device_head], time)
+                    device_head += 1
+            else:
+                running = None
+                if proc.remaining_time > 0:
+                    ready_queue.append(proc)  # Quantum expired
+                elif proc.burst_index == len(proc.bursts) - 1:
+                    finish_process(proc, time)
+                    proc.waiting_time = proc.turnaround_time - proc.burst_time - proc.io_time - proc.io_wait_time
+                else:
+                    proc.burst_index += 1
+                    proc.blocked_at = time
+                    if device_busy:
+                        device_queue.append(proc)
+                    else:
+                        start_io(proc, time)
+
+        # Dispatch the next ready process if the CPU is free
+        if running is None and ready_head < len(ready_queue):
+            running = ready_queue[ready_head]
+            ready_head += 1
+            if time > cpu_free_at:
+                gantt_chart.append(("Idle", time - cpu_free_at))
+            if context_switch and last_proc is not None and last_proc != running:
+                gantt_chart.append(("Switch", context_switch))
+                time += context_switch
+            last_proc = running
+            if running.response_time == -1:
+                running.response_time = time - running.arrival_time
+            run = running.remaining_time if quantum is None else min(quantum, running.remaining_time)
+            running.remaining_time -= run
+            append_slice(gantt_chart, running.name, run)
+            cpu_free_at = time + run
+            heapq.heappush(events, (cpu_free_at, CPU_DONE, seq, running))
+            seq += 1
+
+        # Compact the consumed prefix of the FIFO queues now and then
+        if ready_head > 1024 and ready_head * 2 > len(ready_queue):
+            del ready_queue[:ready_head]
+            ready_head = 0
+        if device_head > 1024 and device_head * 2 > len(device_queue):
+            del device_queue[:device_head]
+            device_head = 0
     return gantt_chart
 
-# Main GUI Window Setup
-root = ctk.CTk()
-root.title("🖥️ CPU Scheduling Algorithm Simulator")
-root.geometry("1200x800")  # Increased width to accommodate results
-root.configure(fg_color=("gray95", "gray10"))
+# Run metrics folded on the fly, for runs that never build a Gantt chart
+class RunSummary:
+    """Aggregate metrics of a run fed one segment and one completion at a time.
+
+    Nothing per process or per segment is kept, so memory is constant
+    however long the run is.  Pass a Telemetry to also collect the load
+    series in the same pass.
+    """
+    def __init__(self, telemetry=None):
+        self.sketches = {'turnaround': QuantileSketch(), 'waiting': QuantileSketch(), 'response': QuantileSketch()}
+        self.telemetry = telemetry
+        self.completed = 0
+        self.busy_time = 0
+        self.makespan = 0
+        self.context_switches = 0
+        self.segments = 0
+        self._last_name = None
+
+    def add_arrival(self, proc):
+        if self.telemetry is not None:
+            self.telemetry.add_step(proc.arrival_time, 1)
+
+    def add_segment(self, start, proc_name, duration):
+        self.segments += 1
+        if proc_name in ("Idle", "Switch"):
+            return
+        self.busy_time += duration
+        # Counted like count_context_switches: idle and switch segments are skipped
+        if self._last_name is not None and proc_name != self._last_name:
+            self.context_switches += 1
+        self._last_name = proc_name
+        if self.telemetry is not None:
+            self.telemetry.add_busy(start, duration)
+
+    def add_completion(self, proc):
+        self.completed += 1
+        self.sketches['turnaround'].add(proc.turnaround_time)
+        self.sketches['waiting'].add(proc.waiting_time)
+        if proc.response_time != -1:
+            self.sketches['response'].add(proc.response_time)
+        if proc.completion_time > self.makespan:
+            self.makespan = proc.completion_time
+        if self.telemetry is not None:
+            self.telemetry.add_step(proc.completion_time, -1)
+            self.telemetry.add_completion(proc.completion_time)
+
+    def metrics(self):
+        """Return the same averages, percentiles and rates as compute_run_metrics."""
+        makespan = self.makespan
+        return {
+            'avg_turnaround': self.sketches['turnaround'].mean(),
+            'avg_waiting': self.sketches['waiting'].mean(),
+            'avg_response': self.sketches['response'].mean(),
+            'percentiles': {
+                metric: {label: sketch.quantile(q) for label, q in PERCENTILES}
+                for metric, sketch in self.sketches.items()
+            },
+            'cpu_utilization': self.busy_time / makespan * 100 if makespan else 0,
+            'throughput': self.completed / makespan if makespan else 0,
+            'makespan': makespan,
+            'context_switches': self.context_switches,
+            'completed': self.completed
+        }
 
-# Set window icon (if available)
-try:
-    root.iconbitmap("")  # Add icon path if available
-except:
+# Summary-only scheduling over a stream of processes (no Gantt chart)
+def summary_scheduling(processes, algorithm, quantum=None, context_switch=0, summary=None):
+    """Run algorithm over processes and fold the results into a RunSummary.
+
+    processes may be any iterable sorted by arrival time, e.g.
+    TraceFile.iter_processes(); it is consumed lazily and finished
+    processes are dropped, so memory is O(ready set).  Segments and
+    completions go straight to the summary instead of a Gantt chart.
+    Ties are broken like the list-based engines: arrivals in input order,
+    and a preempted process ahead of waiting processes with the same key.
+    The algorithm's policy is the summary attribute of its registry entry.
+    """
+    scheduler = get_scheduler(algorithm)
+    if "summary" not in scheduler.capabilities:
+        raise ValueError(f"Summary-only mode does not support {algorithm}")
+    key, preemptive, round_robin = scheduler.summary
+    if round_robin and not quantum:
+        raise ValueError("Time quantum is required for Round-Robin")
+    summary = RunSummary() if summary is None else summary
+    arrivals = iter(processes)
+    upcoming = next(arrivals, None)
+    ready_queue = []
+    seq = 0
+    preempted = 0
+    time = 0
+    running = None
+    requeue = None  # Round-robin process waiting to go behind this slice's arrivals
+    last_proc = None
+    while True:
+        # Admit arrivals
+        while upcoming is not None and upcoming.arrival_time <= time:
+            heapq.heappush(ready_queue, (key(upcoming), seq, upcoming))
+            seq += 1
+            summary.add_arrival(upcoming)
+            following = next(arrivals, None)
+            if following is not None and following.arrival_time < upcoming.arrival_time:
+                raise ValueError("Processes must be sorted by arrival time")
+            upcoming = following
+        if requeue is not None:
+            heapq.heappush(ready_queue, (0, seq, requeue))
+            seq += 1
+            requeue = None
+
+        # Preempt when the best waiting process is strictly better
+        if preemptive and running is not None and ready_queue and ready_queue[0][0] < key(running):
+            preempted += 1
+            heapq.heappush(ready_queue, (key(running), -preempted, running))
+            running = None
+
+        if running is None:
+            if not ready_queue:
+                if upcoming is None:
+                    break
+                summary.add_segment(time, "Idle", upcoming.arrival_time - time)
+                time = upcoming.arrival_time
+                continue
+            running = heapq.heappop(ready_queue)[2]
+            if context_switch and last_proc is not None and last_proc is not running:
+                summary.add_segment(time, "Switch", context_switch)
+                time += context_switch
+            last_proc = running
+            if running.response_time == -1:
+                running.response_time = time - running.arrival_time
+
+        # Run until completion, the end of the quantum or (preemptive) the next arrival
+        run = running.remaining_time
+        if round_robin:
+            run = min(run, quantum)
+        elif preemptive and upcoming is not None:
+            run = min(run, max(upcoming.arrival_time - time, 1))
+        summary.add_segment(time, running.name, run)
+        running.remaining_time -= run
+        time += run
+        if running.remaining_time == 0:
+            finish_process(running, time)
+            summary.add_completion(running)
+            running = None
+        elif round_robin:
+            requeue = running
+            running = None
+    return summary
+
+# Objectives the round-robin quantum tuner can minimise
+TUNING_OBJECTIVES = ("avg_response", "avg_waiting", "avg_turnaround",
+                     "p95_response", "p99_response", "p95_waiting", "p99_waiting", "context_switches")
+
+# Raised inside a tuning run once it can no longer beat the incumbent
+class CandidatePruned(Exception):
     pass
 
-# Make window resizable
-root.resizable(True, True)
-
-# Center window on screen
-root.update_idletasks()
-width = root.winfo_width()
-height = root.winfo_height()
-x = (root.winfo_screenwidth() // 2) - (width // 2)
-y = (root.winfo_screenheight() // 2) - (height // 2)
-root.geometry(f"{width}x{height}+{x}+{y}")
-
-# Create main container with padding
-main_container = ctk.CTkFrame(root, corner_radius=0, fg_color="transparent")
-main_container.pack(fill="both", expand=True, padx=20, pady=20)
-
-# Input frame with enhanced styling
-input_frame = ctk.CTkFrame(
-    main_container, 
-    corner_radius=20,
-    fg_color=("white", "gray20"),
-    border_width=2,
-    border_color=("gray80", "gray30")
+# RunSummary that stops a run as soon as its objective is known to exceed a bound
+class PruningSummary(RunSummary):
+    """Stops a run once the objective is known to be worse than bound.
+
+    Times are never negative, so a running sum over total processes bounds
+    a mean from below, and a percentile exceeds bound once more than the
+    values above its rank are already greater than bound.  The switch count
+    only grows.  The running mean is divided exactly like the final one,
+    so a candidate that ties the incumbent is never pruned.
+    """
+    def __init__(self, objective, bound, total):
+        super().__init__()
+        self.objective = objective
+        self.bound = bound
+        self.total = total
+        self.kind, self.metric = objective.split("_", 1)
+        if self.kind != "avg" and self.kind != "context":
+            self.over_limit = total - quantile_rank(int(self.kind[1:]) / 100, total)
+        self.value_sum = 0
+        self.over = 0
+
+    def add_segment(self, start, proc_name, duration):
+        super().add_segment(start, proc_name, duration)
+        if self.kind == "context" and self.context_switches > self.bound:
+            raise CandidatePruned()
+
+    def add_completion(self, proc):
+        super().add_completion(proc)
+        if self.kind == "context":
+            return
+        value = getattr(proc, f"{self.metric}_time")
+        if self.kind == "avg":
+            self.value_sum += value
+            if self.value_sum / self.total > self.bound:
+                raise CandidatePruned()
+        elif value > self.bound:
+            self.over += 1
+            if self.over >= self.over_limit:
+                raise CandidatePruned()
+
+# Helper function to read an objective from RunSummary.metrics()
+def objective_value(metrics, objective):
+    if objective == "context_switches":
+        return metrics['context_switches']
+    kind, metric = objective.split("_", 1)
+    if kind == "avg":
+        return metrics[f"avg_{metric}"]
+    return metrics['percentiles'][metric][kind]
+
+# Workload shared with the tuning worker processes
+_tuning_rows = None
+
+def _set_tuning_rows(rows):
+    global _tuning_rows
+    _tuning_rows = rows
+
+# Function to evaluate one round-robin quantum in summary-only mode
+def evaluate_quantum(quantum, objective, context_switch=0, bound=None, rows=None):
+    """Return (quantum, objective value), or (quantum, None) if pruned by bound."""
+    rows = _tuning_rows if rows is None else rows
+    processes = (Process(name, arrival_time, burst_time) for name, arrival_time, burst_time in rows)
+    summary = RunSummary() if bound is None else PruningSummary(objective, bound, len(rows))
+    try:
+        summary_scheduling(processes, "Round-Robin, RR", quantum, context_switch, summary)
+    except CandidatePruned:
+        return quantum, None
+    return quantum, objective_value(summary.metrics(), objective)
+
+# Function to search for the best round-robin time quantum
+def tune_round_robin_quantum(proc_list, objective="avg_response", quanta=None, context_switch=0, workers=None, prune=True):
+    """Return (best quantum, curve) for round-robin on proc_list.
+
+    quanta defaults to 1..longest burst and curve is a list of
+    (quantum, objective value) in quantum order.  Candidates run on a pool
+    of worker processes, one wave of `workers` at a time, in coarse-to-fine
+    order so a good incumbent is found early.  With prune, each candidate
+    stops as soon as it is known to be worse than the best one of earlier
+    waves and its value in the curve is None.  Ties go to the smaller
+    quantum.  Runs use summary_scheduling, so no Gantt charts are built.
+    """
+    if objective not in TUNING_OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective}; use one of {', '.join(TUNING_OBJECTIVES)}")
+    if not proc_list:
+        raise ValueError("No processes to tune for")
+    rows = [(p.name, p.arrival_time, p.burst_time) for p in sorted(proc_list, key=lambda p: p.arrival_time)]
+    if quanta is None:
+        quanta = range(1, max(p.burst_time for p in proc_list) + 1)
+    quanta = sorted(set(quanta))
+    if any(q < 1 for q in quanta):
+        raise ValueError("Time quanta must be positive integers")
+
+    # Coarse-to-fine order: every 2^k-th candidate first, then the ones in between
+    order = []
+    seen = set()
+    step = 1 << (len(quanta) - 1).bit_length()
+    while step:
+        for index in range(0, len(quanta), step):
+            if index not in seen:
+                seen.add(index)
+                order.append(quanta[index])
+        step //= 2
+
+    workers = min(workers or os.cpu_count() or 1, len(quanta))
+    executor = ProcessPoolExecutor(workers, initializer=_set_tuning_rows, initargs=(rows,)) if workers > 1 else None
+    results = {}
+    best = None  # (value, quantum)
+    try:
+        for start in range(0, len(order), workers):
+            wave = order[start:start + workers]
+            bound = best[0] if prune and best is not None else None
+            if executor is not None:
+                outcomes = executor.map(evaluate_quantum, wave, [objective] * len(wave),
+                                        [context_switch] * len(wave), [bound] * len(wave))
+            else:
+                outcomes = [evaluate_quantum(wave[0], objective, context_switch, bound, rows)]
+            for quantum, value in outcomes:
+                results[quantum] = value
+                if value is not None and (best is None or (value, quantum) < best):
+                    best = (value, quantum)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return best[1], [(quantum, results[quantum]) for quantum in quanta]
+
+# Workloads with fewer processes than this are simulated in one piece
+SHARD_MIN_PROCESSES = 5000
+SHARD_IPC_SECONDS = 1e-5  # Rough cost per process of sending a shard to a worker and back
+SHARD_BATCH_PROCESSES = 32  # Short busy periods are run through the engine together
+
+# Function to find where the CPU goes idle with nothing pending
+def busy_period_starts(arrival_times, burst_times):
+    """Return the indices of an arrival-sorted workload that start a busy period.
+
+    A busy period runs until its arrival time plus the prefix sum of its
+    bursts; the next process arriving strictly later finds the CPU idle and
+    the ready queue empty.  This holds for any work-conserving policy
+    without context-switch cost, whatever order it runs the processes in.
+    """
+    starts = []
+    busy_until = None
+    for i, (arrival_time, burst_time) in enumerate(zip(arrival_times, burst_times)):
+        if busy_until is None or arrival_time > busy_until:
+            starts.append(i)
+            busy_until = arrival_time
+        busy_until += burst_time
+    return starts
+
+# Helper function to run busy periods one by one, each shifted to start at time 0
+def run_busy_periods(run, options, periods):
+    """Run each (offset, procs) period through run and return [(Gantt chart, length)].
+
+    Arrival times are shifted back by offset for the engine and restored
+    afterwards, completion times forward, so the processes end up with
+    absolute times; each procs list is left in the engine's order.
+    """
+    results = []
+    for offset, procs in periods:
+        for proc in procs:
+            proc.arrival_time -= offset
+        try:
+            gantt_chart = run(procs, options)
+        finally:
+            for proc in procs:
+                proc.arrival_time += offset
+        for proc in procs:
+            proc.completion_time += offset
+        results.append((gantt_chart, sum(duration for _, duration in gantt_chart)))
+    return results
+
+# Function to simulate a shard of busy periods (runs in a worker process)
+def simulate_shard(algorithm, options, periods):
+    """Return [(Gantt chart, length, metrics)] for periods of (offset, rows).
+
+    rows hold (name, arrival, burst, priority); metrics hold (name,
+    completion, turnaround, waiting, response) in the engine's order.
+    """
+    periods = [(offset, [Process(*row) for row in rows]) for offset, rows in periods]
+    results = run_busy_periods(get_scheduler(algorithm).run, options, periods)
+    return [
+        (gantt_chart, length, [(p.name, p.completion_time, p.turnaround_time, p.waiting_time, p.response_time) for p in procs])
+        for (_, procs), (gantt_chart, length) in zip(periods, results)
+    ]
+
+# Function to simulate a large workload as independent busy periods in parallel
+def sharded_scheduling(proc_list, algorithm, time_quantum=None, seed=0, aging_interval=None, workers=None,
+                       min_shard=SHARD_MIN_PROCESSES, batch=SHARD_BATCH_PROCESSES, checkpoint_path=None):
+    """Run algorithm like run_algorithm, one busy period at a time.
+
+    The algorithm needs the "busy_periods" capability and runs without
+    context-switch cost.  Every busy period is shifted to start at time 0
+    and simulated on its own, so engines that are superlinear in the number
+    of processes only pay for each period's size.  Periods shorter than
+    batch processes are simulated together.  With more than one worker,
+    consecutive periods are grouped into shards of at least min_shard
+    processes (about four per worker on long traces).  The first shard runs
+    here and tells how long the engine takes per process; when that is more
+    than shipping a process to a worker costs (SHARD_IPC_SECONDS), the other
+    shards run on a pool of worker processes.  The Gantt charts are stitched
+    with one Idle segment per gap and proc_list ends up with the metrics, in
+    the order the engine would have left it.  Returns the Gantt chart.  A
+    workload that is one busy period runs unsplit and, with checkpoint_path,
+    takes snapshots like run_algorithm's.
+    """
+    scheduler = get_scheduler(algorithm)
+    if "busy_periods" not in scheduler.capabilities:
+        raise ValueError(f"{algorithm} cannot be split into busy periods.")
+    if "quantum" in scheduler.required and time_quantum is None:
+        raise ValueError(f"Please provide a valid Time Quantum for {algorithm}.")
+    options = dict(time_quantum=time_quantum, context_switch=0, seed=seed,
+                   aging_interval=aging_interval, checkpoint_path=None)
+    ordered = sorted(proc_list, key=lambda p: p.arrival_time)
+    starts = busy_period_starts((p.arrival_time for p in ordered), (p.burst_time for p in ordered))
+    if len(starts) < 2:
+        return scheduler.run(proc_list, dict(options, checkpoint_path=checkpoint_path))
+    # Consecutive short periods form one batch, whose gaps the engine handles itself
+    periods = []
+    lo = 0
+    for hi in starts[1:] + [len(ordered)]:
+        if hi - lo >= batch or hi == len(ordered):
+            periods.append((ordered[lo].arrival_time, ordered[lo:hi]))
+            lo = hi
+
+    workers = workers or os.cpu_count() or 1
+    by_name = {proc.name: proc for proc in ordered}
+    results = []
+    done = 0  # Periods simulated so far
+    # Metrics come back from the workers by name, so duplicate names stay in this process
+    if workers > 1 and len(by_name) == len(ordered) and len(ordered) >= 2 * min_shard:
+        target = max(min_shard, math.ceil(len(ordered) / (workers * 4)))
+        # The first shard runs here and measures what the engine costs per process
+        shard_size = 0
+        while done < len(periods) and shard_size < target:
+            shard_size += len(periods[done][1])
+            done += 1
+        started = monotonic()
+        results = run_busy_periods(scheduler.run, options, periods[:done])
+        if done < len(periods) and (monotonic() - started) / shard_size > SHARD_IPC_SECONDS:
+            shards = [[]]
+            shard_size = 0
+            for offset, procs in periods[done:]:
+                if shard_size >= target:
+                    shards.append([])
+                    shard_size = 0
+                shards[-1].append((offset, [(p.name, p.arrival_time, p.burst_time, p.priority) for p in procs]))
+                shard_size += len(procs)
+            with ProcessPoolExecutor(min(workers, len(shards))) as executor:
+                shard_results = executor.map(simulate_shard, repeat(algorithm), repeat(options), shards)
+                for (_, procs), (gantt_chart, length, metrics) in zip(periods[done:], (r for shard in shard_results for r in shard)):
+                    procs.clear()
+                    for name, completion_time, turnaround_time, waiting_time, response_time in metrics:
+                        proc = by_name[name]
+                        proc.completion_time = completion_time
+                        proc.turnaround_time = turnaround_time
+                        proc.waiting_time = waiting_time
+                        proc.response_time = response_time
+                        procs.append(proc)
+                    results.append((gantt_chart, length))
+            done = len(periods)
+    results += run_busy_periods(scheduler.run, options, periods[done:])
+
+    # Stitch the periods back together with the idle gaps between them
+    gantt_chart = []
+    clock = 0
+    order = []
+    for (offset, procs), (period_gantt, length) in zip(periods, results):
+        if offset > clock:
+            gantt_chart.append(("Idle", offset - clock))
+        gantt_chart.extend(period_gantt)
+        clock = offset + length
+        order.extend(procs)
+    proc_list[:] = order
+    return gantt_chart
+
+# Binary trace format: a 32-byte header followed by little-endian int64 columns
+# (arrival, burst, then priority and deadline when the matching flag is set)
+TRACE_MAGIC = b"CPUTRACE"
+TRACE_VERSION = 1
+TRACE_HAS_PRIORITY = 1
+TRACE_HAS_DEADLINE = 2
+TRACE_HEADER = struct.Struct("<8sHHIQ8x")  # magic, version, flags, reserved, process count
+TRACE_EXTENSION = ".cputrace"
+TRACE_SUMMARY_PROCESSES = 200000  # Longer traces opened in the GUI run in summary-only mode
+
+# Function to write a workload as a binary trace file
+def write_trace(path, arrival_times, burst_times, priorities=None, deadlines=None, chunk_size=1 << 16):
+    """Stream workload columns into a binary trace and return the process count.
+
+    Each column may be any iterable (generators included); values are
+    written in chunks of chunk_size, so memory use does not grow with the
+    trace.  All columns must have the same length.
+    """
+    def chunks(column):
+        values = iter(column)
+        while True:
+            chunk = array('q', islice(values, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    return write_trace_chunks(path, chunks(arrival_times), chunks(burst_times),
+                              chunks(priorities) if priorities is not None else None,
+                              chunks(deadlines) if deadlines is not None else None)
+
+# Function to write a binary trace from columns given as int64 array chunks
+def write_trace_chunks(path, arrival_chunks, burst_chunks, priority_chunks=None, deadline_chunks=None):
+    flags = (TRACE_HAS_PRIORITY if priority_chunks is not None else 0) | (TRACE_HAS_DEADLINE if deadline_chunks is not None else 0)
+    columns = [arrival_chunks, burst_chunks] + [c for c in (priority_chunks, deadline_chunks) if c is not None]
+    count = None
+    with open(path, "wb") as f:
+        f.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, flags, 0, 0))
+        for column in columns:
+            written = 0
+            for chunk in column:
+                if sys.byteorder == "big":
+                    chunk = array('q', chunk)
+                    chunk.byteswap()
+                chunk.tofile(f)
+                written += len(chunk)
+            if count is None:
+                count = written
+            elif written != count:
+                raise ValueError("All trace columns must have the same number of values.")
+        # The count is only known once the first column has been streamed
+        f.seek(0)
+        f.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, flags, 0, count))
+    return count
+
+# Memory-mapped, zero-copy reader for binary trace files
+class TraceFile:
+    """Open a binary trace without parsing it.
+
+    arrival_times, burst_times, priorities and deadlines are int64
+    memoryviews straight into the mapped file (priorities/deadlines are None
+    when absent), so opening a trace is O(1) and pages are only read when
+    accessed.  Close the trace (or use it as a context manager) once done.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            if os.fstat(self.file.fileno()).st_size < TRACE_HEADER.size:
+                raise ValueError("file is too small to be a trace")
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+        magic, version, flags, _, count = TRACE_HEADER.unpack_from(self.map, 0)
+        num_columns = 2 + bool(flags & TRACE_HAS_PRIORITY) + bool(flags & TRACE_HAS_DEADLINE)
+        if magic != TRACE_MAGIC or version != TRACE_VERSION or len(self.map) < TRACE_HEADER.size + num_columns * count * 8:
+            self.close()
+            raise ValueError("not a valid version 1 trace file")
+        self.count = count
+        self.flags = flags
+        self._view = memoryview(self.map)
+        offset = TRACE_HEADER.size
+        columns = []
+        for _ in range(num_columns):
+            columns.append(self._column(offset, count))
+            offset += count * 8
+        self.arrival_times, self.burst_times = columns[0], columns[1]
+        self.priorities = columns[2] if flags & TRACE_HAS_PRIORITY else None
+        self.deadlines = columns[-1] if flags & TRACE_HAS_DEADLINE else None
+
+    def _column(self, offset, count):
+        column = self._view[offset:offset + count * 8]
+        if sys.byteorder == "big":
+            # Big-endian hosts cannot view little-endian data in place
+            swapped = array('q', column.tobytes())
+            swapped.byteswap()
+            return memoryview(swapped)
+        return column.cast('q')
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def validate(self):
+        """Raise ValueError naming the first row with a value the input form would reject."""
+        columns = [(self.arrival_times, 0, "arrival time"), (self.burst_times, 1, "burst time")]
+        if self.priorities is not None:
+            columns.append((self.priorities, 1, "priority"))
+        if self.deadlines is not None:
+            columns.append((self.deadlines, 1, "deadline"))
+        for column, minimum, label in columns:
+            if self.count and min(column) < minimum:
+                i = next(i for i, value in enumerate(column) if value < minimum)
+                raise ValueError(f"row {i + 1} (process {process_name(i)}) has {label} {column[i]}, "
+                                 f"but it must be {'non-negative' if minimum == 0 else 'positive'}.")
+
+    def to_processes(self, start=0, stop=None):
+        """Build Process objects for rows start..stop (the whole trace by default)."""
+        stop = self.count if stop is None else min(stop, self.count)
+        priorities, deadlines = self.priorities, self.deadlines
+        return [
+            Process(name=process_name(i), pid=i, arrival_time=self.arrival_times[i], burst_time=self.burst_times[i],
+                    priority=priorities[i] if priorities is not None else None,
+                    deadline=deadlines[i] if deadlines is not None else None)
+            for i in range(start, stop)
+        ]
+
+    def iter_processes(self, chunk_size=1 << 12):
+        """Yield Process objects lazily, chunk_size rows at a time."""
+        for start in range(0, self.count, chunk_size):
+            yield from self.to_processes(start, start + chunk_size)
+
+    def close(self):
+        # Views must be released before the map can be closed
+        for name in ("arrival_times", "burst_times", "priorities", "deadlines", "_view"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+                setattr(self, name, None)
+        if getattr(self, "map", None) is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+# Burst time distributions offered by the workload generator
+BURST_DISTRIBUTIONS = ("exponential", "pareto", "bimodal")
+
+# Seeded synthetic workloads generated a chunk at a time
+class WorkloadGenerator:
+    """Reproducible synthetic workloads of count processes.
+
+    Arrivals are a Poisson process with arrival_rate processes per time unit
+    (the first arrives at 0).  Bursts follow burst_distribution with mean
+    mean_burst: "exponential", "pareto" (shape pareto_shape > 1) or "bimodal"
+    (exponential short/long means with probability p_short of a short
+    burst, given as bimodal=(short, long, p_short)); every burst is at least
+    1.  Priorities 1..len(priority_weights) are drawn with those weights.
+
+    Each column draws from its own random stream seeded from (seed, column),
+    so columns can be generated independently, e.g. streamed into
+    write_trace one after the other, and a seed always gives the same
+    workload.  Values are produced chunk_size at a time as int64 arrays.
+    """
+    def __init__(self, count, seed=0, arrival_rate=0.2, burst_distribution="exponential", mean_burst=5.0,
+                 pareto_shape=1.5, bimodal=(2.0, 20.0, 0.8), priority_weights=(1, 2, 4, 2, 1)):
+        if count < 0:
+            raise ValueError("Process count must be non-negative.")
+        if arrival_rate <= 0 or mean_burst <= 0:
+            raise ValueError("Arrival rate and mean burst must be positive.")
+        if burst_distribution not in BURST_DISTRIBUTIONS:
+            raise ValueError(f"Unknown burst distribution {burst_distribution}; use one of {', '.join(BURST_DISTRIBUTIONS)}")
+        if burst_distribution == "pareto" and pareto_shape <= 1:
+            raise ValueError("Pareto shape must be greater than 1 for the mean to exist.")
+        if not priority_weights or any(w < 0 for w in priority_weights) or not sum(priority_weights):
+            raise ValueError("Priority weights must be non-negative and not all zero.")
+        self.count = count
+        self.seed = seed
+        self.arrival_rate = arrival_rate
+        self.burst_distribution = burst_distribution
+        self.mean_burst = mean_burst
+        self.pareto_shape = pareto_shape
+        self.bimodal = bimodal
+        self.priority_weights = priority_weights
+
+    def column(self, name, chunk_size=1 << 16):
+        """Yield the "arrival", "burst" or "priority" column as int64 array chunks."""
+        rng = random.Random(f"{self.seed}:{name}")
+        if name == "arrival":
+            expovariate, rate = rng.expovariate, self.arrival_rate
+            clock = 0.0
+            def make(n):
+                nonlocal clock
+                times = list(accumulate(map(expovariate, repeat(rate, n)), initial=clock))
+                clock = times.pop()
+                return map(int, times)
+        elif name == "burst":
+            make = self._burst_sampler(rng)
+        elif name == "priority":
+            levels = range(1, len(self.priority_weights) + 1)
+            cum_weights = list(accumulate(self.priority_weights))
+            make = lambda n: rng.choices(levels, cum_weights=cum_weights, k=n)
+        else:
+            raise ValueError(f"Unknown workload column {name}")
+        for start in range(0, self.count, chunk_size):
+            yield array('q', make(min(chunk_size, self.count - start)))
+
+    def _burst_sampler(self, rng):
+        # Samples are rounded half up, and 0 becomes 1
+        expovariate, mean = rng.expovariate, self.mean_burst
+        if self.burst_distribution == "exponential":
+            return lambda n: [int(x + 0.5) or 1 for x in map(expovariate, repeat(1 / mean, n))]
+        if self.burst_distribution == "pareto":
+            paretovariate, shape = rng.paretovariate, self.pareto_shape
+            scale = mean * (shape - 1) / shape
+            return lambda n: [int(scale * x + 0.5) or 1 for x in map(paretovariate, repeat(shape, n))]
+        short_rate, long_rate = 1 / self.bimodal[0], 1 / self.bimodal[1]
+        p_short, rand = self.bimodal[2], rng.random
+        return lambda n: [int(expovariate(short_rate if rand() < p_short else long_rate) + 0.5) or 1 for _ in range(n)]
+
+    def values(self, name, chunk_size=1 << 16):
+        for chunk in self.column(name, chunk_size):
+            yield from chunk
+
+    def processes(self, chunk_size=1 << 16):
+        """Yield Process objects in arrival order, e.g. for summary_scheduling."""
+        columns = zip(self.column("arrival", chunk_size), self.column("burst", chunk_size), self.column("priority", chunk_size))
+        index = 0
+        for arrivals, bursts, priorities in columns:
+            for arrival_time, burst_time, priority in zip(arrivals, bursts, priorities):
+                yield Process(process_name(index), arrival_time, burst_time, priority, pid=index)
+                index += 1
+
+    def write_trace(self, path, chunk_size=1 << 16):
+        """Stream the workload into a binary trace file and return the process count."""
+        return write_trace_chunks(path, self.column("arrival", chunk_size), self.column("burst", chunk_size),
+                                  self.column("priority", chunk_size))
+
+# NumPy .npy column format, written without needing NumPy installed
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+NPY_HEADER_SIZE = 128  # Fixed so the shape can be patched in once the length is known
+NPY_DTYPES = {'q': '<i8', 'i': '<i4'}
+
+# Streaming writer for one int column in .npy format
+class NpyColumnWriter:
+    def __init__(self, path, typecode='q'):
+        self.path = path
+        self.typecode = typecode
+        self.count = 0
+        self.file = open(path, "wb")
+        self.file.write(self._header())
+
+    def _header(self):
+        header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (NPY_DTYPES[self.typecode], self.count)
+        header = header.ljust(NPY_HEADER_SIZE - len(NPY_MAGIC) - 2 - 1) + "\n"
+        return NPY_MAGIC + struct.pack("<H", len(header)) + header.encode("latin1")
+
+    def append(self, values):
+        chunk = array(self.typecode, values)
+        if sys.byteorder == "big":
+            chunk.byteswap()
+        chunk.tofile(self.file)
+        self.count += len(chunk)
+
+    def close(self):
+        self.file.seek(0)
+        self.file.write(self._header())
+        self.file.close()
+
+# Function to map a .npy column written by NpyColumnWriter without copying it
+def read_npy_column(path):
+    """Return a read-only memoryview over the column's values.
+
+    With NumPy installed, numpy.load(path, mmap_mode="r") gives the same
+    zero-copy view as an ndarray.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapped[:len(NPY_MAGIC)] != NPY_MAGIC:
+        mapped.close()
+        raise ValueError(f"{path} is not a version 1.0 .npy file")
+    header_len = struct.unpack_from("<H", mapped, len(NPY_MAGIC))[0]
+    header = mapped[len(NPY_MAGIC) + 2:len(NPY_MAGIC) + 2 + header_len].decode("latin1")
+    typecode = next((code for code, descr in NPY_DTYPES.items() if f"'{descr}'" in header), None)
+    if typecode is None or sys.byteorder == "big":
+        mapped.close()
+        raise ValueError(f"{path} has an unsupported dtype for zero-copy reading")
+    # The memoryview keeps the map alive for as long as it is referenced
+    return memoryview(mapped)[len(NPY_MAGIC) + 2 + header_len:].cast(typecode)
+
+# Per-process metric columns exported with every run (None is stored as -1)
+EXPORT_PROCESS_FIELDS = (
+    "arrival_time", "burst_time", "priority", "deadline", "period", "tickets",
+    "completion_time", "turnaround_time", "waiting_time", "response_time",
+    "io_time", "io_wait_time", "jobs_completed", "deadline_misses"
 )
-input_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-# Configure grid weights for responsive design
-input_frame.grid_columnconfigure(0, weight=1)
-input_frame.grid_columnconfigure(1, weight=1)
-input_frame.grid_columnconfigure(2, weight=1)
+# Function to export a run as a directory of columnar .npy files
+def export_run(directory, proc_list, gantt_chart, algorithm, chunk_size=1 << 16, time_scale=1):
+    """Write the Gantt timeline and per-process metrics as .npy columns.
+
+    gantt_start/gantt_duration/gantt_process hold one row per segment
+    (gantt_process indexes process_names, -1 = Idle, -2 = Switch) and
+    process_<field> holds one row per process.  gantt_chart may be any
+    iterable and is streamed in chunks.  metadata.json describes the run;
+    times are integer engine units, time_scale of them per time unit.
+    """
+    os.makedirs(directory, exist_ok=True)
+    names = [proc.name for proc in proc_list]
+    index_of = {name: i for i, name in enumerate(names)}
+    index_of["Idle"] = -1
+    index_of["Switch"] = -2
+
+    starts = NpyColumnWriter(os.path.join(directory, "gantt_start.npy"))
+    durations = NpyColumnWriter(os.path.join(directory, "gantt_duration.npy"))
+    owners = NpyColumnWriter(os.path.join(directory, "gantt_process.npy"), 'i')
+    time = 0
+    segments = iter(gantt_chart)
+    while True:
+        chunk = list(islice(segments, chunk_size))
+        if not chunk:
+            break
+        chunk_starts = []
+        for _, duration in chunk:
+            chunk_starts.append(time)
+            time += duration
+        starts.append(chunk_starts)
+        durations.append(duration for _, duration in chunk)
+        owners.append(index_of[proc_name] for proc_name, _ in chunk)
+    for writer in (starts, durations, owners):
+        writer.close()
+
+    for field in EXPORT_PROCESS_FIELDS:
+        writer = NpyColumnWriter(os.path.join(directory, f"process_{field}.npy"))
+        for i in range(0, len(proc_list), chunk_size):
+            writer.append(-1 if getattr(proc, field) is None else getattr(proc, field) for proc in proc_list[i:i + chunk_size])
+        writer.close()
+
+    metadata = {
+        "format": "cpu-scheduling-run",
+        "version": 1,
+        "algorithm": algorithm,
+        "num_segments": starts.count,
+        "num_processes": len(proc_list),
+        "total_time": time,
+        "time_scale": time_scale,
+        "process_names": names,
+        "gantt_columns": ["gantt_start", "gantt_duration", "gantt_process"],
+        "process_columns": [f"process_{field}" for field in EXPORT_PROCESS_FIELDS],
+        "missing_value": -1,
+        "percentiles": summarize_processes(proc_list)['percentiles']
+    }
+    with open(os.path.join(directory, "metadata.json"), "w") as f:
+        json.dump(metadata, f, indent=2)
+    return metadata
+
+# SQLite run history: one row per simulation with its settings and summary metrics
+HISTORY_DB_PATH = os.path.join(os.path.expanduser("~"), ".cpu_scheduler_history.sqlite3")
+HISTORY_COLUMNS = (
+    "created_at", "workload_hash", "algorithm", "quantum", "context_switch", "aging_interval", "seed",
+    "num_processes", "avg_turnaround", "avg_waiting", "avg_response", "cpu_utilization",
+    "throughput", "context_switches", "makespan", "miss_ratio"
+)
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    workload_hash TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    quantum INTEGER,
+    context_switch INTEGER,
+    aging_interval INTEGER,
+    seed INTEGER,
+    num_processes INTEGER,
+    avg_turnaround REAL,
+    avg_waiting REAL,
+    avg_response REAL,
+    cpu_utilization REAL,
+    throughput REAL,
+    context_switches INTEGER,
+    makespan INTEGER,
+    miss_ratio REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_workload ON runs (workload_hash, algorithm);
+CREATE INDEX IF NOT EXISTS idx_runs_algorithm ON runs (algorithm, quantum);
+CREATE INDEX IF NOT EXISTS idx_runs_quantum ON runs (quantum);
+"""
+
+# Helper function to describe one process of a workload for hashing
+def workload_row(proc):
+    return (proc.arrival_time, tuple(proc.bursts), proc.priority or 0, proc.deadline or 0, proc.period or 0, proc.tickets or 0)
+
+# Function to hash a workload, independent of the order its processes are listed in
+def workload_hash(proc_list, time_scale=1):
+    rows = sorted(workload_row(proc) for proc in proc_list)
+    # The resolution is the smallest that holds the times, so (scale, rows) identifies a fractional workload
+    return hashlib.sha256(repr(rows if time_scale == 1 else (time_scale, rows)).encode()).hexdigest()
+
+# Function to hash a trace sorted by arrival time like workload_hash, without holding all its rows
+def trace_workload_hash(trace):
+    digest = hashlib.sha256(b"[")
+    separator = b""
+    # Only rows with equal arrival times need sorting among themselves
+    for _, group in groupby(trace.iter_processes(), key=lambda p: p.arrival_time):
+        for row in sorted(workload_row(proc) for proc in group):
+            digest.update(separator + repr(row).encode())
+            separator = b", "
+    digest.update(b"]")
+    return digest.hexdigest()
+
+# Function to build the history row of a finished run
+def history_row(proc_list, gantt_chart, algorithm, options, workload, time_scale=1):
+    """Times are stored in the units they were typed in (engine units / time_scale)."""
+    return metrics_history_row(compute_run_metrics(proc_list, gantt_chart), len(proc_list), algorithm, options,
+                               workload, time_scale)
+
+# Function to build a history row from compute_run_metrics() or RunSummary.metrics() results
+def metrics_history_row(metrics, num_processes, algorithm, options, workload, time_scale=1):
+    metrics = unscale_metrics(metrics, time_scale)
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "workload_hash": workload,
+        "algorithm": algorithm,
+        "quantum": unscale_time(options.get("time_quantum"), time_scale),
+        "context_switch": unscale_time(options.get("context_switch", 0), time_scale),
+        "aging_interval": unscale_time(options.get("aging_interval"), time_scale),
+        "seed": options.get("seed", 0),
+        "num_processes": num_processes,
+        "avg_turnaround": metrics['avg_turnaround'],
+        "avg_waiting": metrics['avg_waiting'],
+        "avg_response": metrics['avg_response'],
+        "cpu_utilization": metrics['cpu_utilization'],
+        "throughput": metrics['throughput'],
+        "context_switches": metrics['context_switches'],
+        "makespan": metrics['makespan'],
+        "miss_ratio": metrics['miss_ratio'] if metrics.get('deadline_jobs') else None
+    }
+
+# SQLite-backed store of past simulations
+class RunHistory:
+    def __init__(self, path=HISTORY_DB_PATH):
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(HISTORY_SCHEMA)
+
+    def record(self, rows):
+        """Insert many run rows in a single transaction."""
+        placeholders = ", ".join("?" for _ in HISTORY_COLUMNS)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO runs ({', '.join(HISTORY_COLUMNS)}) VALUES ({placeholders})",
+                ([row[column] for column in HISTORY_COLUMNS] for row in rows)
+            )
+
+    def page(self, before_id=None, limit=50, algorithm=None, workload=None, max_quantum=None):
+        """Return up to limit runs older than before_id, newest first.
+
+        algorithm, workload and max_quantum (inclusive) narrow the runs down.
+        Paging is keyed on the run id, so each page is an index range scan
+        and nothing beyond the page is loaded.
+        """
+        conditions, params = [], []
+        if before_id is not None:
+            conditions.append("id < ?")
+            params.append(before_id)
+        if algorithm is not None:
+            conditions.append("algorithm = ?")
+            params.append(algorithm)
+        if workload is not None:
+            conditions.append("workload_hash = ?")
+            params.append(workload)
+        if max_quantum is not None:
+            conditions.append("quantum <= ?")
+            params.append(max_quantum)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.conn.execute(f"SELECT * FROM runs {where} ORDER BY id DESC LIMIT ?", params + [limit]).fetchall()
+
+    def best_run(self, workload, metric="avg_waiting", algorithm=None):
+        """Return the run of a workload with the lowest value of metric."""
+        if metric not in HISTORY_COLUMNS:
+            raise ValueError(f"Unknown history metric: {metric}")
+        query = f"SELECT * FROM runs WHERE workload_hash = ? AND {metric} IS NOT NULL"
+        params = [workload]
+        if algorithm is not None:
+            query += " AND algorithm = ?"
+            params.append(algorithm)
+        return self.conn.execute(query + f" ORDER BY {metric} LIMIT 1", params).fetchone()
+
+    def close(self):
+        self.conn.close()
+
+# Function to run many simulations, optionally recording them in the history
+def run_batch(jobs, history=None, batch_size=500):
+    """Run (proc_list, algorithm, options) jobs and return their history rows.
+
+    options are keyword arguments for run_algorithm.  Each job runs on a
+    deep copy of its processes so one workload can be reused across jobs.
+    Rows are inserted into history batch_size at a time, one transaction each.
+    """
+    results = []
+    pending = []
+    for proc_list, algorithm, options in jobs:
+        workload = workload_hash(proc_list)
+        run_procs = deepcopy(proc_list)
+        gantt_chart = run_algorithm(run_procs, algorithm, **options)
+        row = history_row(run_procs, gantt_chart, algorithm, options, workload)
+        results.append(row)
+        if history is not None:
+            pending.append(row)
+            if len(pending) >= batch_size:
+                history.record(pending)
+                pending = []
+    if history is not None and pending:
+        history.record(pending)
+    return results
+
+# Local simulation service (python pg.py serve): HTTP/JSON over asyncio, engines in worker processes
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_BATCH_WINDOW = 0.002  # Seconds a request waits for others to share its trip to a worker
+SERVICE_MAX_BATCH = 64
+SERVICE_MAX_BODY = 64 << 20
+SERVICE_TIME_OPTIONS = (("time_quantum", 1), ("context_switch", 0), ("aging_interval", 1))
+SERVICE_TIME_FIELDS = ("deadline", "period")
+SERVICE_MAX_PROCESSES = 5000
+SERVICE_MAX_TIME = 10 ** 9  # Largest time a request may give, in its own units
+SERVICE_MAX_STEPS = 10 ** 6  # Largest number of time slices or periodic jobs a request may simulate
+SERVICE_TIMEOUT = 30  # Seconds per request a chunk may spend in a worker
+
+# Helper function to check one integer of a service request
+def service_int(value, label, minimum=None):
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{label} must be an integer.")
+    if minimum is not None and value < minimum:
+        raise ValueError(f"{label} must be a {'positive' if minimum > 0 else 'non-negative'} integer.")
+    return value
+
+# Helper function to check one time of a service request; the number's text is parsed later
+def service_time(value, label):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{label} must be a number.")
+    if not -SERVICE_MAX_TIME <= value <= SERVICE_MAX_TIME:
+        raise ValueError(f"{label} must be at most {SERVICE_MAX_TIME}.")
+    return str(value)
+
+# Function to validate a service request and build its processes
+def service_request(payload):
+    """Return (proc_list, algorithm, options, time_scale) for a /simulate request body.
+
+    The body names the algorithm, lists the processes as objects with
+    arrival and burst (or bursts, CPU/I-O/CPU/...) plus optional priority,
+    deadline, period and tickets, and may set time_quantum,
+    context_switch, seed and aging_interval.  Times may have decimals and
+    are scaled to integers like the input form's.  options are keyword
+    arguments for run_algorithm.  Raises ValueError like process_input.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("The request body must be a JSON object.")
+    algorithm = payload.get("algorithm")
+    if not isinstance(algorithm, str):
+        raise ValueError("Please name the scheduling algorithm.")
+    scheduler = get_scheduler(algorithm)
+    rows = payload.get("processes")
+    if not isinstance(rows, list) or not rows:
+        raise ValueError("Please provide a non-empty list of processes.")
+    if len(rows) > SERVICE_MAX_PROCESSES:
+        raise ValueError(f"A request can have at most {SERVICE_MAX_PROCESSES} processes.")
+    settings = {key: service_time(payload[key], key) for key, _ in SERVICE_TIME_OPTIONS if payload.get(key) is not None}
+    seed = 0 if payload.get("seed") is None else service_int(payload["seed"], "seed")
+
+    # Check every row and collect its times as text, so one resolution can be picked for all of them
+    parsed = []
+    tokens = list(settings.values())
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise ValueError(f"Process {i} must be a JSON object.")
+        bursts = row.get("bursts", [row.get("burst")])
+        if not isinstance(bursts, list) or len(bursts) % 2 == 0:
+            raise ValueError(f"Process {i}: burst sequences must start and end with a CPU burst.")
+        if len(bursts) > 1 and "io_bursts" not in scheduler.capabilities:
+            raise ValueError("CPU/I-O burst sequences need the CPU/I-O Bursts algorithm.")
+        times = {"arrival": service_time(row.get("arrival"), f"Process {i} arrival"),
+                 "bursts": [service_time(burst, f"Process {i} burst") for burst in bursts]}
+        times.update((field, service_time(row[field], f"Process {i} {field}"))
+                     for field in SERVICE_TIME_FIELDS if row.get(field) is not None)
+        counts = {field: service_int(row[field], f"Process {i} {field}", 1)
+                  for field in ("priority", "tickets") if row.get(field) is not None}
+        tokens += [value for value in times.values() if isinstance(value, str)] + times["bursts"]
+        parsed.append((times, counts))
+    time_scale = 10 ** time_resolution(tokens)
+
+    options = {key: None for key, _ in SERVICE_TIME_OPTIONS}
+    for key, minimum in SERVICE_TIME_OPTIONS:
+        if key in settings:
+            options[key] = parse_time(settings[key], time_scale)
+            if options[key] < minimum:
+                raise ValueError(f"{key} must be a {'positive' if minimum > 0 else 'non-negative'} number.")
+    options["context_switch"] = options["context_switch"] or 0
+    options["seed"] = seed
+
+    proc_list = []
+    for i, (times, counts) in enumerate(parsed):
+        values = {field: parse_time(times[field], time_scale) for field in ("arrival",) + SERVICE_TIME_FIELDS if field in times}
+        bursts = [parse_time(burst, time_scale) for burst in times["bursts"]]
+        if values["arrival"] < 0 or min(bursts) <= 0 or any(values.get(field, 1) <= 0 for field in SERVICE_TIME_FIELDS):
+            raise ValueError(f"Process {i}: arrival must be non-negative and bursts, deadline and period positive.")
+        proc_list.append(Process(process_name(i), values["arrival"], sum(bursts[0::2]), bursts=bursts, pid=i,
+                                 deadline=values.get("deadline"), period=values.get("period"), **counts))
+    if service_steps(proc_list, scheduler, options) > SERVICE_MAX_STEPS:
+        raise ValueError(f"The schedule is too long: at most {SERVICE_MAX_STEPS} time slices or periodic jobs.")
+    return proc_list, algorithm, options, time_scale
+
+# Helper function to estimate how many engine steps a service request's schedule takes
+def service_steps(proc_list, scheduler, options):
+    """Return bursts plus quantum slices plus periodic jobs released up to the hyperperiod."""
+    steps = sum(len(proc.bursts) for proc in proc_list)
+    if "quantum" in scheduler.inputs and options["time_quantum"]:
+        steps += sum(proc.burst_time for proc in proc_list) // options["time_quantum"]
+    if "periodic" in scheduler.capabilities:
+        periods = [proc.period for proc in proc_list if proc.period]
+        hyperperiod = 1
+        for period in periods:
+            hyperperiod = hyperperiod * period // math.gcd(hyperperiod, period)
+            if hyperperiod > SERVICE_MAX_STEPS * period:
+                return math.inf  # Every process with this period alone would exceed the limit
+        steps += sum(hyperperiod // period for period in periods)
+    return steps
+
+# Function to run one service request, returning its HTTP status and JSON body
+def simulate_request(payload):
+    try:
+        proc_list, algorithm, options, time_scale = service_request(payload)
+        gantt_chart = run_algorithm(proc_list, algorithm, **options)
+    except ValueError as e:
+        return 400, json.dumps({"error": str(e)}).encode()
+    except Exception as e:
+        return 500, json.dumps({"error": f"An error occurred during simulation: {e}"}).encode()
+    # Times go back out in the units they came in
+    metrics = unscale_metrics(compute_run_metrics(proc_list, gantt_chart), time_scale)
+    metrics['lateness'] = sorted(metrics['lateness'].items())
+    proc_list.sort(key=lambda p: p.pid)
+    if time_scale != 1:
+        gantt_chart = [(proc_name, duration / time_scale) for proc_name, duration in gantt_chart]
+    return 200, json.dumps({
+        "algorithm": algorithm,
+        "gantt_chart": gantt_chart,
+        "processes": [{"name": p.name, "arrival": unscale_time(p.arrival_time, time_scale),
+                       "burst": unscale_time(p.burst_time, time_scale),
+                       "completion": unscale_time(p.completion_time, time_scale),
+                       "turnaround": unscale_time(p.turnaround_time, time_scale),
+                       "waiting": unscale_time(p.waiting_time, time_scale),
+                       "response": unscale_time(p.response_time, time_scale) if p.response_time != -1 else -1}
+                      for p in proc_list],
+        "metrics": metrics
+    }).encode()
+
+# Function run by a service worker: one trip to the pool carries a whole batch
+def simulate_requests(payloads):
+    return [simulate_request(payload) for payload in payloads]
+
+# Asyncio HTTP/JSON front end to the scheduling engines
+class SimulationService:
+    """Serves POST /simulate, POST /simulate/batch, GET /algorithms and GET /stats.
+
+    Requests arriving within batch_window of each other go to the worker
+    pool together (split evenly across the workers), so a burst of small
+    requests costs a few trips to the pool instead of one each.  Identical
+    requests in flight share one simulation.  /simulate/batch takes
+    {"runs": [request, ...]} and streams one NDJSON line per run, in the
+    order they finish.  A chunk that is still running after SERVICE_TIMEOUT
+    seconds per request answers 504; the request limits in service_request
+    keep that rare and bound how long the worker stays busy with it.
+    """
+    def __init__(self, workers=None, batch_window=SERVICE_BATCH_WINDOW, max_batch=SERVICE_MAX_BATCH):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.executor = None
+        self.queue = None
+        self.in_flight = {}  # Request digest -> future of (status, body)
+        self.stats = Counter()
+
+    async def start(self, host=SERVICE_HOST, port=SERVICE_PORT):
+        self.executor = ProcessPoolExecutor(self.workers)
+        self.queue = asyncio.Queue()
+        self.dispatcher = asyncio.ensure_future(self.dispatch())
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.dispatcher.cancel()
+        self.executor.shutdown()
+
+    async def simulate(self, payload):
+        """Return (status, body) for one request, sharing identical ones in flight."""
+        self.stats['requests'] += 1
+        key = hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).digest()
+        future = self.in_flight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+            self.queue.put_nowait((payload, future))
+        else:
+            self.stats['deduplicated'] += 1
+        # A client that goes away must not cancel the run for the others waiting on it
+        return await asyncio.shield(future)
+
+    async def dispatch(self):
+        while True:
+            batch = [await self.queue.get()]
+            if self.queue.empty():
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            self.stats['batches'] += 1
+            size = math.ceil(len(batch) / self.workers)
+            for start in range(0, len(batch), size):
+                asyncio.ensure_future(self.run_chunk(batch[start:start + size]))
+
+    async def run_chunk(self, chunk):
+        try:
+            results = await asyncio.wait_for(asyncio.get_running_loop().run_in_executor(
+                self.executor, simulate_requests, [payload for payload, _ in chunk]), SERVICE_TIMEOUT * len(chunk))
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += len(chunk)
+            results = [(504, json.dumps({"error": "The simulation took too long."}).encode())] * len(chunk)
+        except Exception as e:
+            results = [(500, json.dumps({"error": f"The worker failed: {e}"}).encode())] * len(chunk)
+        for (_, future), result in zip(chunk, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                length = int(headers.get("content-length", 0))
+                if length > SERVICE_MAX_BODY:
+                    self.write_response(writer, 413, json.dumps({"error": "Request body too large."}).encode(), False)
+                    break
+                body = await reader.readexactly(length)
+                await self.respond(method, path.partition("?")[0], body, writer, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, path, body, writer, keep_alive):
+        routes = {"/simulate": "POST", "/simulate/batch": "POST", "/algorithms": "GET", "/stats": "GET"}
+        if path not in routes:
+            self.write_response(writer, 404, json.dumps({"error": f"No such endpoint: {path}"}).encode(), keep_alive)
+            return
+        if method != routes[path]:
+            self.write_response(writer, 405, json.dumps({"error": f"Use {routes[path]} for {path}"}).encode(), keep_alive)
+            return
+        if path == "/algorithms":
+            algorithms = [{"name": name, "inputs": list(get_scheduler(name).inputs),
+                           "required": list(get_scheduler(name).required),
+                           "capabilities": sorted(get_scheduler(name).capabilities)} for name in scheduler_names()]
+            self.write_response(writer, 200, json.dumps({"algorithms": algorithms}).encode(), keep_alive)
+            return
+        if path == "/stats":
+            self.write_response(writer, 200, json.dumps(dict(self.stats, workers=self.workers)).encode(), keep_alive)
+            return
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self.write_response(writer, 400, json.dumps({"error": "The request body must be valid JSON."}).encode(), keep_alive)
+            return
+        if path == "/simulate":
+            self.write_response(writer, *await self.simulate(payload), keep_alive)
+            return
+
+        # Batch: stream each run's result as a chunked NDJSON line as soon as it is done
+        runs = payload.get("runs") if isinstance(payload, dict) else None
+        if not isinstance(runs, list):
+            self.write_response(writer, 400, json.dumps({"error": "Please provide a list of runs."}).encode(), keep_alive)
+            return
+        writer.write(f"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\n"
+                     f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode())
+
+        async def indexed(index, run):
+            return index, await self.simulate(run)
+
+        for finished in asyncio.as_completed([indexed(i, run) for i, run in enumerate(runs)]):
+            index, (status, result) = await finished
+            line = b'{"index":%d,"status":%d,"result":%s}\n' % (index, status, result)
+            writer.write(b"%x\r\n%s\r\n" % (len(line), line))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
 
-algorithms = [
-    "First Come First Serve, FCFS", 
+    def write_response(self, writer, status, body, keep_alive):
+        writer.write(f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                     + body)
+
+# Command line: serve simulations over HTTP until interrupted
+def serve_command(argv):
+    import argparse
+    import signal
+    parser = argparse.ArgumentParser(prog="pg.py serve", description="Serve simulations as HTTP/JSON on localhost.")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--batch-window", type=float, default=SERVICE_BATCH_WINDOW,
+                        help="seconds a request waits for others to share a trip to a worker")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        service = SimulationService(args.workers, args.batch_window)
+        server = await service.start(args.host, args.port)
+        print(f"Serving on http://{args.host}:{server.sockets[0].getsockname()[1]} with {service.workers} workers", flush=True)
+        # Stop cleanly on SIGTERM too, so the worker processes are not left behind
+        stopped = asyncio.Event()
+        if sys.platform != "win32":
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set)
+        try:
+            await stopped.wait()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+# A scheduling algorithm offered in the dropdown
+class Scheduler:
+    """Registry entry describing one scheduling algorithm.
+
+    run(proc_list, options) returns the Gantt chart, where options holds
+    time_quantum, context_switch, seed, aging_interval and checkpoint_path.
+    inputs are the optional fields the input form shows for it, in order
+    ("priority", "aging", "quantum", "deadline", "period", "tickets",
+    "seed"), and required the ones run_algorithm insists on.  capabilities
+    are free-form flags such as "preemptive", "checkpoint", "periodic" or
+    "io_bursts".  summary is the policy summary_scheduling runs it with,
+    (ready-queue key(proc), preemptive, round robin), and gives the
+    "summary" capability.
+    """
+    def __init__(self, name, run, inputs=(), required=(), capabilities=(), summary=None):
+        self.name = name
+        self.run = run
+        self.inputs = tuple(inputs)
+        self.required = tuple(required)
+        self.summary = summary
+        self.capabilities = frozenset(capabilities) | ({"summary"} if summary is not None else frozenset())
+
+# Registered algorithms in dropdown order, plus plugins found through entry points
+SCHEDULERS = {}
+SCHEDULER_ENTRY_POINT_GROUP = "cpu_scheduler.algorithms"
+_plugin_entry_points = None
+
+def register_scheduler(scheduler):
+    SCHEDULERS[scheduler.name] = scheduler
+    return scheduler
+
+# Helper function to list scheduler plugins without importing them
+def plugin_entry_points():
+    """Return {name: entry point} of installed scheduler plugins.
+
+    A plugin package declares an entry point in the cpu_scheduler.algorithms
+    group named after the algorithm and pointing at a Scheduler (or any
+    object with the same attributes).  Only the package metadata is read
+    here; the plugin module is imported the first time it is selected.
+    """
+    global _plugin_entry_points
+    if _plugin_entry_points is None:
+        # Imported on first use so startup does not pay for it
+        from importlib.metadata import entry_points
+        try:
+            found = entry_points(group=SCHEDULER_ENTRY_POINT_GROUP)
+        except TypeError:  # Python < 3.10
+            found = entry_points().get(SCHEDULER_ENTRY_POINT_GROUP, ())
+        _plugin_entry_points = {ep.name: ep for ep in found if ep.name not in SCHEDULERS}
+    return _plugin_entry_points
+
+# Function to list every algorithm name for the dropdown
+def scheduler_names():
+    return list(SCHEDULERS) + [name for name in plugin_entry_points() if name not in SCHEDULERS]
+
+# Function to look up an algorithm by name, loading its plugin if needed
+def get_scheduler(name):
+    scheduler = SCHEDULERS.get(name)
+    if scheduler is None:
+        entry_point = plugin_entry_points().get(name)
+        if entry_point is None:
+            raise ValueError(f"Unknown scheduling algorithm: {name}")
+        scheduler = entry_point.load()
+        SCHEDULERS[name] = scheduler
+    return scheduler
+
+# Helper function to run priority scheduling, with aging when an interval is given
+def run_priority(proc_list, options, preemptive):
+    if options['aging_interval']:
+        return aging_priority_scheduling(proc_list, options['aging_interval'], preemptive, options['context_switch'])
+    if preemptive:
+        return preemptive_priority_scheduling(proc_list, options['context_switch'], options['checkpoint_path'])
+    return priority_scheduling(proc_list, options['context_switch'])
+
+# Helper function to run a real-time engine once deadlines or periods are present
+def run_realtime(proc_list, options, engine):
+    if not any(proc.deadline is not None or proc.period for proc in proc_list):
+        raise ValueError("Please provide Deadlines and/or Periods for real-time scheduling.")
+    return engine(proc_list, context_switch=options['context_switch'])
+
+# Built-in algorithms
+register_scheduler(Scheduler(
+    "First Come First Serve, FCFS",
+    lambda procs, options: fcfs_scheduling(procs, options['context_switch']),
+    capabilities=("busy_periods",), summary=(lambda p: 0, False, False)))
+register_scheduler(Scheduler(
     "Shortest Job First, SJF (non-preemptive)",
-    "Shortest Remaining Time First, SRTF", 
+    lambda procs, options: sjf_scheduling(procs, options['context_switch']),
+    capabilities=("busy_periods",), summary=(lambda p: p.burst_time, False, False)))
+register_scheduler(Scheduler(
+    "Shortest Remaining Time First, SRTF",
+    lambda procs, options: srtf_scheduling(procs, options['context_switch'], options['checkpoint_path']),
+    capabilities=("preemptive", "checkpoint", "busy_periods"), summary=(lambda p: p.remaining_time, True, False)))
+register_scheduler(Scheduler(
     "Round-Robin, RR",
-    "Priority (non-preemptive)", 
-    "Priority (preemptive)"
-]
+    lambda procs, options: round_robin_scheduling(procs, options['time_quantum'], options['context_switch']),
+    inputs=("quantum",), required=("quantum",), capabilities=("preemptive", "busy_periods"),
+    summary=(lambda p: 0, False, True)))
+register_scheduler(Scheduler(
+    "Priority (non-preemptive)",
+    lambda procs, options: run_priority(procs, options, False),
+    inputs=("priority", "aging"), required=("priority",), capabilities=("busy_periods",),
+    summary=(lambda p: p.priority, False, False)))
+register_scheduler(Scheduler(
+    "Priority (preemptive)",
+    lambda procs, options: run_priority(procs, options, True),
+    inputs=("priority", "aging"), required=("priority",), capabilities=("preemptive", "checkpoint", "busy_periods"),
+    summary=(lambda p: p.priority, True, False)))
+register_scheduler(Scheduler(
+    "Earliest Deadline First, EDF",
+    lambda procs, options: run_realtime(procs, options, edf_scheduling),
+    inputs=("deadline", "period"), capabilities=("preemptive", "periodic")))
+register_scheduler(Scheduler(
+    "Rate-Monotonic, RMS",
+    lambda procs, options: run_realtime(procs, options, rms_scheduling),
+    inputs=("deadline", "period"), capabilities=("preemptive", "periodic")))
+register_scheduler(Scheduler(
+    "Lottery Scheduling",
+    lambda procs, options: lottery_scheduling(procs, options['time_quantum'], options['seed'], options['context_switch']),
+    inputs=("quantum", "tickets", "seed"), required=("quantum",), capabilities=("preemptive",)))
+register_scheduler(Scheduler(
+    "Stride Scheduling",
+    lambda procs, options: stride_scheduling(procs, options['time_quantum'], options['context_switch']),
+    inputs=("quantum", "tickets"), required=("quantum",), capabilities=("preemptive",)))
+register_scheduler(Scheduler(
+    "CPU/I-O Bursts (FCFS/RR)",
+    lambda procs, options: io_burst_scheduling(procs, options['time_quantum'], options['context_switch']),
+    inputs=("quantum",), capabilities=("io_bursts",)))
+
+# Main GUI Window Setup (only when run as a script, so pg can be imported)
+if __name__ == "__main__":
+    # Headless commands run without creating any window
+    if len(sys.argv) > 1 and sys.argv[1] == "export-gantt":
+        export_gantt_command(sys.argv[2:])
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        serve_command(sys.argv[2:])
+        sys.exit(0)
+
+    startup_started = monotonic()
+    root = ctk.CTk()
+    root.title("🖥️ CPU Scheduling Algorithm Simulator")
+    root.geometry("1200x800")  # Increased width to accommodate results
+    root.configure(fg_color=("gray95", "gray10"))
+
+    # Set window icon (if available)
+    try:
+        root.iconbitmap("")  # Add icon path if available
+    except:
+        pass
+
+    # Make window resizable
+    root.resizable(True, True)
+
+    # Center window on screen (from the requested size, without forcing a layout pass)
+    width, height = 1200, 800
+    x = (root.winfo_screenwidth() // 2) - (width // 2)
+    y = (root.winfo_screenheight() // 2) - (height // 2)
+    root.geometry(f"{width}x{height}+{x}+{y}")
+
+    # Create main container with padding
+    main_container = ctk.CTkFrame(root, corner_radius=0, fg_color="transparent")
+    main_container.pack(fill="both", expand=True, padx=20, pady=20)
+
+    # Input frame with enhanced styling
+    input_frame = ctk.CTkFrame(
+        main_container, 
+        corner_radius=20,
+        fg_color=("white", "gray20"),
+        border_width=2,
+        border_color=("gray80", "gray30")
+    )
+    input_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+    # Configure grid weights for responsive design
+    input_frame.grid_columnconfigure(0, weight=1)
+    input_frame.grid_columnconfigure(1, weight=1)
+    input_frame.grid_columnconfigure(2, weight=1)
+
+    create_input_fields()
 
-create_input_fields()
+    # Startup benchmark: report time to the first idle event loop pass, then quit
+    if os.environ.get("PG_STARTUP_BENCHMARK"):
+        def report_startup():
+            print(f"time_to_interactive {monotonic() - startup_started:.4f}", flush=True)
+            root.destroy()
+        root.after_idle(lambda: root.after(0, report_startup))
 
-root.mainloop()
+    root.mainloop()
@@ -0,0 +1,123 @@
+"""Measure how many simulations per second the local service handles.
+
+Starts `python pg.py serve` on a free port (or uses --url), then keeps
+--concurrency keep-alive connections busy posting /simulate requests until
+--requests have been answered.  Workloads are drawn from --distinct random
+workloads, so a small value shows the effect of sharing identical requests
+in flight.  Reports requests per second, latency percentiles and the
+service's own counters.
+
+    python service_load_test.py [--requests N] [--concurrency C] [--processes P] [--distinct D]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+from urllib.parse import urlsplit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_workloads(args):
+    rng = random.Random(args.seed)
+    return [json.dumps({
+        "algorithm": args.algorithm,
+        "time_quantum": 2,
+        "processes": [{"arrival": rng.randint(0, 2 * args.processes), "burst": rng.randint(1, 10),
+                       "priority": rng.randint(1, 5)} for _ in range(args.processes)],
+    }).encode() for _ in range(args.distinct)]
+
+
+async def request(reader, writer, host, method, path, body=b""):
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def run_load(host, port, workloads, args):
+    latencies = []
+    failures = 0
+    sent = 0
+
+    async def client():
+        nonlocal failures, sent
+        reader, writer = await asyncio.open_connection(host, port)
+        rng = random.Random()
+        while sent < args.requests:
+            sent += 1
+            started = perf_counter()
+            status, _ = await request(reader, writer, host, "POST", "/simulate", rng.choice(workloads))
+            latencies.append(perf_counter() - started)
+            failures += status != 200
+        writer.close()
+
+    started = perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    elapsed = perf_counter() - started
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, stats = await request(reader, writer, host, "GET", "/stats")
+    writer.close()
+    return elapsed, latencies, failures, json.loads(stats)
+
+
+def start_server(args):
+    command = [sys.executable, os.path.join(HERE, "pg.py"), "serve", "--port", "0"]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = server.stdout.readline()
+    if not line.startswith("Serving on "):
+        server.kill()
+        raise RuntimeError("pg.py serve did not start")
+    return server, line.split()[2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="service to test (default: start one)")
+    parser.add_argument("--workers", type=int, help="worker processes of the started service")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--processes", type=int, default=20, help="processes per workload")
+    parser.add_argument("--distinct", type=int, default=500, help="number of different workloads")
+    parser.add_argument("--algorithm", default="Round-Robin, RR")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server, url = start_server(args)
+    try:
+        parts = urlsplit(url)
+        elapsed, latencies, failures, stats = asyncio.run(
+            run_load(parts.hostname, parts.port, make_workloads(args), args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    print(f"{len(latencies)} requests in {elapsed:.2f} s: {len(latencies) / elapsed:.0f} requests/s, {failures} failed")
+    print(f"Latency: median {statistics.median(latencies) * 1000:.1f} ms, "
+          f"p99 {latencies[int(0.99 * (len(latencies) - 1))] * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms")
+    print("Service: " + ", ".join(f"{key} {value}" for key, value in sorted(stats.items())))
+
+
+if __name__ == "__main__":
+    main()
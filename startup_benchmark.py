@@ -0,0 +1,40 @@
+"""Measure how long pg.py takes until its input form is interactive.
+
+Launches the simulator repeatedly with PG_STARTUP_BENCHMARK=1, which makes
+it print the time from the start of GUI setup to the first idle pass of the
+event loop and quit.  Reports that time and the total wall-clock time of
+each launch (interpreter start and imports included).
+
+    python startup_benchmark.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_once():
+    env = dict(os.environ, PG_STARTUP_BENCHMARK="1")
+    started = perf_counter()
+    result = subprocess.run([sys.executable, os.path.join(HERE, "pg.py")], env=env,
+                            capture_output=True, text=True, timeout=60)
+    wall = perf_counter() - started
+    for line in result.stdout.splitlines():
+        if line.startswith("time_to_interactive "):
+            return float(line.split()[1]), wall
+    raise RuntimeError(f"pg.py did not report its startup time:\n{result.stderr.strip()}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    gui, wall = zip(*(measure_once() for _ in range(runs)))
+    for label, values in (("GUI setup to interactive", gui), ("Launch to interactive", wall)):
+        print(f"{label}: median {statistics.median(values) * 1000:.1f} ms, "
+              f"min {min(values) * 1000:.1f} ms, max {max(values) * 1000:.1f} ms ({runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,592 @@
+"""Regression checks for the scheduling engines, fixed-point times and the service.
+
+Small hand-checked workloads whose schedules are known exactly, plus a
+short engine_fuzzer run.  Runs under pytest or on its own:
+
+    python -m pytest -q test_regressions.py
+    python test_regressions.py
+"""
+import ast
+import json
+import os
+import sys
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from unittest import mock
+from xml.etree import ElementTree
+
+import pytest
+
+import engine_fuzzer
+import pg
+from pg import Process
+
+FCFS = "First Come First Serve, FCFS"
+SRTF = "Shortest Remaining Time First, SRTF"
+RR = "Round-Robin, RR"
+IO = "CPU/I-O Bursts (FCFS/RR)"
+
+
+def results(procs, *fields):
+    return {p.name: tuple(getattr(p, field) for field in fields) for p in procs}
+
+
+# Context-switch overhead
+def test_switch_overhead_is_charged_between_different_processes():
+    procs = [Process("A", 0, 3), Process("B", 1, 2)]
+    assert pg.fcfs_scheduling(procs, 1) == [("A", 3), ("Switch", 1), ("B", 2)]
+    assert results(procs, "completion_time", "waiting_time") == {"A": (3, 0), "B": (6, 3)}
+    procs = [Process("A", 0, 3), Process("B", 0, 2)]
+    gantt_chart = pg.round_robin_scheduling(procs, 2, 1)
+    assert gantt_chart == [("A", 2), ("Switch", 1), ("B", 2), ("Switch", 1), ("A", 1)]
+    metrics = pg.compute_run_metrics(procs, gantt_chart)
+    assert metrics["context_switches"] == 2 and metrics["cpu_utilization"] == pytest.approx(500 / 7)
+
+
+def test_context_switches_skip_idle_and_switch_segments():
+    assert pg.count_context_switches([("A", 1), ("Idle", 2), ("A", 1), ("Switch", 1), ("B", 1)]) == 1
+    assert pg.count_context_switches([]) == 0
+
+
+# Real-time engines: U = 1, which EDF schedules and RMS does not
+def test_edf_meets_every_deadline_at_full_utilisation():
+    procs = [Process("A", 0, 2, period=4), Process("B", 0, 3, period=6)]
+    assert pg.edf_scheduling(procs) == [("A", 2), ("B", 3), ("A", 2), ("B", 3), ("A", 2)]
+    assert results(procs, "jobs_completed", "deadline_misses") == {"A": (3, 0), "B": (2, 0)}
+    assert procs[0].lateness_counts == {-2: 1, -1: 1, 0: 1}
+
+
+def test_rms_misses_the_longer_period_deadline():
+    procs = [Process("A", 0, 2, period=4), Process("B", 0, 3, period=6)]
+    assert pg.rms_scheduling(procs) == [("A", 2), ("B", 2)] * 3
+    assert results(procs, "jobs_completed", "deadline_misses") == {"A": (3, 0), "B": (2, 1)}
+    assert procs[1].lateness_counts == {1: 1, 0: 1}
+
+
+def test_periodic_jobs_idle_between_releases():
+    procs = [Process("A", 0, 1, period=4), Process("B", 0, 2, period=6)]
+    gantt_chart = pg.edf_scheduling(procs)
+    assert gantt_chart == [("A", 1), ("B", 2), ("Idle", 1), ("A", 1), ("Idle", 1), ("B", 2), ("A", 1)]
+    # Telemetry counts each job from its release, so nothing waits between jobs
+    rows = pg.build_telemetry(procs, gantt_chart).series()
+    assert [depth for _, depth, _, _ in rows] == [1, 0, 0, 0, 0, 0, 0, 0, 0]
+    assert sum(done for _, _, _, done in rows) == 5
+
+
+def test_replay_owes_one_burst_per_released_job():
+    procs = [Process("A", 0, 2, period=5), Process("B", 1, 3, period=10)]
+    replay = pg.TimelineReplay(procs, pg.edf_scheduling(procs))
+    assert replay.frame(6)["running"][0] == "A"
+    assert replay.frame(6)["running_remaining"] == 1
+
+
+# Gantt tiles
+def test_failed_tile_is_cached_blank_and_reported_once(monkeypatch, capsys):
+    class FakePhotoImage:
+        def __init__(self, data=None, width=0, height=0):
+            if data is not None:
+                raise ValueError("bad image data")
+            self.size = (width, height)
+
+    monkeypatch.setattr(pg.tk, "PhotoImage", FakePhotoImage)
+    view = pg.GanttTileView.__new__(pg.GanttTileView)
+    view.canvas, view.height = mock.Mock(), 60
+    view.tiles, view.polling, view.render_failed = OrderedDict(), False, False
+    view.redraw = mock.Mock()
+    failed = Future()
+    failed.set_exception(RuntimeError("renderer crashed"))
+    corrupt = Future()
+    corrupt.set_result(b"not a png")
+    view.pending = {("Light", 1.0, 0): failed, ("Light", 1.0, 1): corrupt}
+    view.poll()
+    assert not view.pending and view.tiles[("Light", 1.0, 0)].size == (pg.GANTT_TILE_WIDTH, 60)
+    assert len(view.tiles) == 2 and view.redraw.called
+    assert capsys.readouterr().err.count("Could not render") == 1
+
+
+# Headless Gantt export
+def read_png(path):
+    """Return (width, height, rows of RGB bytes) of a PNG written by write_png."""
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks, pos = {}, 8
+    while pos < len(data):
+        length = int.from_bytes(data[pos:pos + 4], "big")
+        tag = data[pos + 4:pos + 8]
+        chunks[tag] = chunks.get(tag, b"") + data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+    width = int.from_bytes(chunks[b"IHDR"][:4], "big")
+    height = int.from_bytes(chunks[b"IHDR"][4:8], "big")
+    raw = zlib.decompress(chunks[b"IDAT"])
+    stride = 1 + 3 * width
+    assert len(raw) == stride * height
+    return width, height, [raw[i * stride + 1:(i + 1) * stride] for i in range(height)]
+
+
+def test_svg_export_collapses_segments_narrower_than_a_pixel(tmp_path):
+    gantt_chart = [("A", 5), ("Switch", 1), ("B", 4), ("Idle", 2)]
+    gantt_chart += [(pg.process_name(i % 50), 1) for i in range(20000)]
+    path = str(tmp_path / "chart.svg")
+    blocks = pg.write_gantt_svg(path, gantt_chart, width=800)
+    assert 4 <= blocks <= 800
+    root = ElementTree.parse(path).getroot()
+    assert root.get("width") == "800"
+    assert pg.write_gantt_svg(path, gantt_chart[:4], width=800, lod_px=0) == 4
+    assert "Process A" in open(path, encoding="utf-8").read()
+    with pytest.raises(ValueError):
+        pg.write_gantt_svg(path, [], width=800)
+
+
+def test_png_export_draws_the_strip_and_axis(tmp_path):
+    gantt_chart = [("A", 10), ("Idle", 10)]
+    path = str(tmp_path / "chart.png")
+    pg.write_gantt_png(path, gantt_chart, width=240)
+    width, height, rows = read_png(path)
+    assert (width, height) == (240, 2 * 20 + 60 + 14)
+    # Below the lighter top third, the first half of the strip has A's colour
+    bar_row = rows[20 + 50]
+    assert bar_row[3 * 60:3 * 60 + 3] == bytes(pg.hex_to_rgb(pg.gantt_process_colors(gantt_chart)["A"]))
+
+
+def test_export_gantt_command_renders_an_exported_run(tmp_path):
+    procs = [Process("A", 0, 3), Process("B", 1, 2)]
+    pg.export_run(str(tmp_path / "run"), procs, pg.fcfs_scheduling(procs), FCFS)
+    pg.export_gantt_command([str(tmp_path / "run"), str(tmp_path / "run.png"), "--width", "300"])
+    assert read_png(str(tmp_path / "run.png"))[:2] == (300, 114)
+
+
+# Gantt inspector
+def test_index_finds_the_segment_running_at_a_time():
+    index = pg.GanttIndex([("A", 3), ("Switch", 1), ("Idle", 2), ("B", 4)])
+    assert index.segment_at(0) == (0, "A", 0, 3)
+    assert index.segment_at(2.9) == (0, "A", 0, 3)
+    assert index.segment_at(3) == (1, "Switch", 3, 1)
+    assert index.segment_at(9.5) == (3, "B", 6, 4)
+    assert index.segment_at(-1) is None
+    assert index.segment_at(10) is None
+
+
+def test_click_selects_the_segment_under_the_pointer():
+    canvas = mock.MagicMock()
+    canvas.winfo_width.return_value = 400
+    selected = []
+    inspector = pg.GanttInspector(canvas, [("A", 3), ("B", 2)], pg.GanttGeometry(50, 20, 60, 10.0),
+                                  on_select=lambda *args: selected.append(args))
+    click = mock.Mock(x=95, y=40)  # time 4.5
+    inspector.press(click)
+    inspector.release(click)
+    assert selected == [("B", 3, 2)]
+    outside = mock.Mock(x=95, y=100)
+    inspector.press(outside)
+    inspector.release(outside)
+    assert selected[-1] == (None, None, None) and inspector.selected is None
+    # A drag pans the view and selects nothing
+    inspector.press(mock.Mock(x=60, y=40))
+    inspector.release(mock.Mock(x=90, y=40))
+    assert len(selected) == 2
+
+
+# Process names and colours
+def test_process_names_count_like_spreadsheet_columns():
+    assert [pg.process_name(i) for i in (0, 25, 26, 27, 51, 52, 701, 702)] == \
+        ["A", "Z", "AA", "AB", "AZ", "BA", "ZZ", "AAA"]
+    assert pg.process_name(30) is pg.process_name(30)
+
+
+def test_process_colors_depend_only_on_the_name():
+    color = pg.process_color("AB")
+    pg.process_color.cache_clear()
+    assert pg.process_color("AB") == color
+    assert len(color) == 7 and color.startswith("#")
+    assert len({pg.process_color(pg.process_name(i)) for i in range(100)}) > 90
+
+
+# Sharded runs
+@pytest.mark.parametrize("algorithm", [FCFS, SRTF])
+def test_sharded_run_matches_the_unsplit_run(algorithm, monkeypatch):
+    def workload():
+        # Ten busy periods of five processes, separated by idle gaps
+        return [Process(pg.process_name(i), 40 * (i // 5) + i % 5, 1 + (3 * i) % 5) for i in range(50)]
+
+    expected_procs = workload()
+    expected = pg.get_scheduler(algorithm).run(expected_procs, dict(
+        time_quantum=None, context_switch=0, seed=0, aging_interval=None, checkpoint_path=None))
+    # Every shard after the first goes to the worker pool
+    monkeypatch.setattr(pg, "SHARD_IPC_SECONDS", -1)
+    procs = workload()
+    gantt_chart = pg.sharded_scheduling(procs, algorithm, workers=2, min_shard=5, batch=1)
+    assert gantt_chart == expected
+    assert sorted((p.name, p.completion_time, p.waiting_time, p.response_time) for p in procs) == \
+        sorted((p.name, p.completion_time, p.waiting_time, p.response_time) for p in expected_procs)
+
+
+def test_sharding_needs_busy_periods():
+    with pytest.raises(ValueError):
+        pg.sharded_scheduling([Process("A", 0, 1)], "Stride Scheduling", time_quantum=2)
+
+
+# Latency percentiles
+def test_percentiles_use_the_nearest_rank():
+    sketch = pg.QuantileSketch()
+    for value in range(1, 11):
+        sketch.add(value)
+    assert [sketch.quantile(q) for _, q in pg.PERCENTILES] == [5, 10, 10]
+    single = pg.QuantileSketch()
+    single.add(7)
+    assert single.quantile(0.5) == single.quantile(0.99) == 7
+    # Past the exact limit the largest values still stay within the sketch's accuracy
+    buckets = pg.QuantileSketch(exact_limit=8)
+    for value in range(1, 101):
+        buckets.add(value)
+    assert buckets.quantile(0.99) == pytest.approx(99, rel=0.02) and buckets.quantile(1) == 100
+
+
+def test_percentile_pruning_keeps_the_best_quantum():
+    procs = [Process(pg.process_name(i), (7 * i) % 23, 1 + (5 * i) % 13) for i in range(30)]
+    for objective in ("p95_waiting", "p99_response"):
+        pruned = pg.tune_round_robin_quantum(procs, objective, workers=1)
+        full = pg.tune_round_robin_quantum(procs, objective, workers=1, prune=False)
+        assert pruned[0] == full[0]
+
+
+def test_mean_pruning_keeps_a_tie():
+    # 61 / 7 * 7 rounds below 61, so comparing sums in floating point pruned this tie
+    summary = pg.PruningSummary("avg_waiting", 61 / 7, 7)
+    for i, waiting_time in enumerate((10, 10, 10, 10, 10, 10, 1)):
+        proc = Process(pg.process_name(i), 0, 1)
+        proc.completion_time, proc.turnaround_time, proc.waiting_time, proc.response_time = 1, 1, waiting_time, 0
+        summary.add_completion(proc)
+    assert summary.metrics()["avg_waiting"] == 61 / 7
+    with pytest.raises(pg.CandidatePruned):
+        summary.add_completion(proc)
+
+
+# Proportional share
+def test_stride_gives_cpu_in_ticket_ratio():
+    procs = [Process("A", 0, 8, tickets=100), Process("B", 0, 8, tickets=300)]
+    gantt_chart = pg.stride_scheduling(procs, 1)
+    assert gantt_chart[:4] == [("A", 1), ("B", 3), ("A", 1), ("B", 3)]
+
+
+def test_lottery_is_reproducible_per_seed():
+    def run(seed):
+        procs = [Process("A", 0, 8, tickets=100), Process("B", 0, 8, tickets=300), Process("C", 3, 5)]
+        return pg.lottery_scheduling(procs, 1, seed), results(procs, "completion_time")
+
+    assert run(1) == run(1)
+    gantt_chart, completions = run(2)
+    assert sum(duration for _, duration in gantt_chart) == 21 == max(completions.values())[0]
+
+
+# CPU/I-O bursts
+def test_io_bursts_overlap_with_other_processes():
+    procs = [Process("A", 0, 4, bursts=[2, 3, 2]), Process("B", 0, 4)]
+    assert pg.io_burst_scheduling(procs) == [("A", 2), ("B", 4), ("A", 2)]
+    assert results(procs, "completion_time", "waiting_time", "io_time") == {"A": (8, 1, 3), "B": (6, 2, 0)}
+    assert procs[0].blocked_spans == [(2, 5)]
+
+
+def test_io_device_is_shared_first_come_first_served():
+    procs = [Process("A", 0, 2, bursts=[1, 4, 1]), Process("B", 0, 2, bursts=[1, 4, 1])]
+    assert pg.io_burst_scheduling(procs) == [("A", 1), ("B", 1), ("Idle", 3), ("A", 1), ("Idle", 3), ("B", 1)]
+    assert results(procs, "completion_time", "io_wait_time") == {"A": (6, 0), "B": (10, 3)}
+
+
+# Reference engines
+def test_idle_gaps_are_one_segment_however_long():
+    for engine in (pg.sjf_scheduling, pg.srtf_scheduling, pg.priority_scheduling, pg.preemptive_priority_scheduling):
+        procs = [Process("A", 0, 1, 1), Process("B", 2000000, 1, 1)]
+        assert engine(procs) == [("A", 1), ("Idle", 1999999), ("B", 1)], engine.__name__
+
+
+def test_round_robin_idles_until_the_first_arrival():
+    procs = [Process("A", 5, 4), Process("B", 6, 2)]
+    assert pg.round_robin_scheduling(procs, 2) == [("Idle", 5), ("A", 2), ("B", 2), ("A", 2)]
+    assert results(procs, "completion_time", "response_time") == {"A": (11, 0), "B": (9, 1)}
+
+
+# Checkpoints
+def checkpoint_workload():
+    return [Process(pg.process_name(i), 3 * i, 1 + i % 7, 1 + i % 4) for i in range(300)]
+
+
+def test_checkpoint_resumes_an_interrupted_run(tmp_path, monkeypatch):
+    expected = pg.srtf_scheduling(checkpoint_workload(), 1)
+    path = str(tmp_path / "run.ckpt")
+    save_checkpoint = pg.save_checkpoint
+    saved = []
+
+    def interrupt(*args):
+        save_checkpoint(*args)
+        saved.append(args[2])
+        if len(saved) == 100:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(pg, "save_checkpoint", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        pg.srtf_scheduling(checkpoint_workload(), 1, path, checkpoint_interval=0)
+    monkeypatch.undo()
+    assert saved[-1] > 0
+    assert pg.srtf_scheduling(checkpoint_workload(), 1, path) == expected
+    assert not (tmp_path / "run.ckpt").exists()
+
+
+def test_snapshot_of_another_workload_is_discarded(tmp_path, monkeypatch):
+    monkeypatch.setattr(pg, "CHECKPOINT_DIR", str(tmp_path))
+    procs = checkpoint_workload()
+    reordered = procs[::-1]
+    path = pg.checkpoint_file(procs, SRTF, 1)
+    assert path != pg.checkpoint_file(reordered, SRTF, 1)
+    # Whatever left the file there, the run starts afresh instead of failing
+    pg.save_checkpoint(path, [Process("A", 0, 5, 1)], 2, 0, None, 0, None, [], [("A", 2)])
+    assert pg.srtf_scheduling(procs, 1, path) == pg.srtf_scheduling(checkpoint_workload(), 1)
+    assert not os.path.exists(path)
+
+
+# Aging
+def test_aging_lets_a_long_waiting_process_go_first():
+    def workload():
+        return [Process("A", 0, 4, 1), Process("B", 0, 2, 3), Process("C", 3, 2, 2)]
+
+    # At time 4, B (3, waiting 4) has aged to 1 and C (2, waiting 1) only to 1.5
+    assert pg.aging_priority_scheduling(workload(), 2, False) == [("A", 4), ("B", 2), ("C", 2)]
+    assert pg.aging_priority_scheduling(workload(), None, False) == [("A", 4), ("C", 2), ("B", 2)]
+    assert pg.priority_scheduling(workload()) == [("A", 4), ("C", 2), ("B", 2)]
+
+
+def test_preemptive_aging_ends_starvation():
+    def workload():
+        return [Process("L", 0, 3, 4)] + [Process(f"H{i}", 2 * i, 2, 1) for i in range(6)]
+
+    starved = pg.preemptive_priority_scheduling(workload())
+    assert starved[-1] == ("L", 3)
+    # L reaches priority 1 at time 6 and wins the tie as the earlier arrival
+    aged = pg.aging_priority_scheduling(workload(), 2, True)
+    assert aged[:4] == [("H0", 2), ("H1", 2), ("H2", 2), ("L", 1)]
+    assert sum(duration for name, duration in aged if name == "L") == 3
+
+
+def test_engine_fuzzer_finds_no_mismatch():
+    assert engine_fuzzer.main(["--iterations", "20"]) == 0
+
+
+def test_event_engines_match_the_tick_based_originals():
+    pairs = [pair for pair in engine_fuzzer.ENGINE_PAIRS if pair.startswith("event-")]
+    assert len(pairs) == 4
+    assert engine_fuzzer.main(["--iterations", "200"] + [arg for pair in pairs for arg in ("--pair", pair)]) == 0
+    procs = [Process("A", 0, 8, 2), Process("B", 1, 4, 1), Process("C", 2, 2, 1)]
+    assert engine_fuzzer.tick_preemptive_scheduling(procs, engine_fuzzer.priority_key, 1) == [
+        ("A", 1), ("Switch", 1), ("B", 4), ("Switch", 1), ("C", 2), ("Switch", 1), ("A", 7)]
+
+
+# Scheduler registry and plugins
+def test_plugins_are_listed_without_loading_and_loaded_once(monkeypatch):
+    loads = []
+
+    class EntryPoint:
+        def load(self):
+            loads.append(1)
+            return pg.Scheduler("Last Come First Serve",
+                                lambda procs, options: pg.fcfs_scheduling(procs[::-1], options["context_switch"]),
+                                summary=(lambda p: -p.arrival_time, False, False))
+
+    monkeypatch.setattr(pg, "SCHEDULERS", dict(pg.SCHEDULERS))
+    monkeypatch.setattr(pg, "_plugin_entry_points", {"Last Come First Serve": EntryPoint()})
+    names = pg.scheduler_names()
+    assert names[0] == FCFS and names[-1] == "Last Come First Serve" and not loads
+    assert pg.run_algorithm([Process("A", 0, 2), Process("B", 0, 1)], "Last Come First Serve") == [("B", 1), ("A", 2)]
+    assert "summary" in pg.get_scheduler("Last Come First Serve").capabilities and len(loads) == 1
+    with pytest.raises(ValueError, match="Unknown scheduling algorithm"):
+        pg.get_scheduler("No Such Algorithm")
+
+
+def test_registry_lists_required_inputs():
+    assert pg.get_scheduler(RR).required == ("quantum",)
+    assert pg.get_scheduler("Priority (preemptive)").required == ("priority",)
+    with pytest.raises(ValueError, match="Time Quantum"):
+        pg.run_algorithm([Process("A", 0, 2)], RR)
+
+
+# Binary traces
+def test_trace_rows_are_checked_like_the_input_form(tmp_path, monkeypatch):
+    path = str(tmp_path / "bad.cputrace")
+    pg.write_trace(path, [0, 1], [3, -2])
+    with pg.TraceFile(path) as trace:
+        with pytest.raises(ValueError, match="row 2"):
+            trace.validate()
+    errors = []
+    monkeypatch.setattr(pg, "show_error_dialog", lambda title, message: errors.append((title, message)))
+    pg.process_input("", "", "", "", SRTF, trace_path=path)
+    assert errors == [("Trace Error", "Could not read trace file: row 2 (process B) has burst time -2, "
+                                      "but it must be positive.")]
+
+
+def test_priority_algorithms_need_priorities(tmp_path, monkeypatch):
+    path = str(tmp_path / "plain.cputrace")
+    pg.write_trace(path, [0, 1, 2], [3, 2, 1])
+    errors = []
+    monkeypatch.setattr(pg, "show_error_dialog", lambda title, message: errors.append((title, message)))
+    monkeypatch.setattr(pg, "TRACE_SUMMARY_PROCESSES", 1)
+    pg.process_input("", "", "", "", "Priority (preemptive)", trace_path=path)
+    assert errors and errors[0][0] == "Input Error"
+    with pytest.raises(ValueError):
+        pg.run_algorithm([Process("A", 0, 2), Process("B", 1, 1)], "Priority (non-preemptive)")
+
+
+# Synthetic workloads
+def test_generator_is_reproducible_and_independent_of_chunking(tmp_path):
+    generator = pg.WorkloadGenerator(3000, seed=7, burst_distribution="pareto")
+    rows = [(p.name, p.arrival_time, p.burst_time, p.priority) for p in generator.processes()]
+    again = pg.WorkloadGenerator(3000, seed=7, burst_distribution="pareto")
+    assert [(p.name, p.arrival_time, p.burst_time, p.priority) for p in again.processes(chunk_size=100)] == rows
+    assert rows[0][:2] == ("A", 0) and [name for name, *_ in rows[:3]] == ["A", "B", "C"]
+    arrivals = [arrival for _, arrival, _, _ in rows]
+    assert arrivals == sorted(arrivals) and min(burst for _, _, burst, _ in rows) >= 1
+    assert {priority for *_, priority in rows} <= {1, 2, 3, 4, 5}
+    # About arrival_rate arrivals per time unit
+    assert arrivals[-1] == pytest.approx(3000 / 0.2, rel=0.1)
+    path = str(tmp_path / "generated.cputrace")
+    assert generator.write_trace(path, chunk_size=512) == 3000
+    with pg.TraceFile(path) as trace:
+        assert list(trace.arrival_times) == arrivals
+    assert list(pg.WorkloadGenerator(3000, seed=8).values("arrival")) != arrivals
+
+
+@pytest.mark.parametrize("options", [
+    {"count": -1}, {"count": 5, "arrival_rate": 0}, {"count": 5, "burst_distribution": "uniform"},
+    {"count": 5, "burst_distribution": "pareto", "pareto_shape": 1}, {"count": 5, "priority_weights": (0, 0)},
+])
+def test_generator_rejects_invalid_settings(options):
+    with pytest.raises(ValueError):
+        pg.WorkloadGenerator(**options)
+
+
+# Columnar export
+def test_export_run_round_trips_through_npy_columns(tmp_path):
+    procs = [Process("A", 0, 3, 2), Process("B", 1, 2)]
+    gantt_chart = pg.round_robin_scheduling(procs, 2, 1)
+    metadata = pg.export_run(str(tmp_path), procs, gantt_chart, RR, chunk_size=2)
+    assert (metadata["num_segments"], metadata["total_time"]) == (5, 7)
+    assert list(pg.read_npy_column(str(tmp_path / "gantt_start.npy"))) == [0, 2, 3, 5, 6]
+    assert list(pg.read_npy_column(str(tmp_path / "gantt_process.npy"))) == [0, -2, 1, -2, 0]
+    assert list(pg.read_npy_column(str(tmp_path / "process_priority.npy"))) == [2, -1]
+    assert list(pg.read_npy_column(str(tmp_path / "process_completion_time.npy"))) == [7, 5]
+    assert list(pg.ExportedGantt(str(tmp_path))) == gantt_chart
+    # A standard .npy header, with the final length patched in
+    with open(tmp_path / "gantt_duration.npy", "rb") as f:
+        data = f.read()
+    header_len = int.from_bytes(data[8:10], "little")
+    assert data[:8] == pg.NPY_MAGIC and (10 + header_len) % 64 == 0
+    assert ast.literal_eval(data[10:10 + header_len].decode("latin1")) == {
+        "descr": "<i8", "fortran_order": False, "shape": (5,)}
+
+
+# Run history
+def test_history_max_quantum_is_inclusive(tmp_path):
+    history = pg.RunHistory(str(tmp_path / "history.sqlite3"))
+    procs = [Process("A", 0, 5), Process("B", 1, 3)]
+    pg.run_batch([(procs, RR, {"time_quantum": q}) for q in (2, 4, 6)], history)
+    assert sorted(row["quantum"] for row in history.page(algorithm=RR, max_quantum=4)) == [2, 4]
+    history.close()
+
+
+def test_summary_only_trace_runs_are_recorded(tmp_path, monkeypatch):
+    path = str(tmp_path / "long.cputrace")
+    arrivals, bursts = [0, 0, 0, 2, 2, 9], [3, 1, 2, 4, 1, 1]
+    pg.write_trace(path, arrivals, bursts)
+    with pg.TraceFile(path) as trace:
+        assert pg.trace_workload_hash(trace) == pg.workload_hash(trace.to_processes())
+    database = str(tmp_path / "history.sqlite3")
+    run_history = pg.RunHistory
+    monkeypatch.setattr(pg, "RunHistory", lambda: run_history(database))
+    monkeypatch.setattr(pg, "TRACE_SUMMARY_PROCESSES", 1)
+    shown = []
+    monkeypatch.setattr(pg, "show_summary_results", lambda summary, algorithm: shown.append(summary.completed))
+    pg.process_input("", "", "", "", FCFS, trace_path=path, record_history=True)
+    assert shown == [6]
+    history = run_history(database)
+    (row,) = history.page()
+    assert (row["num_processes"], row["makespan"], row["miss_ratio"]) == (6, 12, None)
+    assert row["workload_hash"] == pg.workload_hash([Process("", a, b) for a, b in zip(arrivals, bursts)])
+    history.close()
+
+
+# Fixed-point times
+def test_time_resolution_is_the_most_decimals_used():
+    assert pg.time_resolution(["1.5", "2", "0.25", "3.10"]) == 2
+    assert pg.time_resolution(["1e3", "7"]) == 0
+    for tokens in (["1.0000001"], ["nan"], ["abc"]):
+        with pytest.raises(ValueError):
+            pg.time_resolution(tokens)
+
+
+def test_parse_time_scales_to_integers():
+    assert pg.parse_time("2.5", 10) == 25
+    assert pg.parse_time(" 3 ", 100) == 300
+    with pytest.raises(ValueError):
+        pg.parse_time("0.25", 10)
+    assert pg.parse_optional_time("", "Time quantum", 10, None, 1) is None
+    with pytest.raises(ValueError):
+        pg.parse_optional_time("0", "Time quantum", 10, None, 1)
+
+
+def test_format_time_is_exact_at_any_magnitude():
+    try:
+        assert pg.format_time(1000000) == "1000000"
+        assert pg.format_time(1e6) == "1000000"
+        assert pg.format_time(2.5, 2) == "2.50"
+        pg.set_time_resolution(3)
+        assert pg.format_time(2500) == "2.5"
+        assert pg.format_time(10 ** 12) == "1000000000"
+        assert pg.format_time(-1500) == "-1.5"
+        assert pg.format_time(1234.5) == "1.2345"
+    finally:
+        pg.set_time_resolution(0)
+
+
+# Service request validation
+def test_service_request_scales_fractional_times():
+    procs, algorithm, options, time_scale = pg.service_request({
+        "algorithm": RR, "time_quantum": 0.5,
+        "processes": [{"arrival": 0, "burst": 1.25}, {"arrival": 0.5, "burst": 2, "priority": 3}]})
+    assert (algorithm, time_scale, options["time_quantum"]) == (RR, 100, 50)
+    assert [(p.arrival_time, p.burst_time, p.priority) for p in procs] == [(0, 125, None), (50, 200, 3)]
+
+
+def test_simulate_request_answers_in_the_units_it_was_given():
+    status, body = pg.simulate_request({"algorithm": FCFS, "processes": [{"arrival": 0.5, "burst": 1.5}]})
+    assert status == 200
+    result = json.loads(body)
+    assert result["gantt_chart"] == [["Idle", 0.5], ["A", 1.5]]
+    assert result["processes"][0]["completion"] == 2
+
+
+@pytest.mark.parametrize("payload", [
+    [],
+    {"algorithm": "No Such Algorithm", "processes": [{"arrival": 0, "burst": 1}]},
+    {"algorithm": FCFS, "processes": []},
+    {"algorithm": FCFS, "processes": [{"arrival": True, "burst": 1}]},
+    {"algorithm": FCFS, "processes": [{"arrival": "0", "burst": 1}]},
+    {"algorithm": FCFS, "processes": [{"arrival": 1e300, "burst": 1}]},
+    {"algorithm": FCFS, "processes": [{"arrival": 0, "burst": 0}]},
+    {"algorithm": FCFS, "processes": [{"arrival": -1, "burst": 1}]},
+    {"algorithm": FCFS, "processes": [{"arrival": 0, "burst": 1, "priority": 0}]},
+    {"algorithm": FCFS, "processes": [{"arrival": 0, "bursts": [1, 2, 1]}]},
+    {"algorithm": IO, "processes": [{"arrival": 0, "bursts": [1, 2]}]},
+    {"algorithm": RR, "time_quantum": 0, "processes": [{"arrival": 0, "burst": 1}]},
+    {"algorithm": RR, "time_quantum": 0.000001, "processes": [{"arrival": 0, "burst": 100}]},
+    {"algorithm": FCFS, "processes": [{"arrival": 0, "burst": 1}] * (pg.SERVICE_MAX_PROCESSES + 1)},
+    {"algorithm": "Earliest Deadline First, EDF",
+     "processes": [{"arrival": 0, "burst": 1, "period": period} for period in (997, 991, 983, 977)]},
+])
+def test_service_rejects_invalid_or_unbounded_requests(payload):
+    with pytest.raises(ValueError):
+        pg.service_request(payload)
+    status, body = pg.simulate_request(payload)
+    assert status == 400 and "error" in json.loads(body)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", __file__]))